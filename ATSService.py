@@ -1,8 +1,12 @@
 import io
 import json
-import fitz  # PyMuPDF
-import google.generativeai as genai
+from pdf_extract import extract_pdf
 import streamlit as st
+from singleflight import llm_calls, prompt_key
+from llm_metrics import track_llm_call
+from resources import get_gemini_model
+
+GEMINI_MODEL = "gemini-2.5-flash"
 
 def sanitize_text(text):
     """Clean text and replace common problematic symbols."""
@@ -23,19 +27,13 @@ def sanitize_text(text):
     return clean_text
 
 def extract_text_from_pdf(file):
-    """Extract text from all pages of a PDF using PyMuPDF."""
-    text = ""
+    """Extract text from a PDF file object (page and size limited, see pdf_extract)."""
     try:
         file.seek(0)
-        doc = fitz.open(stream=file.read(), filetype="pdf")
-        for page in doc:
-            page_text = page.get_text("text")
-            if page_text:
-                text += page_text + "\n"
-        doc.close()
+        result = extract_pdf(file.read())
     except Exception:
         return None
-    return sanitize_text(text)
+    return sanitize_text(result['text'])
 
 def evaluate_candidate(resume_file, job_description, job_skills):
     """
@@ -76,14 +74,45 @@ You are an experienced Technical HR Manager. Evaluate the provided resume agains
 {resume_text}
 """
 
+    result, error = _generate_evaluation(prompt, GEMINI_API_KEYS)
+    if error:
+        st.error(error)
+        return None
+    return dict(result)
+
+def _generate_evaluation(prompt, api_keys):
+    """
+    Send the evaluation prompt to Gemini, rotating keys on rate limits.
+    Identical prompts already in flight (double clicks, two recruiters reviewing
+    the same candidate) share a single request.
+    Returns (result, error_message); exactly one of them is None.
+    """
+    key = prompt_key(prompt, model=GEMINI_MODEL)
+    with track_llm_call("evaluate_candidate", GEMINI_MODEL) as metrics:
+        outcome, shared = llm_calls.do(key, lambda: _call_gemini(prompt, api_keys, metrics))
+        metrics.cache_hit = shared
+        if outcome[1]:
+            metrics.success = False
+            metrics.error = outcome[1]
+    return outcome
+
+def _call_gemini(prompt, api_keys, metrics):
     last_exception = None
-    for api_key in GEMINI_API_KEYS:
+    attempts = 0
+    for api_key in api_keys:
         if not api_key:
             continue
-        genai.configure(api_key=api_key)
+        if attempts:
+            # previous key was rate limited, falling back to the next one
+            metrics.retries += 1
+            metrics.fallbacks += 1
+        attempts += 1
         try:
-            model = genai.GenerativeModel("gemini-2.5-flash")
+            model = get_gemini_model(GEMINI_MODEL, api_key)
             response = model.generate_content([prompt])
+            usage = getattr(response, "usage_metadata", None)
+            if usage:
+                metrics.add_usage(usage.prompt_token_count, usage.candidates_token_count)
             result_text = sanitize_text(response.text)
 
             # Remove possible code fences
@@ -96,26 +125,23 @@ You are an experienced Technical HR Manager. Evaluate the provided resume agains
             result = json.loads(result_text)
             if "score" in result and "explanation" in result:
                 result["explanation"] = sanitize_text(result["explanation"])
-                return result
+                return result, None
             else:
-                st.error("Gemini response missing required fields.")
-                return None
+                return None, "Gemini response missing required fields."
 
         except json.JSONDecodeError:
-            st.error("Could not parse Gemini response as JSON.")
-            return None
+            return None, "Could not parse Gemini response as JSON."
         except Exception as e:
             last_exception = e
             if "429" in str(e) or "rate limit" in str(e).lower():
                 # try next key
                 continue
             else:
-                st.error("Failed to connect with Gemini API.")
-                return None
+                return None, "Failed to connect with Gemini API."
 
     if last_exception:
         if "429" in str(last_exception) or "rate limit" in str(last_exception).lower():
-            st.error("Rate limit reached for all API keys.")
+            return None, "Rate limit reached for all API keys."
         else:
-            st.error(f"Failed to connect with Gemini API: {last_exception}")
-    return None
+            return None, f"Failed to connect with Gemini API: {last_exception}"
+    return None, "No Gemini API key configured."
@@ -0,0 +1,141 @@
+"""
+Static asset pipeline.
+
+Stylesheets live in styles/*.css and images in the project root. On first
+use each asset is copied (CSS minified) to static/build/<name>.<hash>.<ext>
+and served by Streamlit's static file serving (server.enableStaticServing),
+so a rerun only sends a short <link>/<img> tag instead of inlined CSS or a
+base64 image. The content hash in the file name busts browser caches when
+the source changes.
+
+Streamlit only serves .css from static/ as text/css since 1.56 (earlier
+versions send it as text/plain, which browsers refuse to apply); see
+requirements.txt. If static serving is off or static/ is not writable,
+assets are inlined (minified CSS / data URI), still built once per process.
+"""
+import base64
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+import streamlit as st
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STYLE_DIR = os.path.join(ROOT, "styles")
+BUILD_DIR = os.path.join(ROOT, "static", "build")
+STATIC_URL = "app/static/build"
+
+_built = {}     # source path -> (url or None, inline fallback)
+_lock = threading.Lock()
+
+
+_CSS_LITERAL_RE = re.compile(
+    r"/\*.*?\*/"                                                          # comment (dropped)
+    r"|\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'"                            # quoted string
+    r"|url\(\s*(?:\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'|[^)]*)\s*\)",    # url(...)
+    re.S | re.I,
+)
+_NESTING_AT_RULES = ("@media", "@supports", "@container", "@layer", "@document", "@keyframes", "@-webkit-keyframes")
+
+
+def _strip_space_before_colons(css):
+    """Drop ' ' before ':' inside declaration blocks; selectors keep it ('a :hover')."""
+    out = []
+    blocks = []           # per open '{': True if it holds declarations
+    prelude_start = 0
+    for i, ch in enumerate(css):
+        if ch == " " and css[i + 1:i + 2] == ":" and blocks and blocks[-1]:
+            continue
+        if ch == "{":
+            blocks.append(not css[prelude_start:i].lstrip().startswith(_NESTING_AT_RULES))
+        elif ch == "}" and blocks:
+            blocks.pop()
+        if ch in "{};":
+            prelude_start = i + 1
+        out.append(ch)
+    return "".join(out)
+
+
+def minify_css(css):
+    """Drop comments and redundant whitespace. Strings and url(...) are left untouched."""
+    literals = []
+
+    def stash(match):
+        if match.group().startswith("/*"):
+            return " "
+        literals.append(match.group())
+        return f"\0{len(literals) - 1}\0"
+
+    css = _CSS_LITERAL_RE.sub(stash, css)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = _strip_space_before_colons(css)
+    css = css.replace(";}", "}")
+    css = re.sub("\0(\\d+)\0", lambda m: literals[int(m.group(1))], css)
+    return css.strip()
+
+
+def _static_serving():
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def _build(source):
+    """Write the hashed (and, for CSS, minified) copy of source; return (url, inline)."""
+    is_css = source.endswith(".css")
+    with open(source, "rb") as f:
+        data = f.read()
+    if is_css:
+        data = minify_css(data.decode("utf-8")).encode("utf-8")
+        inline = data.decode("utf-8")
+    else:
+        mime = mimetypes.guess_type(source)[0] or "application/octet-stream"
+        inline = f"data:{mime};base64,{base64.b64encode(data).decode()}"
+
+    if not _static_serving():
+        return None, inline
+
+    name, ext = os.path.splitext(os.path.basename(source))
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    filename = f"{name}.{digest}{ext}"
+    target = os.path.join(BUILD_DIR, filename)
+    try:
+        if not os.path.exists(target):
+            os.makedirs(BUILD_DIR, exist_ok=True)
+            tmp = f"{target}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, target)
+    except OSError as e:
+        print(f"Could not write static asset {filename}, inlining it: {e}")
+        return None, inline
+    return f"{STATIC_URL}/{filename}", inline
+
+
+def _get(source):
+    with _lock:
+        if source not in _built:
+            _built[source] = _build(source)
+        return _built[source]
+
+
+def asset_url(path):
+    """URL for an image (relative to the project root), e.g. for <img src>. None if missing."""
+    source = os.path.join(ROOT, path)
+    if not os.path.exists(source):
+        return None
+    url, inline = _get(source)
+    return url or inline
+
+
+def use_stylesheet(*names):
+    """Apply styles/<name>.css to the current page, in order (later sheets win ties)."""
+    tags = []
+    for name in names:
+        url, inline = _get(os.path.join(STYLE_DIR, f"{name}.css"))
+        tags.append(f'<link rel="stylesheet" href="{url}">' if url else f"<style>{inline}</style>")
+    st.markdown("".join(tags), unsafe_allow_html=True)
@@ -0,0 +1,128 @@
+"""
+Async data access and concurrent page fan-out.
+
+Dashboard pages make several independent reads (badges, notifications,
+charts, recommendations). fan_out() runs them at the same time and returns
+when all have finished, so the page waits for the slowest read instead of
+the sum of all of them:
+
+    data = fan_out(
+        notifications=async_db.user_notifications(user_id, limit=10),
+        charts=async_db.application_charts(user_id),
+        jobs=partial(search_jobs, user_id),
+    )
+    data['charts'] ...
+
+Each value is either a coroutine from this module (served by Firestore's
+AsyncClient) or a zero-argument callable; callables, such as the existing
+synchronous database.py functions, run in a worker thread. All coroutines
+run on one background event loop per process, and the AsyncClient is
+created on that loop. run() is the synchronous wrapper for a single
+coroutine. The caller's context variables (the profiler's current run)
+are carried into the loop and the worker threads.
+"""
+import asyncio
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import database
+import profiler
+from database import firestore, notification_tuple, status_counts, counts_per_day, summary_from_doc
+from resources import data_backend
+
+FAN_OUT_THREADS = int(os.getenv("FAN_OUT_THREADS", 16))
+
+_loop = None
+_loop_lock = threading.Lock()
+_client = None
+
+
+# ===== EVENT LOOP =====
+def _get_loop():
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            loop.set_default_executor(ThreadPoolExecutor(FAN_OUT_THREADS, thread_name_prefix="fan-out"))
+            threading.Thread(target=loop.run_forever, name="async-db", daemon=True).start()
+            _loop = loop
+        return _loop
+
+
+def run(coro, timeout=None):
+    """Run a coroutine on the shared loop from synchronous code and return its result."""
+    context = contextvars.copy_context()
+
+    async def _in_caller_context():
+        return await asyncio.create_task(coro, context=context)
+
+    return asyncio.run_coroutine_threadsafe(_in_caller_context(), _get_loop()).result(timeout)
+
+
+def _get_client():
+    """The AsyncClient (only called on the loop thread; the Firebase app is initialised by database.py)."""
+    global _client
+    if _client is None:
+        if data_backend() == "memory":
+            import memory_firestore
+            _client = memory_firestore.async_client()
+        else:
+            from firebase_admin import firestore_async
+            _client = firestore_async.client()
+    return _client
+
+
+# ===== FAN-OUT =====
+async def gather(**calls):
+    """Await every call concurrently; returns {name: result}. The first error is raised after all finish."""
+    loop = asyncio.get_running_loop()
+    names = list(calls)
+    tasks = [profiler.profile_coroutine(f"async_db.{call.__name__}", call) if asyncio.iscoroutine(call)
+             else loop.run_in_executor(None, contextvars.copy_context().run, call)
+             for call in calls.values()]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return dict(zip(names, results))
+
+
+def fan_out(timeout=None, **calls):
+    """Synchronous wrapper around gather() for page scripts."""
+    return run(gather(**calls), timeout)
+
+
+# ===== QUERIES (AsyncClient) =====
+async def dashboard_summary(employee_id):
+    doc = await _get_client().collection('dashboard_summary').document(employee_id).get()
+    data = doc.to_dict() if doc.exists else None
+    if not data or 'built_at' not in data:
+        data = await asyncio.get_running_loop().run_in_executor(None, database.rebuild_dashboard_summary, employee_id)
+    return summary_from_doc(data)
+
+
+async def user_notifications(employee_id, limit=10):
+    query = _get_client().collection('notifications') \
+                         .where('employee_id', '==', employee_id) \
+                         .order_by('created_at', direction=firestore.Query.DESCENDING) \
+                         .limit(limit)
+    return [notification_tuple(doc.id, doc.to_dict()) async for doc in query.stream()]
+
+
+async def _employee_applications(employee_id):
+    query = _get_client().collection('applications').where('employee_id', '==', employee_id)
+    return [doc.to_dict() async for doc in query.stream()]
+
+
+async def application_charts(employee_id):
+    """(status_counts, counts_per_day) from one read of the employee's applications."""
+    app_datas = await _employee_applications(employee_id)
+    return status_counts(app_datas), counts_per_day(app_datas)
+
+
+async def interview_count(employee_id):
+    query = _get_client().collection('interviews') \
+                         .where('employee_id', '==', employee_id) \
+                         .where('status', '==', 'scheduled')
+    return len([doc async for doc in query.stream()])
@@ -0,0 +1,499 @@
+"""
+Scale benchmark for every public function in database.py.
+
+For each dataset size, a fresh process generates the synthetic dataset
+(synthetic_data.py, same seed every time) and calls every public
+database.py function against it. For each call it records wall time with
+cold caches (query_cache and doc_cache cleared; reads get one untimed
+warm-up call first), warm time for reads, and
+the documents read and round trips counted by profiler.py. Entity reads
+run twice: against a typical (median) and the heaviest employee, company
+or job, because the heavy tail is where list pages fall over. Writes and
+deletes run last on IDs from the manifest's random pools.
+
+    python benchmarks/db_benchmark.py --sizes tiny,small --repeat 5 --output bench.json
+    python benchmarks/db_benchmark.py --snapshot data/full.pkl --repeat 3
+    python benchmarks/db_benchmark.py --sizes tiny --baseline bench.json   # exit 1 on regression
+
+The default backend is memory_firestore (DATA_BACKEND=memory), so times
+measure our own query and join code, and docs read / round trips are what
+Firestore would bill. --backend emulator uses the Firestore emulator
+(FIRESTORE_EMULATOR_HOST must be set; it is cleared before each size) to
+include RPC and serialisation cost. The "full" preset (1M applications)
+needs about 4 GB of memory on the memory backend.
+
+--baseline compares with an earlier JSON result: any increase in docs
+read, or a p50 slowdown beyond --max-slowdown (and above --noise-ms), is
+reported as a regression and the script exits with status 1.
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing as mp
+import os
+import resource
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import synthetic_data  # noqa: E402
+
+ENTITY_VARIANTS = ('typical', 'heavy')
+PASSWORD_HASH = synthetic_data.PASSWORD_HASH
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    idx = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[idx]
+
+
+def _peak_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / 1024 / (1024 if sys.platform == "darwin" else 1), 1)  # bytes on macOS, KB on Linux
+
+
+# ===== SAMPLES =====
+class Samples:
+    """Arguments for the workloads, taken from the dataset manifest."""
+
+    def __init__(self, db, manifest):
+        self.db = db
+        self.samples = manifest['samples']
+        self.pools = manifest['pools']
+        self._taken = {kind: list(ids) for kind, ids in self.pools.items()}
+        self._with_profile = None
+
+    def employee(self, variant):
+        return self.samples['employee'][variant]
+
+    def partner(self, variant):
+        """The company the sample employee has the longest conversation with."""
+        return self.samples['partner_company'][variant]
+
+    def company(self, variant):
+        return self.samples['company'][variant]
+
+    def job(self, variant):
+        return self.samples['job'][variant]
+
+    def pool(self, kind, i):
+        ids = self.pools[kind]
+        return ids[i % len(ids)]
+
+    def employee_with_profile(self, i):
+        """The i-th pool employee who has saved a profile (update_profile expects one)."""
+        if self._with_profile is None:
+            self._with_profile = [e for e in self.pools['employees'] if self.doc('employee_profiles', e)]
+        return self._with_profile[i % len(self._with_profile)]
+
+    def take(self, kind):
+        """An ID no earlier workload has used (for deletes); taken from the end of the pool."""
+        return self._taken[kind].pop()
+
+    def doc(self, collection, doc_id):
+        snap = self.db.collection(collection).document(doc_id).get()
+        return snap.to_dict() if snap.exists else {}
+
+
+# ===== WORKLOADS =====
+# name -> (scope, builder(samples, variant, i) -> (args, kwargs)).
+# 'employee'/'company'/'job' reads run for the typical and the heavy entity;
+# 'global' reads, writes, maintenance jobs and deletes run once per repeat.
+def _application_args(s, app_id):
+    app = s.doc('applications', app_id)
+    return (app_id, app.get('employee_id'), app.get('company_id'), app.get('job_id'),
+            datetime.now(timezone.utc) + timedelta(days=7), "Video Call", "https://meet.example.com/bench")
+
+
+def _new_job_args(s, i):
+    company_id = s.pool('companies', i)
+    return (company_id, s.doc('companies', company_id).get('name', ''), f"Benchmark Engineer {i}", "Technology",
+            "Benchmark job.", "Python", "Kathmandu", "Full-time", "$30k - $50k", "Mid", "Python, SQL",
+            (datetime.now(timezone.utc) + timedelta(days=30)).date())
+
+
+WORKLOADS = {
+    # Employee pages
+    'get_user': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_user_by_id': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_user_by_id_admin': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_or_create_profile': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_profile': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'is_receiving_alerts': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'search_jobs': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_applied_job_ids': ('employee', lambda s, v, i: ((s.employee(v), s.pools['jobs']), {})),
+    'get_user_applications': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_upcoming_interviews': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_saved_jobs': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_user_notifications': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_user_requests': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_messages': ('employee', lambda s, v, i: ((s.employee(v), s.partner(v)), {})),
+    'get_messages_between_company_and_employee': ('employee', lambda s, v, i: ((s.partner(v), s.employee(v)), {})),
+    'get_conversations': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_unread_messages_count_employee': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_application_stats': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_applications_over_time': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_interview_count': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_dashboard_summary': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'rebuild_dashboard_summary': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    'get_recent_activities': ('employee', lambda s, v, i: ((s.employee(v),), {})),
+    # Employer pages
+    'get_company_by_id': ('company', lambda s, v, i: ((s.company(v),), {})),
+    'get_company_by_email': ('company', lambda s, v, i: ((s.doc('companies', s.company(v)).get('email'),), {})),
+    'get_cached_doc': ('company', lambda s, v, i: (('companies', s.company(v)), {})),
+    'get_company_jobs': ('company', lambda s, v, i: ((s.company(v), s.employee('typical')), {})),
+    'get_company_jobs_all': ('company', lambda s, v, i: ((s.company(v),), {})),
+    'get_applications_for_company': ('company', lambda s, v, i: ((s.company(v),), {})),
+    'get_company_conversations': ('company', lambda s, v, i: ((s.company(v),), {})),
+    'get_job_count_for_company': ('company', lambda s, v, i: ((s.company(v),), {})),
+    'get_application_count_for_company': ('company', lambda s, v, i: ((s.company(v),), {})),
+    'get_interview_count_for_company': ('company', lambda s, v, i: ((s.company(v),), {})),
+    'get_new_applications_count': ('company', lambda s, v, i: ((s.company(v),), {})),
+    'get_unread_messages_count': ('company', lambda s, v, i: ((s.company(v),), {})),
+    'get_job_by_id': ('job', lambda s, v, i: ((s.job(v),), {})),
+    # Lists, admin pages and bulk helpers
+    'get_all_companies': ('global', lambda s, v, i: ((), {})),
+    'get_open_requests': ('global', lambda s, v, i: ((), {})),
+    'get_all_open_job_requests': ('global', lambda s, v, i: ((), {})),
+    'get_open_request_count': ('global', lambda s, v, i: ((), {})),
+    'get_request_by_id': ('global', lambda s, v, i: ((s.pool('job_requests', i),), {})),
+    'get_all_users': ('global', lambda s, v, i: ((), {})),
+    'get_users_by_role': ('global', lambda s, v, i: (('employee',), {})),
+    'get_all_companies_admin': ('global', lambda s, v, i: ((), {})),
+    'get_all_jobs_admin': ('global', lambda s, v, i: ((), {})),
+    'get_all_job_requests_admin': ('global', lambda s, v, i: ((), {})),
+    'get_recent_activities_admin': ('global', lambda s, v, i: ((), {})),
+    'get_system_stats': ('global', lambda s, v, i: ((), {})),
+    'get_profiles': ('global', lambda s, v, i: ((s.pools['employees'],), {})),
+    'get_docs_by_id': ('global', lambda s, v, i: (('jobs', s.pools['jobs']), {})),
+    'get_cached_docs': ('global', lambda s, v, i: (('companies', s.pools['companies']), {})),
+    'query_in': ('global', lambda s, v, i: (('applications', 'job_id', s.pools['jobs'][:60]), {})),
+    # Writes
+    'add_user': ('write', lambda s, v, i: ((f"Bench User {i}", f"bench.user.{i}@example.com",
+                                            PASSWORD_HASH, "employee"), {})),
+    'add_user_admin': ('write', lambda s, v, i: ((f"Bench Admin {i}", f"bench.admin.{i}@example.com",
+                                                  PASSWORD_HASH, "employee"), {})),
+    'update_user_name': ('write', lambda s, v, i: ((s.pool('employees', i), f"Renamed {i}"), {})),
+    'update_user_role': ('write', lambda s, v, i: ((s.pool('employees', i), "employee"), {})),
+    'update_is_admin': ('write', lambda s, v, i: ((f"bench.admin.{i}@example.com", True), {})),
+    'update_user_password': ('write', lambda s, v, i: ((s.pool('employees', i), PASSWORD_HASH), {})),
+    'update_profile': ('write', lambda s, v, i: ((s.employee_with_profile(i),), {'bio': f"Updated bio {i}"})),
+    'add_application': ('write', lambda s, v, i: ((s.pool('jobs', i), f"bench.user.{i}@example.com",
+                                                   s.doc('jobs', s.pool('jobs', i)).get('company_id'),
+                                                   70, "Benchmark cover letter"), {})),
+    'save_job': ('write', lambda s, v, i: ((s.pool('employees', i), s.pool('jobs', i)), {})),
+    'unsave_job': ('write', lambda s, v, i: ((s.pool('employees', i), s.pool('jobs', i)), {})),
+    'add_notification': ('write', lambda s, v, i: ((s.pool('employees', i), "application", "Benchmark",
+                                                    "Benchmark notification", s.pool('jobs', i)), {})),
+    'mark_notifications_read': ('write', lambda s, v, i: ((s.pool('employees', i),), {})),
+    'add_job_request': ('write', lambda s, v, i: ((s.pool('employees', i), f"Benchmark request {i}", "Details",
+                                                   "Technology", "Kathmandu", "$500"), {})),
+    'update_job_request': ('write', lambda s, v, i: ((s.pool('job_requests', i), f"Benchmark request {i}",
+                                                      "Details", "Technology", "Kathmandu", "$800", "open"), {})),
+    'express_interest_in_request': ('write', lambda s, v, i: ((s.pool('job_requests', i), s.pool('companies', i),
+                                                               "We can help"), {})),
+    'send_message': ('write', lambda s, v, i: ((s.pool('employees', i), 'employee', s.pool('companies', i),
+                                                'company', "Benchmark message"), {})),
+    'send_message_from_company': ('write', lambda s, v, i: ((s.pool('companies', i), s.pool('employees', i),
+                                                             "Benchmark message"), {})),
+    'mark_messages_read': ('write', lambda s, v, i: ((s.employee('heavy'), s.partner('heavy')), {})),
+    'mark_company_messages_read': ('write', lambda s, v, i: ((s.partner('heavy'), s.employee('heavy')), {})),
+    'create_company_for_employer': ('write', lambda s, v, i: ((f"bench.user.{i}@example.com", f"Bench Co {i}",
+                                                               f"bench.user.{i}@example.com"), {})),
+    'update_company_profile': ('write', lambda s, v, i: ((s.pool('companies', i),), {'description': f"Updated {i}"})),
+    'update_company_admin': ('write', lambda s, v, i: ((s.pool('companies', i),), {'industry': "Banking"})),
+    'update_company_password': ('write', lambda s, v, i: ((s.pool('companies', i), PASSWORD_HASH), {})),
+    'add_job': ('write', lambda s, v, i: (_new_job_args(s, i), {})),
+    'update_job_admin': ('write', lambda s, v, i: ((s.pool('jobs', i),), {'salary_range': "$40k - $60k"})),
+    'update_application_status': ('write', lambda s, v, i: ((s.pool('applications', i), "reviewed"), {})),
+    'create_interview': ('write', lambda s, v, i: (_application_args(s, s.pool('applications', i)), {})),
+    'upsert_interview': ('write', lambda s, v, i: (_application_args(s, s.pool('applications', i)), {})),
+    # Maintenance jobs: the first run does the work, later runs find nothing to do
+    'mark_expired_interviews': ('maintenance', lambda s, v, i: ((), {})),
+    'update_expired_jobs': ('maintenance', lambda s, v, i: ((), {})),
+    # Cascading deletes, on IDs nothing else used
+    'delete_job_request': ('delete', lambda s, v, i: ((s.take('job_requests'),), {})),
+    'delete_job_request_admin': ('delete', lambda s, v, i: ((s.take('job_requests'),), {})),
+    'delete_application_admin': ('delete', lambda s, v, i: ((s.take('applications'),), {})),
+    'delete_job': ('delete', lambda s, v, i: ((s.take('jobs'),), {})),
+    'delete_user': ('delete', lambda s, v, i: ((s.take('employees'),), {})),
+    'delete_company': ('delete', lambda s, v, i: ((s.take('companies'),), {})),
+}
+# No I/O: formatting and aggregation helpers
+PURE_HELPERS = {'doc_to_dict', 'application_doc_id', 'notification_tuple', 'status_counts',
+                'counts_per_day', 'summary_from_doc', 'get_profile_strength'}
+SCOPE_ORDER = ('employee', 'company', 'job', 'global', 'write', 'maintenance', 'delete')
+
+
+def public_functions(database):
+    """Every public function defined in database.py (what profiler.instrument wraps)."""
+    return sorted(name for name, value in vars(database).items()
+                  if not name.startswith('_') and callable(value) and not isinstance(value, type)
+                  and getattr(value, '__module__', None) == database.__name__)
+
+
+# ===== ONE SIZE (runs in a child process) =====
+def _clear_caches():
+    import doc_cache
+    import query_cache
+    query_cache.clear()
+    for collection in doc_cache.DEFAULT_TTLS:
+        doc_cache.invalidate(collection)
+
+
+def _timed_call(run, func, args, kwargs):
+    """Return (ms, profiler record or None, result, error)."""
+    recorded = len(run.calls)
+    result, error = None, None
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):  # maintenance jobs print one line per document
+            result = func(*args, **kwargs)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    ms = (time.perf_counter() - start) * 1000
+    return ms, run.calls[-1] if len(run.calls) > recorded else None, result, error
+
+
+def run_function(database, run, samples, name, scope, builder, repeat):
+    func = getattr(database, name)
+    variants = ENTITY_VARIANTS if scope in ('employee', 'company', 'job') else (scope,)
+    calls = 1 if scope == 'maintenance' else repeat
+    reads = scope not in ('write', 'maintenance', 'delete')
+    out = {}
+    for variant in variants:
+        cold, warm, docs, trips, rows, error = [], [], [], [], None, None
+        for i in range(calls):
+            try:
+                args, kwargs = builder(samples, variant, i)
+            except Exception as e:
+                error = f"no arguments: {type(e).__name__}: {e}"
+                break
+            if reads and i == 0:
+                _timed_call(run, func, args, kwargs)  # untimed warm-up (lazy backend indexes, imports)
+            _clear_caches()
+            ms, record, result, error = _timed_call(run, func, args, kwargs)
+            if error:
+                break
+            cold.append(ms)
+            docs.append(record['docs_read'] if record else 0)
+            trips.append(record['round_trips'] if record else 0)
+            if isinstance(result, list):
+                rows = len(result)
+            if reads:
+                warm.append(_timed_call(run, func, args, kwargs)[0])
+        out[variant] = {
+            'scope': scope,
+            'calls': len(cold),
+            'mean_ms': round(sum(cold) / len(cold), 3) if cold else None,
+            'p50_ms': round(_percentile(cold, 50), 3) if cold else None,
+            'p95_ms': round(_percentile(cold, 95), 3) if cold else None,
+            'warm_p50_ms': round(_percentile(warm, 50), 3) if warm else None,
+            'docs_read': max(docs) if docs else None,
+            'round_trips': max(trips) if trips else None,
+            'rows': rows,
+            'error': error,
+        }
+    return out
+
+
+def run_size(size, scale, seed, repeat, backend, snapshot):
+    start = time.perf_counter()
+    if backend == "memory":
+        if snapshot:
+            os.environ["MEMORY_DB_PATH"] = snapshot
+        db = synthetic_data.memory_db()
+    else:
+        db = synthetic_data.emulator_db()
+    import database
+    import profiler
+
+    if snapshot:
+        with open(snapshot + ".json") as f:
+            manifest = json.load(f)
+    else:
+        if backend == "emulator":
+            synthetic_data.clear_emulator(db)
+        manifest = synthetic_data.generate(db, *scale, seed=seed, log=lambda line: None)
+    setup_s = time.perf_counter() - start
+
+    samples = Samples(db, manifest)
+    run = profiler.begin_run("db_benchmark", force=True)
+    names = public_functions(database)
+    functions, skipped = {}, {}
+    for scope in SCOPE_ORDER:
+        for name, (fn_scope, builder) in WORKLOADS.items():
+            if fn_scope == scope and name in names:
+                functions[name] = run_function(database, run, samples, name, scope, builder, repeat)
+    for name in names:
+        if name in PURE_HELPERS:
+            skipped[name] = "pure helper (no I/O)"
+        elif name not in WORKLOADS:
+            skipped[name] = "no workload defined"
+    return {
+        'size': size,
+        'backend': backend,
+        'seed': manifest.get('seed', seed),
+        'counts': manifest['counts'],
+        'samples': manifest['samples'],
+        'setup_s': round(setup_s, 1),
+        'peak_rss_mb': _peak_rss_mb(),
+        'functions': functions,
+        'skipped': skipped,
+    }
+
+
+def _child(conn, *args):
+    try:
+        conn.send(run_size(*args))
+    except Exception as e:
+        conn.send({'size': args[0], 'error': f"{type(e).__name__}: {e}"})
+    finally:
+        conn.close()
+
+
+def run_isolated(size, scale, seed, repeat, backend, snapshot, timeout):
+    """Run one dataset size in a fresh process so data, caches and peak RSS are not shared."""
+    ctx = mp.get_context("spawn")
+    parent, child = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_child, args=(child, size, scale, seed, repeat, backend, snapshot))
+    proc.start()
+    child.close()
+    result = None
+    if parent.poll(timeout):
+        try:
+            result = parent.recv()
+        except EOFError:
+            pass
+    proc.join(5)
+    if proc.is_alive():
+        proc.terminate()
+    return result or {'size': size, 'error': f"crashed or timed out (exit code {proc.exitcode})"}
+
+
+# ===== REPORT =====
+def _fmt(value):
+    return "-" if value is None else value
+
+
+def print_report(results):
+    for r in results:
+        if 'error' in r:
+            print(f"{r['size']}: ERROR: {r['error']}\n")
+            continue
+        counts = r['counts']
+        print(f"== {r['size']} ({r['backend']}): {counts.get('companies', 0)} companies, {counts.get('jobs', 0)} jobs, "
+              f"{counts.get('applications', 0)} applications, {counts.get('messages', 0)} messages; "
+              f"setup {r['setup_s']}s, peak RSS {r['peak_rss_mb']} MB")
+        header = f"{'function':<44}{'variant':<13}{'p50 ms':>10}{'p95 ms':>10}{'warm ms':>10}{'docs':>9}{'trips':>7}{'rows':>8}"
+        print(header)
+        print("-" * len(header))
+        for name, variants in r['functions'].items():
+            for variant, x in variants.items():
+                if x['error']:
+                    print(f"{name:<44}{variant:<13}  ERROR: {x['error']}")
+                    continue
+                print(f"{name:<44}{variant:<13}{_fmt(x['p50_ms']):>10}{_fmt(x['p95_ms']):>10}"
+                      f"{_fmt(x['warm_p50_ms']):>10}{_fmt(x['docs_read']):>9}{_fmt(x['round_trips']):>7}"
+                      f"{_fmt(x['rows']):>8}")
+        missing = [name for name, reason in r['skipped'].items() if reason == "no workload defined"]
+        if missing:
+            print(f"no workload defined for: {', '.join(missing)}")
+        print()
+    print("Times are cold-cache ms; docs = documents read (max over calls); trips = Firestore round trips.")
+
+
+def compare(results, baseline, max_slowdown, noise_ms):
+    """Return regression messages for sizes present in both result sets."""
+    previous = {r['size']: r for r in baseline.get('results', []) if 'error' not in r}
+    regressions = []
+    for r in results:
+        old = previous.get(r['size'])
+        if 'error' in r or old is None:
+            continue
+        for name, variants in r['functions'].items():
+            for variant, x in variants.items():
+                before = old['functions'].get(name, {}).get(variant)
+                if not before or before['error']:
+                    continue
+                label = f"{r['size']} {name} [{variant}]"
+                if x['error']:
+                    regressions.append(f"{label}: now fails: {x['error']}")
+                    continue
+                if (x['docs_read'] or 0) > (before['docs_read'] or 0):
+                    regressions.append(f"{label}: docs read {before['docs_read']} -> {x['docs_read']}")
+                if (x['p50_ms'] is not None and before['p50_ms'] is not None
+                        and x['p50_ms'] > before['p50_ms'] * max_slowdown
+                        and x['p50_ms'] - before['p50_ms'] > noise_ms):
+                    regressions.append(f"{label}: p50 {before['p50_ms']} ms -> {x['p50_ms']} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every public database.py function on synthetic datasets")
+    parser.add_argument("--sizes", default="tiny,small",
+                        help=f"comma separated presets: {', '.join(synthetic_data.SIZES)}")
+    parser.add_argument("--snapshot", default=None,
+                        help="benchmark a snapshot from synthetic_data.py --save instead of generating")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3, help="calls per function and variant")
+    parser.add_argument("--backend", default="memory", choices=["memory", "emulator"])
+    parser.add_argument("--timeout", type=float, default=3600, help="seconds per dataset size")
+    parser.add_argument("--output", default=None, help="write results as JSON to this file")
+    parser.add_argument("--baseline", default=None, help="earlier --output file to compare against")
+    parser.add_argument("--max-slowdown", type=float, default=1.5, help="p50 ratio reported as a regression")
+    parser.add_argument("--noise-ms", type=float, default=5.0, help="ignore p50 increases smaller than this")
+    args = parser.parse_args()
+
+    if args.snapshot and args.backend != "memory":
+        parser.error("--snapshot only applies to the memory backend")
+    if args.backend == "memory":
+        os.environ["DATA_BACKEND"] = "memory"  # inherited by the child processes
+    elif not os.getenv("FIRESTORE_EMULATOR_HOST"):
+        parser.error("--backend emulator needs FIRESTORE_EMULATOR_HOST")
+    if args.snapshot:
+        with open(args.snapshot + ".json") as f:
+            sizes = [json.load(f).get('size', os.path.basename(args.snapshot))]
+    else:
+        sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+        unknown = [s for s in sizes if s not in synthetic_data.SIZES]
+        if unknown:
+            parser.error(f"unknown sizes: {', '.join(unknown)}")
+
+    results = []
+    for size in sizes:
+        print(f"running {size} ...", flush=True)
+        results.append(run_isolated(size, synthetic_data.SIZES.get(size), args.seed, args.repeat,
+                                    args.backend, args.snapshot and os.path.abspath(args.snapshot), args.timeout))
+    print()
+    print_report(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({'args': vars(args), 'results': results}, f, indent=2, default=str)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('args', {}).get('repeat') != args.repeat:
+            print(f"\nnote: the baseline used --repeat {baseline.get('args', {}).get('repeat')}; "
+                  f"write and delete workloads touched different documents")
+        regressions = compare(results, baseline, args.max_slowdown, args.noise_ms)
+        if regressions:
+            print(f"\n{len(regressions)} regressions against {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nno regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
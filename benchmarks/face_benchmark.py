@@ -0,0 +1,260 @@
+"""
+Offline accuracy/latency benchmark for the face login pipeline.
+
+Runs a local image set through every model/detector combination and
+reports per-stage latency (decode, detect, embed, compare), peak RSS and
+FAR/FRR at candidate similarity thresholds. Use the results to choose
+FACE_MODEL, FACE_DETECTOR and FACE_SIMILARITY_THRESHOLD.
+
+The image set is one folder per person (at least two photos each for
+genuine pairs):
+
+    faces/
+        alice/1.jpg  alice/2.jpg ...
+        bob/1.jpg    bob/2.jpg ...
+
+    python benchmarks/face_benchmark.py faces/ --models Facenet512,ArcFace --detectors cascade,retinaface
+
+The detector "cascade" is the app's own face_detection.face_candidates (Haar
+pass, then RetinaFace on the face region or the whole frame); RetinaFace
+time is counted under "embed", as it is in the app. Every combination runs in its
+own process, so peak RSS is measured per configuration. Requires deepface and OpenCV.
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import resource
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_MODELS = "Facenet512,Facenet,ArcFace,SFace,VGG-Face"
+DEFAULT_DETECTORS = "cascade,opencv,ssd,mtcnn,retinaface"
+DEFAULT_THRESHOLDS = "0.3,0.35,0.4,0.45,0.5,0.55,0.6,0.65,0.7"
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+
+
+def load_image_set(root):
+    """Return [(person, path)] for every image under root/<person>/."""
+    items = []
+    for person in sorted(os.listdir(root)):
+        folder = os.path.join(root, person)
+        if not os.path.isdir(folder):
+            continue
+        for name in sorted(os.listdir(folder)):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                items.append((person, os.path.join(folder, name)))
+    return items
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    idx = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[idx]
+
+
+def _stage_stats(values_ms):
+    return {
+        'mean_ms': round(sum(values_ms) / len(values_ms), 4) if values_ms else 0.0,
+        'p50_ms': round(_percentile(values_ms, 50), 4),
+        'p95_ms': round(_percentile(values_ms, 95), 4),
+    }
+
+
+def _peak_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / 1024 / (1024 if sys.platform == "darwin" else 1), 1)  # bytes on macOS, KB on Linux
+
+
+# ===== ONE CONFIGURATION (runs in a child process) =====
+def _detect(DeepFace, frame, bytes_data, detector):
+    """Return (images, detector_backend) to embed, tried in order, mirroring what the app sends to face_service."""
+    if detector == "cascade":
+        from face_detection import face_candidates, ALIGN_DETECTOR
+        return face_candidates(bytes_data), ALIGN_DETECTOR
+    import numpy as np
+    faces = DeepFace.extract_faces(img_path=frame, detector_backend=detector, enforce_detection=True, align=True)
+    face = max(faces, key=lambda f: f['facial_area']['w'] * f['facial_area']['h'])['face']
+    if face.dtype != np.uint8:
+        face = (face * 255).clip(0, 255).astype(np.uint8)
+    return [face[:, :, ::-1].copy()], "skip"  # extract_faces returns RGB; represent expects BGR
+
+
+def run_configuration(model_name, detector, items, thresholds):
+    import numpy as np
+    from deepface import DeepFace
+    from face_detection import decode_image
+
+    t0 = time.perf_counter()
+    DeepFace.build_model(model_name)
+    load_s = time.perf_counter() - t0
+
+    timings = {'decode': [], 'detect': [], 'embed': [], 'compare': []}
+    embeddings, people, failures = [], [], []
+    for i, (person, path) in enumerate(items):
+        with open(path, "rb") as f:
+            bytes_data = f.read()
+        try:
+            t = time.perf_counter()
+            frame = decode_image(bytes_data)
+            if frame is None:
+                raise ValueError("Could not decode image")
+            timings['decode'].append((time.perf_counter() - t) * 1000)
+
+            t = time.perf_counter()
+            images, backend = _detect(DeepFace, frame, bytes_data, detector)
+            timings['detect'].append((time.perf_counter() - t) * 1000)
+
+            t = time.perf_counter()
+            for j, image in enumerate(images):
+                try:
+                    objs = DeepFace.represent(img_path=image, model_name=model_name,
+                                              detector_backend=backend, enforce_detection=True)
+                    break
+                except ValueError:
+                    if j == len(images) - 1:
+                        raise
+            elapsed = (time.perf_counter() - t) * 1000
+            if i > 0:  # first call includes graph tracing / lazy detector weights
+                timings['embed'].append(elapsed)
+            embeddings.append(np.asarray(objs[0]['embedding'], dtype=np.float32))
+            people.append(person)
+        except Exception as e:
+            failures.append({'image': path, 'error': str(e)[:200]})
+
+    # Compare stage: the same single dot product verify_face uses
+    genuine, impostor = [], []
+    if embeddings:
+        matrix = np.stack(embeddings)
+        norms = np.linalg.norm(matrix, axis=1)
+        for a in range(len(embeddings)):
+            for b in range(a + 1, len(embeddings)):
+                t = time.perf_counter()
+                score = float(np.dot(matrix[a], matrix[b]) / (norms[a] * norms[b]))
+                timings['compare'].append((time.perf_counter() - t) * 1000)
+                (genuine if people[a] == people[b] else impostor).append(score)
+
+    rates = []
+    for th in thresholds:
+        far = sum(s >= th for s in impostor) / len(impostor) if impostor else None
+        frr = sum(s < th for s in genuine) / len(genuine) if genuine else None
+        rates.append({'threshold': th, 'far': far, 'frr': frr})
+
+    return {
+        'model': model_name,
+        'detector': detector,
+        'images': len(items),
+        'failed_to_enroll': len(failures),
+        'failures': failures[:10],
+        'model_load_s': round(load_s, 2),
+        'stages': {stage: _stage_stats(values) for stage, values in timings.items()},
+        'genuine_pairs': len(genuine),
+        'impostor_pairs': len(impostor),
+        'rates': rates,
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def _child(conn, model_name, detector, items, thresholds):
+    try:
+        conn.send(run_configuration(model_name, detector, items, thresholds))
+    except Exception as e:
+        conn.send({'model': model_name, 'detector': detector, 'error': str(e)})
+    finally:
+        conn.close()
+
+
+def run_isolated(model_name, detector, items, thresholds, timeout):
+    """Run one configuration in a fresh process so peak RSS and warm-up are not shared."""
+    ctx = mp.get_context("spawn")
+    parent, child = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_child, args=(child, model_name, detector, items, thresholds))
+    proc.start()
+    child.close()
+    result = None
+    if parent.poll(timeout):
+        try:
+            result = parent.recv()
+        except EOFError:
+            pass
+    proc.join(5)
+    if proc.is_alive():
+        proc.terminate()
+    return result or {'model': model_name, 'detector': detector, 'error': f"crashed or timed out (exit code {proc.exitcode})"}
+
+
+# ===== REPORT =====
+def _fmt_rate(value):
+    return "   -  " if value is None else f"{value * 100:5.1f}%"
+
+
+def print_report(results):
+    header = (f"{'model':<12}{'detector':<12}{'fte':>5}{'decode':>9}{'detect':>9}{'embed':>9}"
+              f"{'compare':>10}{'rss MB':>9}  best threshold (FAR / FRR)")
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        if 'error' in r:
+            print(f"{r['model']:<12}{r['detector']:<12}  ERROR: {r['error']}")
+            continue
+        s = r['stages']
+        usable = [x for x in r['rates'] if x['far'] is not None and x['frr'] is not None]
+        best = min(usable, key=lambda x: x['far'] + x['frr']) if usable else None
+        best_txt = f"{best['threshold']:.2f} ({_fmt_rate(best['far'])} / {_fmt_rate(best['frr'])})" if best else "n/a"
+        print(f"{r['model']:<12}{r['detector']:<12}{r['failed_to_enroll']:>5}"
+              f"{s['decode']['p50_ms']:>9}{s['detect']['p50_ms']:>9}{s['embed']['p50_ms']:>9}"
+              f"{s['compare']['p50_ms']:>10}{r['peak_rss_mb']:>9}  {best_txt}")
+    print("\nStage columns are p50 ms; fte = images that failed to enroll.")
+
+    for r in results:
+        if 'error' in r:
+            continue
+        print(f"\n{r['model']} / {r['detector']}  "
+              f"({r['genuine_pairs']} genuine, {r['impostor_pairs']} impostor pairs)")
+        for x in r['rates']:
+            print(f"  threshold {x['threshold']:.2f}   FAR {_fmt_rate(x['far'])}   FRR {_fmt_rate(x['frr'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark face models/detectors on a local image set")
+    parser.add_argument("image_dir", help="folder with one sub-folder of photos per person")
+    parser.add_argument("--models", default=DEFAULT_MODELS, help="comma separated DeepFace model names")
+    parser.add_argument("--detectors", default=DEFAULT_DETECTORS,
+                        help="comma separated DeepFace detector backends; 'cascade' = the app's Haar + fallback")
+    parser.add_argument("--thresholds", default=DEFAULT_THRESHOLDS, help="comma separated cosine similarity thresholds")
+    parser.add_argument("--limit", type=int, default=0, help="use at most this many images (0 = all)")
+    parser.add_argument("--timeout", type=float, default=1800, help="seconds per configuration")
+    parser.add_argument("--output", default=None, help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    items = load_image_set(args.image_dir)
+    if args.limit:
+        items = items[:args.limit]
+    if not items:
+        parser.error(f"no images found under {args.image_dir}")
+    thresholds = [float(t) for t in args.thresholds.split(",") if t.strip()]
+    models = [m.strip() for m in args.models.split(",") if m.strip()]
+    detectors = [d.strip() for d in args.detectors.split(",") if d.strip()]
+
+    print(f"{len(items)} images, {len({p for p, _ in items})} people, "
+          f"{len(models) * len(detectors)} configurations\n")
+    results = []
+    for model_name in models:
+        for detector in detectors:
+            print(f"running {model_name} / {detector} ...", flush=True)
+            results.append(run_isolated(model_name, detector, items, thresholds, args.timeout))
+    print()
+    print_report(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({'args': vars(args), 'results': results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Throughput benchmark for the AI pipeline (ATS screening and résumé autofill).
+
+Runs the real evaluate_candidate / parse_resume_with_groq code paths against
+the local mock server, at a fixed concurrency, and reports p50/p95/p99
+latency and throughput. No real Gemini/Groq quota is used.
+
+    python benchmarks/llm_benchmark.py --requests 200 --concurrency 16 --latency-ms 600 --rate-limit-rate 0.05
+
+The harness runs from a temporary working directory holding its own
+.streamlit/secrets.toml that points both clients at the mock server, so the
+project's real secrets are never read or modified.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_llm_server import MockConfig, start_server  # noqa: E402
+
+RESUME_TEMPLATE = """Candidate {n}
+Backend developer, Kathmandu. Email candidate{n}@example.com
+Skills: Python, Django, FastAPI, PostgreSQL, Docker, AWS
+Experience: {years} years building REST APIs and data pipelines.
+Projects: Job Portal API ({n}), Inventory Service, Chat Backend.
+"""
+
+JOB_DESCRIPTION = "We are hiring a backend engineer to build and scale our hiring platform APIs."
+JOB_SKILLS = "Python, Django, PostgreSQL, Docker"
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    idx = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[idx]
+
+
+def _make_pdf(text):
+    import fitz
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _write_secrets(workdir, url):
+    os.makedirs(os.path.join(workdir, ".streamlit"), exist_ok=True)
+    with open(os.path.join(workdir, ".streamlit", "secrets.toml"), "w") as f:
+        f.write('GROQ_API_KEY = "mock-key"\n')
+        f.write(f'GROQ_BASE_URL = "{url}/openai/v1"\n')
+        f.write('GEMINI_API_KEY_1 = "mock-key-1"\n')
+        f.write('GEMINI_API_KEY_2 = "mock-key-2"\n')
+        f.write(f'GEMINI_API_ENDPOINT = "{url}"\n')
+
+
+def run_workload(name, fn, inputs, concurrency):
+    """Call fn(input) for every input with `concurrency` workers; return a stats dict."""
+    latencies = []
+    failures = 0
+
+    def one(item):
+        t0 = time.perf_counter()
+        try:
+            ok = fn(item)
+        except Exception:
+            ok = False
+        return time.perf_counter() - t0, ok
+
+    t_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for latency, ok in pool.map(one, inputs):
+            latencies.append(latency * 1000)
+            if not ok:
+                failures += 1
+    wall = time.perf_counter() - t_start
+
+    return {
+        'workload': name,
+        'requests': len(inputs),
+        'concurrency': concurrency,
+        'failures': failures,
+        'wall_s': round(wall, 3),
+        'throughput_rps': round(len(inputs) / wall, 2) if wall else 0.0,
+        'p50_ms': round(_percentile(latencies, 50), 1),
+        'p95_ms': round(_percentile(latencies, 95), 1),
+        'p99_ms': round(_percentile(latencies, 99), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ATS screening and autofill against the mock LLM server")
+    parser.add_argument("--requests", type=int, default=100, help="requests per workload")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workloads", default="screening,autofill", help="comma separated: screening, autofill")
+    parser.add_argument("--duplicate-rate", type=float, default=0.0,
+                        help="fraction of requests repeating an earlier résumé (exercises request coalescing)")
+    parser.add_argument("--url", default=None, help="use an already running mock server instead of starting one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=500)
+    parser.add_argument("--jitter-ms", type=float, default=100)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None, help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if not url:
+        config = MockConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit_rate, args.seed)
+        server = start_server(port=args.port, config=config)
+        url = f"http://127.0.0.1:{args.port}"
+
+    output = os.path.abspath(args.output) if args.output else None
+    workdir = tempfile.mkdtemp(prefix="anvaya-llm-bench-")
+    _write_secrets(workdir, url)
+    os.chdir(workdir)
+    os.environ.setdefault("LLM_METRICS_DB", os.path.join(workdir, "llm_metrics.db"))
+
+    import ATSService
+    import utils
+
+    unique = max(1, int(args.requests * (1 - args.duplicate_rate)))
+    texts = [RESUME_TEMPLATE.format(n=i % unique, years=2 + i % unique % 8) for i in range(args.requests)]
+
+    results = []
+    workloads = [w.strip() for w in args.workloads.split(",") if w.strip()]
+    if "screening" in workloads:
+        pdfs = {}
+        for text in texts:
+            if text not in pdfs:
+                pdfs[text] = _make_pdf(text)
+        results.append(run_workload(
+            "screening",
+            lambda text: ATSService.evaluate_candidate(io.BytesIO(pdfs[text]), JOB_DESCRIPTION, JOB_SKILLS) is not None,
+            texts, args.concurrency
+        ))
+    if "autofill" in workloads:
+        results.append(run_workload(
+            "autofill",
+            lambda text: bool(utils.parse_resume_with_groq(text).get("skills")),
+            texts, args.concurrency
+        ))
+
+    header = f"{'workload':<12}{'reqs':>6}{'conc':>6}{'fail':>6}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['workload']:<12}{r['requests']:>6}{r['concurrency']:>6}{r['failures']:>6}"
+              f"{r['throughput_rps']:>9}{r['p50_ms']:>10}{r['p95_ms']:>10}{r['p99_ms']:>10}")
+
+    if output:
+        with open(output, "w") as f:
+            json.dump({'args': vars(args), 'results': results}, f, indent=2)
+
+    if server:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
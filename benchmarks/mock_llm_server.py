@@ -0,0 +1,201 @@
+"""
+Local stand-in for the Groq (OpenAI-compatible) and Gemini APIs.
+
+Serves:
+    POST /openai/v1/chat/completions                  (utils.py, set GROQ_BASE_URL=http://host:port/openai/v1)
+    POST /v1beta/models/<model>:generateContent       (ATSService.py, set GEMINI_API_ENDPOINT=http://host:port)
+
+Latency, error rate and 429 rate limiting are configurable so the AI
+pipeline can be load tested without spending real quota.
+
+    python benchmarks/mock_llm_server.py --port 8765 --latency-ms 600 --jitter-ms 200 --rate-limit-rate 0.05
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+RESUME_JSON = {
+    "location": "Kathmandu, Nepal",
+    "experience_level": "Mid",
+    "phone_number": "+977 9800000000",
+    "skills": ["Python", "Django", "PostgreSQL", "Docker"],
+    "bio": "Backend developer with four years of experience building web APIs.",
+    "github_link": "https://github.com/example",
+    "linkedin_link": "https://linkedin.com/in/example",
+    "portfolio_link": "",
+    "projects": [
+        {
+            "name": "Job Portal API",
+            "description": "REST API for job postings and applications built with Django.",
+            "url": "",
+            "technologies": "Python, Django, PostgreSQL"
+        }
+    ]
+}
+
+
+class MockConfig:
+    def __init__(self, latency_ms=500, jitter_ms=100, error_rate=0.0, rate_limit_rate=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def next_outcome(self):
+        """Pick latency and outcome ('ok', 'error' or 'rate_limited') for one request."""
+        with self.lock:
+            self.requests += 1
+            delay = max(0.0, self.latency_ms + self.random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+            roll = self.random.random()
+        if roll < self.rate_limit_rate:
+            return delay, "rate_limited"
+        if roll < self.rate_limit_rate + self.error_rate:
+            return delay, "error"
+        return delay, "ok"
+
+
+def _estimate_tokens(text):
+    return max(1, len(text) // 4)
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    config = MockConfig()
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark output clean
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": {"message": "Invalid JSON"}})
+            return
+
+        delay, outcome = self.config.next_outcome()
+        time.sleep(delay)
+
+        path = self.path.split("?")[0]
+        if path.endswith("/chat/completions"):
+            self._chat_completions(request, outcome)
+        elif path.endswith(":generateContent"):
+            self._generate_content(path, request, outcome)
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {path}"}})
+
+    # ----- OpenAI-compatible (Groq) -----
+    def _chat_completions(self, request, outcome):
+        if outcome == "rate_limited":
+            self._send_json(429, {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}})
+            return
+        if outcome == "error":
+            self._send_json(500, {"error": {"message": "Mock internal error", "type": "server_error"}})
+            return
+
+        messages = request.get("messages", [])
+        system = " ".join(m.get("content", "") for m in messages if m.get("role") == "system")
+        prompt = " ".join(m.get("content", "") for m in messages)
+        if "structured data" in system:
+            content = json.dumps(RESUME_JSON)
+        elif "career" in system:
+            content = "- Backend Engineer: strong Python/Django base\n- DevOps Engineer: Docker experience"
+        else:
+            content = "Clear structure and relevant projects. Add measurable results to each role."
+
+        self._send_json(200, {
+            "id": f"chatcmpl-mock-{self.config.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": _estimate_tokens(prompt),
+                "completion_tokens": _estimate_tokens(content),
+                "total_tokens": _estimate_tokens(prompt) + _estimate_tokens(content)
+            }
+        })
+
+    # ----- Gemini generateContent -----
+    def _generate_content(self, path, request, outcome):
+        if outcome == "rate_limited":
+            self._send_json(429, {"error": {"code": 429, "message": "Resource has been exhausted (e.g. check quota).",
+                                            "status": "RESOURCE_EXHAUSTED"}})
+            return
+        if outcome == "error":
+            self._send_json(500, {"error": {"code": 500, "message": "Mock internal error", "status": "INTERNAL"}})
+            return
+
+        prompt = " ".join(
+            part.get("text", "")
+            for content in request.get("contents", [])
+            for part in content.get("parts", [])
+        )
+        score = 40 + (sum(map(ord, prompt[-200:])) % 55)
+        text = json.dumps({"score": score, "explanation": "Mock evaluation: relevant skills, limited seniority."})
+        self._send_json(200, {
+            "candidates": [{
+                "content": {"parts": [{"text": text}], "role": "model"},
+                "finishReason": "STOP",
+                "index": 0
+            }],
+            "usageMetadata": {
+                "promptTokenCount": _estimate_tokens(prompt),
+                "candidatesTokenCount": _estimate_tokens(text),
+                "totalTokenCount": _estimate_tokens(prompt) + _estimate_tokens(text)
+            },
+            "modelVersion": path.rsplit("/", 1)[-1].split(":")[0]
+        })
+
+
+def start_server(host="127.0.0.1", port=8765, config=None):
+    """Start the mock server on a background thread and return it (call .shutdown() to stop)."""
+    handler = type("ConfiguredMockLLMHandler", (MockLLMHandler,), {"config": config or MockConfig()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock Groq/Gemini API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=500)
+    parser.add_argument("--jitter-ms", type=float, default=100)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 429")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = MockConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit_rate, args.seed)
+    handler = type("ConfiguredMockLLMHandler", (MockLLMHandler,), {"config": config})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"Mock LLM server on http://{args.host}:{args.port}")
+    print(f"  Groq base URL:   http://{args.host}:{args.port}/openai/v1")
+    print(f"  Gemini endpoint: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,513 @@
+"""
+Seeded synthetic dataset for database.py benchmarks and demos.
+
+Fills every collection the app uses (users, employee_profiles, companies,
+jobs, applications, interviews, saved_jobs, messages, notifications,
+job_requests, dashboard_summary) with documents shaped exactly like the
+ones the pages write. Activity is skewed the way a real job board is:
+a few companies post most of the jobs, a few jobs get most of the
+applications and a few employees apply a lot (Zipf-like weights). Skills
+follow the job category, and locations are weighted towards the Kathmandu
+valley. Timestamps cover the last 180 days before generation, so
+deadlines, expired interviews and "recent" lists behave as in production.
+
+    python benchmarks/synthetic_data.py --size small --save data/small.pkl
+    MEMORY_DB_PATH=data/small.pkl DATA_BACKEND=memory streamlit run app.py
+
+    FIRESTORE_EMULATOR_HOST=localhost:8080 python benchmarks/synthetic_data.py --backend emulator --size tiny
+
+With --backend memory (default) the data goes into memory_firestore and
+--save writes a snapshot plus "<snapshot>.json", the manifest of sample
+IDs that db_benchmark.py uses. With --backend emulator it is written
+through the app's own Firestore client, which firebase_admin points at the
+emulator when FIRESTORE_EMULATOR_HOST is set; the script refuses to run
+without it so production data is never touched. The same seed always
+gives the same documents (timestamps are relative to the current time).
+"""
+import argparse
+import bisect
+import json
+import os
+import random
+import string
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# companies, jobs and applications per preset; everything else is derived
+SIZES = {
+    'tiny': (100, 1_000, 10_000),
+    'small': (1_000, 10_000, 100_000),
+    'medium': (3_000, 30_000, 300_000),
+    'full': (10_000, 100_000, 1_000_000),
+}
+APPLICATIONS_PER_EMPLOYEE = 20      # average; the distribution is heavy-tailed
+SAVED_PER_APPLICATION = 0.3
+MESSAGES_PER_APPLICATION = 0.5
+NOTIFICATIONS_PER_APPLICATION = 1.0
+REQUESTS_PER_EMPLOYEE = 0.05
+HISTORY_DAYS = 180
+SAMPLE_POOL = 200                   # random IDs of each kind kept in the manifest
+WRITE_BATCH = 450                   # Firestore allows 500 writes per batch
+AUTO_ID_CHARS = string.ascii_letters + string.digits
+# bcrypt hash (cost 4) of "benchmark123": every generated account logs in with that password
+PASSWORD_HASH = "$2b$04$VX3DjagjH1Dd0RXDHA.eGe9CBuQAGt1cLmyLQA8mmBF0MVBbxNr4O"
+
+# ===== VOCABULARY =====
+SKILLS = {
+    'Technology': ["Python", "JavaScript", "React", "Django", "SQL", "Node.js", "AWS", "Docker",
+                   "Java", "TypeScript", "Git", "REST APIs", "PostgreSQL", "Kubernetes", "Go", "Flutter"],
+    'Data Science': ["Python", "SQL", "Pandas", "Machine Learning", "Statistics", "TensorFlow",
+                     "Power BI", "Excel", "PyTorch", "Data Visualization", "Spark", "R"],
+    'Design': ["Figma", "UI/UX", "Adobe Photoshop", "Illustrator", "Prototyping", "Wireframing",
+               "Adobe XD", "Branding", "Typography", "Motion Graphics"],
+    'Marketing': ["SEO", "Content Writing", "Social Media", "Google Ads", "Email Marketing",
+                  "Copywriting", "Google Analytics", "Canva", "Market Research"],
+    'Sales': ["Negotiation", "CRM", "Lead Generation", "Communication", "Salesforce",
+              "Customer Service", "Cold Calling", "Account Management"],
+}
+CATEGORY_WEIGHTS = {'Technology': 45, 'Data Science': 15, 'Design': 12, 'Marketing': 15, 'Sales': 13}
+REQUEST_CATEGORIES = ["Technology", "Data Science", "Design", "Marketing", "Sales", "Other"]
+TITLES = {
+    'Technology': ["Backend Developer", "Frontend Developer", "Full Stack Engineer", "Mobile Developer",
+                   "DevOps Engineer", "QA Engineer", "Software Engineer"],
+    'Data Science': ["Data Analyst", "Data Scientist", "ML Engineer", "BI Analyst"],
+    'Design': ["UI/UX Designer", "Graphic Designer", "Product Designer"],
+    'Marketing': ["Digital Marketing Executive", "Content Writer", "SEO Specialist", "Marketing Manager"],
+    'Sales': ["Sales Executive", "Business Development Officer", "Account Manager"],
+}
+LOCATIONS = {'Kathmandu': 40, 'Lalitpur': 14, 'Bhaktapur': 5, 'Pokhara': 9, 'Biratnagar': 5,
+             'Butwal': 4, 'Chitwan': 4, 'Dharan': 3, 'Birgunj': 3, 'Remote': 13}
+JOB_TYPES = {"Full-time": 55, "Part-time": 10, "Remote": 15, "Hybrid": 12, "Contract": 8}
+EXPERIENCE_LEVELS = {"Entry": 25, "Junior": 30, "Mid": 25, "Senior": 15, "Lead": 5}
+INDUSTRIES = ["Information Technology", "Banking", "Telecommunication", "Education", "Healthcare",
+              "E-commerce", "Hospitality", "NGO/INGO", "Media", "Manufacturing"]
+COMPANY_PREFIXES = ["Himalayan", "Everest", "Annapurna", "Sagarmatha", "Lumbini", "Gorkha", "Janakpur",
+                    "Kantipur", "Bagmati", "Koshi", "Mustang", "Phewa", "Nilgiri", "Makalu"]
+COMPANY_SUFFIXES = ["Tech", "Solutions", "Digital", "Labs", "Systems", "Bank", "Ventures", "Media",
+                    "Software", "Consulting", "Networks", "Infotech"]
+FIRST_NAMES = ["Aarav", "Sita", "Ram", "Gita", "Bikash", "Anjali", "Suman", "Pooja", "Nabin", "Sunita",
+               "Prakash", "Asmita", "Rohan", "Kabita", "Sandeep", "Nisha", "Dipesh", "Srijana", "Manish", "Rekha"]
+LAST_NAMES = ["Shrestha", "Sharma", "Thapa", "Gurung", "Tamang", "Rai", "Adhikari", "Karki", "Maharjan",
+              "Poudel", "Bhattarai", "Koirala", "Magar", "Limbu", "Khadka"]
+APPLICATION_STATUSES = {'pending': 35, 'reviewed': 25, 'interview': 10, 'accepted': 5, 'rejected': 25}
+COMPANY_MESSAGES = ["Thanks for applying! Are you available for a quick call this week?",
+                    "We reviewed your application and would like to know more about your projects.",
+                    "Could you share your portfolio or GitHub profile?",
+                    "Your interview is confirmed. Please join on time.",
+                    "We will get back to you after the team review."]
+EMPLOYEE_MESSAGES = ["Thank you! Yes, I am available.", "Sure, here is the link to my portfolio.",
+                     "Could you tell me more about the team?", "Looking forward to it.",
+                     "Is the position open to remote work?"]
+
+
+# ===== HELPERS =====
+def _weighted(rng, table):
+    return rng.choices(list(table), weights=list(table.values()))[0]
+
+
+def _zipf_picker(rng, items, exponent):
+    """Return pick() choosing items with Zipf weights over a shuffled rank order."""
+    items = list(items)
+    rng.shuffle(items)
+    cum, total = [], 0.0
+    for rank in range(1, len(items) + 1):
+        total += rank ** -exponent
+        cum.append(total)
+
+    def pick():
+        return items[min(bisect.bisect_left(cum, rng.random() * total), len(items) - 1)]
+    return pick
+
+
+def _auto_id(rng):
+    return ''.join(rng.choices(AUTO_ID_CHARS, k=20))
+
+
+def _between(rng, start, end):
+    if end <= start:
+        return start
+    return start + timedelta(seconds=rng.uniform(0, (end - start).total_seconds()))
+
+
+class _Writer:
+    """Batched writes through any Firestore-compatible client."""
+
+    def __init__(self, db):
+        self.db = db
+        self.batch = db.batch()
+        self.pending = 0
+        self.counts = {}
+
+    def set(self, collection, doc_id, data):
+        self.batch.set(self.db.collection(collection).document(doc_id), data)
+        self.counts[collection] = self.counts.get(collection, 0) + 1
+        self.pending += 1
+        if self.pending >= WRITE_BATCH:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.batch.commit()
+            self.batch = self.db.batch()
+            self.pending = 0
+
+
+# ===== GENERATOR =====
+def generate(db, companies=100, jobs=1_000, applications=10_000, seed=42, now=None, log=print):
+    """Write the dataset to db and return the manifest (counts and sample IDs)."""
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc).replace(microsecond=0)
+    history_start = now - timedelta(days=HISTORY_DAYS)
+    employees = max(10, applications // APPLICATIONS_PER_EMPLOYEE)
+    password = PASSWORD_HASH
+    writer = _Writer(db)
+    started = time.perf_counter()
+
+    def progress(label):
+        writer.flush()
+        log(f"  {label:<18} {writer.counts.get(label, 0):>9} docs  ({time.perf_counter() - started:.1f}s)")
+
+    # Employees and their profiles
+    employee_ids = []
+    for i in range(employees):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        email = f"{first}.{last}.{i}@example.com".lower()
+        employee_ids.append(email)
+        joined = _between(rng, history_start, now)
+        writer.set('users', email, {'name': f"{first} {last}", 'email': email, 'password': password,
+                                    'role': 'employee', 'is_admin': i < 3, 'created_at': joined})
+        if rng.random() < 0.8:
+            category = _weighted(rng, CATEGORY_WEIGHTS)
+            skills = rng.sample(SKILLS[category], rng.randint(3, min(8, len(SKILLS[category]))))
+            writer.set('employee_profiles', email, {
+                'user_id': email,
+                'phone': f"98{rng.randint(0, 99_999_999):08d}",
+                'location': _weighted(rng, LOCATIONS),
+                'profile_pic': '',
+                'resume_path': '',
+                'skills': ", ".join(skills),
+                'experience_level': _weighted(rng, EXPERIENCE_LEVELS),
+                'preferred_job_type': _weighted(rng, JOB_TYPES),
+                'expected_salary': f"${rng.randrange(10, 120, 5)}k",
+                'bio': f"{category} professional skilled in {skills[0]} and {skills[1]}.",
+                'linkedin_url': '',
+                'github_url': '',
+                'portfolio_url': '',
+                'projects': '[]',
+                'job_alerts_enabled': rng.random() < 0.25,
+                'video_path': '',
+                'created_at': joined,
+                'updated_at': _between(rng, joined, now),
+            })
+    progress('users')
+
+    # Employers and companies (one employer account per company)
+    company_ids, company_names = [], {}
+    for i in range(companies):
+        company_id = _auto_id(rng)
+        name = f"{rng.choice(COMPANY_PREFIXES)} {rng.choice(COMPANY_SUFFIXES)}"
+        email = f"hr{i}@{name.lower().replace(' ', '')}.example.com"
+        created = _between(rng, history_start - timedelta(days=HISTORY_DAYS), history_start)
+        writer.set('users', email, {'name': f"{name} HR", 'email': email, 'password': password,
+                                    'role': 'employer', 'is_admin': False, 'company_id': company_id,
+                                    'created_at': created})
+        writer.set('companies', company_id, {
+            'name': name, 'email': email, 'logo': '',
+            'description': f"{name} is a growing {rng.choice(INDUSTRIES).lower()} company.",
+            'industry': rng.choice(INDUSTRIES), 'location': _weighted(rng, LOCATIONS),
+            'website': f"https://{name.lower().replace(' ', '')}.example.com", 'created_at': created,
+        })
+        company_ids.append(company_id)
+        company_names[company_id] = name
+    progress('companies')
+
+    # Jobs: a few companies post most of them
+    pick_company = _zipf_picker(rng, company_ids, 0.8)
+    job_info = {}   # job_id -> (company_id, created_at, deadline)
+    for _ in range(jobs):
+        job_id, company_id = _auto_id(rng), pick_company()
+        category = _weighted(rng, CATEGORY_WEIGHTS)
+        created = _between(rng, history_start, now)
+        deadline = created + timedelta(days=rng.randint(14, 60))
+        # ~2% stay 'active' past their deadline until update_expired_jobs() runs
+        status = 'active' if deadline > now or rng.random() < 0.02 else 'expired'
+        salary_min = rng.randrange(10, 100, 5)
+        skills = rng.sample(SKILLS[category], rng.randint(3, 6))
+        writer.set('jobs', job_id, {
+            'company_id': company_id,
+            'company_name': company_names[company_id],
+            'title': rng.choice(TITLES[category]),
+            'category': category,
+            'description': f"Join our team to work on {category.lower()} projects using {skills[0]}.",
+            'requirements': f"Experience with {', '.join(skills[:3])}.",
+            'location': _weighted(rng, LOCATIONS),
+            'job_type': _weighted(rng, JOB_TYPES),
+            'salary_range': f"${salary_min}k - ${salary_min + rng.randrange(5, 60, 5)}k",
+            'experience_level': _weighted(rng, EXPERIENCE_LEVELS),
+            'skills_required': ", ".join(skills),
+            'status': status,
+            'created_at': created,
+            'deadline': deadline,
+        })
+        job_info[job_id] = (company_id, created, deadline)
+    progress('jobs')
+
+    # Applications: popular jobs and very active employees dominate
+    pick_job = _zipf_picker(rng, list(job_info), 0.7)
+    pick_employee = _zipf_picker(rng, employee_ids, 0.6)
+    summaries = {e: {'total_applications': 0, 'status_counts': {}, 'scheduled_interviews': 0,
+                     'saved_jobs': 0, 'unread_messages': 0, 'unread_notifications': 0} for e in employee_ids}
+    app_rows = []   # (app_id, employee_id, job_id, company_id, status, applied_at)
+    taken = set()
+    for _ in range(applications):
+        for _attempt in range(20):
+            employee_id, job_id = pick_employee(), pick_job()
+            if (employee_id, job_id) not in taken:
+                break
+        else:
+            continue
+        taken.add((employee_id, job_id))
+        company_id, created, deadline = job_info[job_id]
+        applied_at = _between(rng, created, min(deadline, now))
+        status = 'pending' if (now - applied_at).days < 3 and rng.random() < 0.9 \
+            else _weighted(rng, APPLICATION_STATUSES)
+        app_id = f"{employee_id}_{job_id}"
+        writer.set('applications', app_id, {
+            'job_id': job_id, 'employee_id': employee_id, 'company_id': company_id,
+            'match_score': max(0, min(100, int(rng.gauss(62, 15)))),
+            'cover_letter': "I am excited to apply for this role." if rng.random() < 0.6 else '',
+            'status': status, 'applied_at': applied_at,
+            'updated_at': applied_at if status == 'pending' else _between(rng, applied_at, now),
+        })
+        summary = summaries[employee_id]
+        summary['total_applications'] += 1
+        summary['status_counts'][status] = summary['status_counts'].get(status, 0) + 1
+        app_rows.append((app_id, employee_id, job_id, company_id, status, applied_at))
+    progress('applications')
+
+    # Interviews for applications in the interview stage
+    for app_id, employee_id, job_id, company_id, status, applied_at in app_rows:
+        if status != 'interview':
+            continue
+        scheduled = _between(rng, applied_at + timedelta(days=3), applied_at + timedelta(days=21))
+        # Past interviews are usually expired already; the rest wait for mark_expired_interviews()
+        interview_status = 'scheduled' if scheduled > now or rng.random() < 0.2 else 'expired'
+        writer.set('interviews', _auto_id(rng), {
+            'application_id': app_id, 'employee_id': employee_id, 'company_id': company_id,
+            'job_id': job_id, 'scheduled_date': scheduled,
+            'interview_type': rng.choice(["Video Call", "Phone", "In-person"]),
+            'meeting_link': "https://meet.example.com/" + _auto_id(rng)[:10],
+            'status': interview_status, 'created_at': applied_at,
+        })
+        if interview_status == 'scheduled':
+            summaries[employee_id]['scheduled_interviews'] += 1
+    progress('interviews')
+
+    # Saved jobs (same skew as applications)
+    saved = set()
+    for _ in range(int(len(app_rows) * SAVED_PER_APPLICATION)):
+        employee_id, job_id = pick_employee(), pick_job()
+        if (employee_id, job_id) in saved:
+            continue
+        saved.add((employee_id, job_id))
+        writer.set('saved_jobs', f"{employee_id}_{job_id}", {
+            'employee_id': employee_id, 'job_id': job_id,
+            'saved_at': _between(rng, job_info[job_id][1], now)})
+        summaries[employee_id]['saved_jobs'] += 1
+    progress('saved_jobs')
+
+    # Conversations: started by the company on reviewed applications, geometric length
+    answered = [row for row in app_rows if row[4] != 'pending']
+    mean_length = 4
+    conversation_rate = min(1.0, len(app_rows) * MESSAGES_PER_APPLICATION / max(1, len(answered) * mean_length))
+    conversations = {}  # employee_id -> {company_id: message count}
+    for app_id, employee_id, job_id, company_id, status, applied_at in answered:
+        if rng.random() >= conversation_rate:
+            continue
+        length = 1
+        while rng.random() > 1 / mean_length:
+            length += 1
+        sent = _between(rng, applied_at, now)
+        for n in range(length):
+            from_company = n % 2 == 0
+            last = n == length - 1
+            is_read = not last or rng.random() < 0.6
+            writer.set('messages', _auto_id(rng), {
+                'sender_id': company_id if from_company else employee_id,
+                'sender_type': 'company' if from_company else 'employee',
+                'receiver_id': employee_id if from_company else company_id,
+                'receiver_type': 'employee' if from_company else 'company',
+                'application_id': app_id,
+                'message': rng.choice(COMPANY_MESSAGES if from_company else EMPLOYEE_MESSAGES),
+                'is_read': is_read,
+                'attachment_path': None,
+                'created_at': sent,
+            })
+            if from_company and not is_read:
+                summaries[employee_id]['unread_messages'] += 1
+            sent = _between(rng, sent, min(now, sent + timedelta(days=2)))
+        per_company = conversations.setdefault(employee_id, {})
+        per_company[company_id] = per_company.get(company_id, 0) + length
+    progress('messages')
+
+    # Notifications about the employee's own activity
+    kinds = [("application", "Application Submitted", "Your application was submitted."),
+             ("save", "Job Saved", "You saved a job."),
+             ("interview", "Interview Scheduled", "An interview has been scheduled.")]
+    for app_id, employee_id, job_id, company_id, status, applied_at in app_rows:
+        count = int(NOTIFICATIONS_PER_APPLICATION) + (rng.random() < NOTIFICATIONS_PER_APPLICATION % 1)
+        for n in range(count):
+            type_, title, message = kinds[0] if n == 0 else rng.choice(kinds)
+            created = applied_at if n == 0 else _between(rng, applied_at, now)
+            is_read = (now - created).days > 7 and rng.random() < 0.9
+            writer.set('notifications', _auto_id(rng), {
+                'employee_id': employee_id, 'type': type_, 'title': title, 'message': message,
+                'related_id': job_id, 'is_read': is_read, 'created_at': created})
+            if not is_read:
+                summaries[employee_id]['unread_notifications'] += 1
+    progress('notifications')
+
+    # Job requests posted by employees
+    request_ids = []
+    for _ in range(int(employees * REQUESTS_PER_EMPLOYEE)):
+        request_id = _auto_id(rng)
+        category = rng.choice(REQUEST_CATEGORIES)
+        writer.set('job_requests', request_id, {
+            'user_id': rng.choice(employee_ids),
+            'title': f"Looking for a {category.lower()} freelancer",
+            'description': "Short project, details will be shared with interested companies.",
+            'category': category, 'location': _weighted(rng, LOCATIONS),
+            'budget': f"${rng.randrange(100, 5000, 50)}",
+            'status': 'open' if rng.random() < 0.7 else 'closed',
+            'created_at': _between(rng, history_start, now), 'assigned_to': None})
+        request_ids.append(request_id)
+    progress('job_requests')
+
+    # Dashboard summaries as the writers would have left them
+    for employee_id, summary in summaries.items():
+        writer.set('dashboard_summary', employee_id, dict(summary, built_at=now, updated_at=now))
+    progress('dashboard_summary')
+
+    return _manifest(rng, seed, now, writer.counts, employee_ids, company_ids, list(job_info),
+                     app_rows, request_ids, conversations)
+
+
+def _manifest(rng, seed, now, counts, employee_ids, company_ids, job_ids, app_rows, request_ids, conversations):
+    """Typical (median) and heavy (largest) entities plus random pools for the benchmark."""
+    apps_per = {'employee': {}, 'company': {}, 'job': {}}
+    for app_id, employee_id, job_id, company_id, status, applied_at in app_rows:
+        apps_per['employee'][employee_id] = apps_per['employee'].get(employee_id, 0) + 1
+        apps_per['company'][company_id] = apps_per['company'].get(company_id, 0) + 1
+        apps_per['job'][job_id] = apps_per['job'].get(job_id, 0) + 1
+
+    def typical_and_heavy(kind, fallback):
+        ranked = sorted(apps_per[kind].items(), key=lambda kv: (kv[1], kv[0]))
+        if not ranked:
+            return {'typical': fallback, 'heavy': fallback}
+        return {'typical': ranked[len(ranked) // 2][0], 'heavy': ranked[-1][0]}
+
+    def partner(employee_id):
+        """The company the employee talks to most (or applied to), for message workloads."""
+        per_company = conversations.get(employee_id)
+        if per_company:
+            return max(per_company.items(), key=lambda kv: (kv[1], kv[0]))[0]
+        return next((row[3] for row in app_rows if row[1] == employee_id), company_ids[0])
+
+    def pool(ids):
+        return rng.sample(ids, min(SAMPLE_POOL, len(ids)))
+
+    employees = typical_and_heavy('employee', employee_ids[0])
+    return {
+        'seed': seed,
+        'generated_at': now.isoformat(),
+        'counts': counts,
+        'samples': {
+            'employee': employees,
+            'partner_company': {variant: partner(e) for variant, e in employees.items()},
+            'company': typical_and_heavy('company', company_ids[0]),
+            'job': typical_and_heavy('job', job_ids[0]),
+        },
+        'pools': {
+            'employees': pool(employee_ids),
+            'companies': pool(company_ids),
+            'jobs': pool(job_ids),
+            'applications': pool([row[0] for row in app_rows]),
+            'job_requests': pool(request_ids),
+        },
+    }
+
+
+# ===== BACKENDS =====
+def memory_db():
+    """The in-memory client database.py uses when DATA_BACKEND=memory."""
+    os.environ["DATA_BACKEND"] = "memory"
+    import database
+    import memory_firestore
+    if not isinstance(database.db, memory_firestore.MemoryClient):
+        raise RuntimeError("DATA_BACKEND is set to another backend in st.secrets; refusing to write")
+    return database.db
+
+
+def emulator_db():
+    """The app's Firestore client, only when it points at the emulator."""
+    if not os.getenv("FIRESTORE_EMULATOR_HOST"):
+        raise RuntimeError("FIRESTORE_EMULATOR_HOST is not set; refusing to write to a real project")
+    import database
+    return database.db
+
+
+def clear_emulator(db):
+    """Delete every document in the emulator's default database."""
+    import urllib.request
+    url = (f"http://{os.environ['FIRESTORE_EMULATOR_HOST']}/emulator/v1/projects/"
+           f"{db.project}/databases/(default)/documents")
+    urllib.request.urlopen(urllib.request.Request(url, method="DELETE")).close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill the in-memory backend or the Firestore emulator with synthetic data")
+    parser.add_argument("--size", default="tiny", choices=list(SIZES))
+    parser.add_argument("--companies", type=int, default=None, help="override the preset")
+    parser.add_argument("--jobs", type=int, default=None, help="override the preset")
+    parser.add_argument("--applications", type=int, default=None, help="override the preset")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--backend", default="memory", choices=["memory", "emulator"])
+    parser.add_argument("--clear", action="store_true", help="emulator: delete existing documents first")
+    parser.add_argument("--save", default=None, help="memory: write a snapshot here (and <snapshot>.json)")
+    args = parser.parse_args()
+    if args.save and args.backend != "memory":
+        parser.error("--save only applies to the memory backend")
+
+    companies, jobs, applications = SIZES[args.size]
+    companies = args.companies or companies
+    jobs = args.jobs or jobs
+    applications = args.applications or applications
+
+    if args.backend == "memory":
+        db = memory_db()
+    else:
+        db = emulator_db()
+        if args.clear:
+            clear_emulator(db)
+
+    print(f"generating {companies} companies, {jobs} jobs, {applications} applications (seed {args.seed})")
+    manifest = generate(db, companies, jobs, applications, seed=args.seed)
+    manifest['size'] = args.size
+
+    if args.save:
+        db.save(args.save)
+        with open(args.save + ".json", "w") as f:
+            json.dump(manifest, f, indent=2)
+        print(f"snapshot written to {args.save}")
+    elif args.backend == "memory":
+        print("nothing saved (use --save to keep the in-memory data)")
+    else:
+        print(json.dumps(manifest['samples'], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Content-addressed blob storage for uploaded files (résumés, videos).
+
+Files are stored once under their SHA-256 digest; Firestore documents hold
+only a reference string:
+
+    sha256:<64 hex digits>#<original file name>
+
+The file name after '#' is only used for downloads. Each blob has a
+`blobs/<digest>` document with its size, content type and a reference
+count: put() adds a reference, release() drops one, and
+collect_garbage() deletes blobs nobody has referenced for a grace period.
+
+Backends are pluggable (BLOB_BACKEND, default "local" under BLOB_ROOT).
+A backend implements exists/write/read/delete/size and may expose
+local_path() for APIs that want a file path (st.video).
+
+Plain file paths written before this store existed are still accepted by
+exists/read/file_name/local_path.
+"""
+import hashlib
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from database import db, firestore
+
+BLOB_BACKEND = os.getenv("BLOB_BACKEND", "local")
+BLOB_ROOT = os.getenv("BLOB_ROOT", "blobs")
+GC_GRACE_HOURS = float(os.getenv("BLOB_GC_GRACE_HOURS", 24))
+REF_PREFIX = "sha256:"
+
+
+# ===== BACKENDS =====
+class LocalBackend:
+    """Blobs as files under root/ab/cd/<digest>."""
+
+    def __init__(self, root=BLOB_ROOT):
+        self.root = root
+
+    def local_path(self, digest):
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def exists(self, digest):
+        return os.path.exists(self.local_path(digest))
+
+    def write(self, digest, data):
+        path = self.local_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)  # readers never see a partial blob
+
+    def read(self, digest, start=0, end=None):
+        with open(self.local_path(digest), "rb") as f:
+            f.seek(start)
+            return f.read() if end is None else f.read(max(0, end - start))
+
+    def size(self, digest):
+        return os.path.getsize(self.local_path(digest))
+
+    def delete(self, digest):
+        try:
+            os.remove(self.local_path(digest))
+        except FileNotFoundError:
+            pass
+
+
+BACKENDS = {"local": LocalBackend}
+
+_backend = None
+
+
+def register_backend(name, backend_class):
+    BACKENDS[name] = backend_class
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        _backend = BACKENDS[BLOB_BACKEND]()
+    return _backend
+
+
+# ===== REFERENCES =====
+def is_blob_ref(value):
+    return isinstance(value, str) and value.startswith(REF_PREFIX)
+
+
+def make_ref(digest, file_name=""):
+    return f"{REF_PREFIX}{digest}#{os.path.basename(file_name)}" if file_name else f"{REF_PREFIX}{digest}"
+
+
+def parse_ref(ref):
+    """Return (digest, file_name) for a blob reference."""
+    body = ref[len(REF_PREFIX):]
+    digest, _, file_name = body.partition("#")
+    return digest, file_name
+
+
+def _meta(digest):
+    return db.collection('blobs').document(digest)
+
+
+# ===== WRITE / REFCOUNT =====
+def put(data, file_name="", content_type=None):
+    """Store bytes (deduplicated by content), add a reference and return its ref string."""
+    if hasattr(data, "getvalue"):
+        data = data.getvalue()
+    digest = hashlib.sha256(data).hexdigest()
+    # Reference first, then the existence check: collect_garbage() relies on this order
+    _meta(digest).set({
+        'size': len(data),
+        'content_type': content_type or '',
+        'refcount': firestore.Increment(1),
+        'updated_at': firestore.SERVER_TIMESTAMP
+    }, merge=True)
+    backend = get_backend()
+    if not backend.exists(digest):
+        backend.write(digest, data)
+    return make_ref(digest, file_name)
+
+
+def add_ref(ref):
+    """Record another document pointing at an existing blob."""
+    if is_blob_ref(ref):
+        digest, _ = parse_ref(ref)
+        _meta(digest).set({'refcount': firestore.Increment(1), 'updated_at': firestore.SERVER_TIMESTAMP}, merge=True)
+
+
+def release(ref):
+    """Drop one reference. The blob itself is removed later by collect_garbage()."""
+    if is_blob_ref(ref):
+        digest, _ = parse_ref(ref)
+        _meta(digest).set({
+            'refcount': firestore.Increment(-1),
+            'released_at': firestore.SERVER_TIMESTAMP,
+            'updated_at': firestore.SERVER_TIMESTAMP
+        }, merge=True)
+
+
+# ===== READ =====
+def exists(ref_or_path):
+    if is_blob_ref(ref_or_path):
+        return get_backend().exists(parse_ref(ref_or_path)[0])
+    return bool(ref_or_path) and os.path.exists(ref_or_path)
+
+
+def read(ref_or_path, start=0, end=None):
+    """Return the bytes [start, end) of a blob (or legacy file path)."""
+    if is_blob_ref(ref_or_path):
+        return get_backend().read(parse_ref(ref_or_path)[0], start, end)
+    with open(ref_or_path, "rb") as f:
+        f.seek(start)
+        return f.read() if end is None else f.read(max(0, end - start))
+
+
+def size(ref_or_path):
+    if is_blob_ref(ref_or_path):
+        return get_backend().size(parse_ref(ref_or_path)[0])
+    return os.path.getsize(ref_or_path)
+
+
+def file_name(ref_or_path):
+    if is_blob_ref(ref_or_path):
+        digest, name = parse_ref(ref_or_path)
+        return name or digest[:16]
+    return os.path.basename(ref_or_path)
+
+
+def local_path(ref_or_path):
+    """A filesystem path for the blob, or None if the backend is not local."""
+    if not is_blob_ref(ref_or_path):
+        return ref_or_path
+    backend = get_backend()
+    if hasattr(backend, "local_path"):
+        return backend.local_path(parse_ref(ref_or_path)[0])
+    return None
+
+
+# ===== GARBAGE COLLECTION =====
+def collect_garbage(grace_hours=GC_GRACE_HOURS):
+    """
+    Delete blobs whose refcount has been zero for longer than grace_hours.
+    Run from a single process (admin panel or `python blobstore.py gc`).
+    Returns (deleted_count, freed_bytes).
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=grace_hours)
+    backend = get_backend()
+    deleted, freed = 0, 0
+
+    @firestore.transactional
+    def _drop_if_unreferenced(transaction, ref):
+        snap = ref.get(transaction=transaction)
+        if not snap.exists:
+            return None
+        data = snap.to_dict()
+        released = data.get('released_at')
+        if data.get('refcount', 0) > 0 or (released and released > cutoff):
+            return None
+        transaction.delete(ref)
+        return data.get('size', 0)
+
+    for doc in db.collection('blobs').where('refcount', '<=', 0).stream():
+        size_freed = _drop_if_unreferenced(db.transaction(), doc.reference)
+        if size_freed is None:
+            continue
+        data = backend.read(doc.id) if backend.exists(doc.id) else None
+        backend.delete(doc.id)
+        # put() records its reference before checking whether the file exists,
+        # so a put() of the same content in between has re-created the document
+        # by now and may have skipped the write: put the bytes back.
+        if data is not None and doc.reference.get().exists:
+            backend.write(doc.id, data)
+            continue
+        deleted += 1
+        freed += size_freed
+    return deleted, freed
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["gc"]:
+        count, freed = collect_garbage()
+        print(f"Deleted {count} unreferenced blobs ({freed / 1024 / 1024:.1f} MB)")
+    else:
+        print("usage: python blobstore.py gc")
@@ -1,27 +1,80 @@
-import firebase_admin
-from firebase_admin import credentials, firestore
 import os
 from datetime import datetime, timezone
 import datetime as dt
 import streamlit as st
-import base64
+from resources import get_firestore, firestore_module
+import doc_cache
+import profiler
+import query_cache
+from query_cache import cached
 
 # cred_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS", "serviceAccountKey.json")
 # if not firebase_admin._apps:
 #     cred = credentials.Certificate(cred_path)
 #     firebase_admin.initialize_app(cred)
 
-if not firebase_admin._apps:
-    cred = credentials.Certificate(dict(st.secrets["firebase"]))
-    firebase_admin.initialize_app(cred)
-
-db = firestore.client()
+# One client per server process, shared by every module and session (see resources.py).
+# DATA_BACKEND=memory swaps in memory_firestore for both the client and the firestore helpers.
+firestore = firestore_module()
+db = get_firestore()
 
 def doc_to_dict(doc):
     data = doc.to_dict()
     data['id'] = doc.id
     return data
 
+# ========== BULK READS ==========
+# Joins for list pages: fetch every related document in a fixed number of
+# round trips instead of one read per row.
+GET_ALL_CHUNK = 300   # document references per get_all call
+IN_QUERY_LIMIT = 30   # values per 'in' filter (Firestore maximum)
+
+def _chunks(values, size):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+def get_docs_by_id(collection, ids):
+    """Return {id: data} for the existing documents among ids (batched get_all)."""
+    ids = list(dict.fromkeys(i for i in ids if i))
+    docs = {}
+    for chunk in _chunks(ids, GET_ALL_CHUNK):
+        refs = [db.collection(collection).document(doc_id) for doc_id in chunk]
+        for snap in db.get_all(refs):
+            if snap.exists:
+                docs[snap.id] = snap.to_dict()
+    return docs
+
+def query_in(collection, field, values, *filters):
+    """Stream documents whose field is in values, with optional extra (field, op, value) filters."""
+    values = list(dict.fromkeys(v for v in values if v))
+    results = []
+    for chunk in _chunks(values, IN_QUERY_LIMIT):
+        query = db.collection(collection).where(field, 'in', chunk)
+        for f in filters:
+            query = query.where(*f)
+        results.extend(query.stream())
+    return results
+
+# ========== CACHED REFERENCE DOCUMENTS ==========
+# companies, jobs and users looked up for display (names, titles, logos) go
+# through doc_cache; functions below that write those documents invalidate them.
+def _load_reference_docs(collection):
+    def loader(ids):
+        docs = get_docs_by_id(collection, ids)
+        if collection == 'users':
+            for data in docs.values():
+                data.pop('password', None)  # cached users are for display only
+        return docs
+    return loader
+
+def get_cached_docs(collection, ids):
+    """{id: data or None} for companies/jobs/users, served from the process cache when fresh."""
+    return doc_cache.get_many(collection, ids, _load_reference_docs(collection))
+
+def get_cached_doc(collection, doc_id):
+    return get_cached_docs(collection, [doc_id]).get(doc_id)
+
 def add_user(name, email, password, role, is_admin=False):
     """Add a new user to Firestore."""
     user_ref = db.collection('users').document(email)
@@ -33,6 +86,7 @@ def add_user(name, email, password, role, is_admin=False):
         'is_admin': is_admin,   # new boolean field
         'created_at': firestore.SERVER_TIMESTAMP
     })
+    doc_cache.invalidate('users', email)
 
 def get_user(email):
     """Retrieve a user by email."""
@@ -49,34 +103,30 @@ def get_user_by_id(user_id):
     return get_user(user_id)  # same as get_user because ID is email
 
 # ========== PROFILES ==========
-def get_or_create_profile(user_id):
-    """Get employee profile for a user; create if not exists."""
-    profile_ref = db.collection('employee_profiles').document(user_id)
-    profile_doc = profile_ref.get()
-    if profile_doc.exists:
-        data = profile_doc.to_dict()
-    else:
-        data = {
-            'user_id': user_id,
-            'phone': '',
-            'location': '',
-            'profile_pic': '',
-            'resume_path': '',
-            'skills': '',
-            'experience_level': '',
-            'preferred_job_type': '',
-            'expected_salary': '',
-            'bio': '',
-            'linkedin_url': '',
-            'github_url': '',
-            'portfolio_url': '',
-            'projects': '[]',
-            'job_alerts_enabled': False,
-            'video_path': '',
-            'created_at': firestore.SERVER_TIMESTAMP,
-            'updated_at': firestore.SERVER_TIMESTAMP
-        }
-        profile_ref.set(data)
+def _default_profile(user_id):
+    """Field values of a profile that has never been saved."""
+    return {
+        'user_id': user_id,
+        'phone': '',
+        'location': '',
+        'profile_pic': '',
+        'resume_path': '',
+        'skills': '',
+        'experience_level': '',
+        'preferred_job_type': '',
+        'expected_salary': '',
+        'bio': '',
+        'linkedin_url': '',
+        'github_url': '',
+        'portfolio_url': '',
+        'projects': '[]',
+        'job_alerts_enabled': False,
+        'video_path': '',
+        'created_at': None,
+        'updated_at': None
+    }
+
+def _profile_tuple(user_id, data):
     # Convert to tuple to match old format (user_id, phone, location, profile_pic, resume_path, skills, experience_level, preferred_job_type, expected_salary, bio, linkedin_url, github_url, portfolio_url, created_at, updated_at)
     return (
         user_id,                        # 0
@@ -99,15 +149,44 @@ def get_or_create_profile(user_id):
         data.get('updated_at')          # 17
     )
 
+@cached('profile:{user_id}')
+def get_or_create_profile(user_id):
+    """Get employee profile for a user; create if not exists. Use on the employee's own pages only."""
+    profile_ref = db.collection('employee_profiles').document(user_id)
+    profile_doc = profile_ref.get()
+    if profile_doc.exists:
+        data = profile_doc.to_dict()
+    else:
+        data = _default_profile(user_id)
+        data['created_at'] = data['updated_at'] = firestore.SERVER_TIMESTAMP
+        profile_ref.set(data)
+    return _profile_tuple(user_id, data)
+
+def get_profiles(user_ids):
+    """
+    Read-only bulk profile loader: {user_id: profile tuple} for every id, in
+    one batched read. Missing profiles get default values and are not written.
+    """
+    user_ids = list(user_ids)
+    docs = get_docs_by_id('employee_profiles', user_ids)
+    return {user_id: _profile_tuple(user_id, docs.get(user_id) or _default_profile(user_id))
+            for user_id in user_ids if user_id}
+
+def get_profile(user_id):
+    """Read-only single profile (defaults if it does not exist yet)."""
+    return get_profiles([user_id]).get(user_id) or _profile_tuple(user_id, _default_profile(user_id))
+
 def update_user_name(user_id, name):
     """Update user's name in users collection."""
     db.collection('users').document(user_id).update({'name': name})
+    doc_cache.invalidate('users', user_id)
 
 def update_profile(user_id, **kwargs):
     """Update employee profile fields."""
     profile_ref = db.collection('employee_profiles').document(user_id)
     kwargs['updated_at'] = firestore.SERVER_TIMESTAMP
     profile_ref.update(kwargs)
+    query_cache.invalidate(f"profile:{user_id}")
 
 # ========== COMPANIES ==========
 def get_all_companies():
@@ -125,14 +204,13 @@ def get_all_companies():
 
 def get_company_jobs(company_id, employee_id):
     """Get all active jobs for a company, with applied flag for the employee."""
-    jobs_ref = db.collection('jobs').where('company_id', '==', company_id).where('status', '==', 'active').stream()
+    jobs_ref = list(db.collection('jobs').where('company_id', '==', company_id).where('status', '==', 'active').stream())
+    applied_ids = get_applied_job_ids(employee_id, [job.id for job in jobs_ref])
     jobs = []
     for job in jobs_ref:
         job_data = job.to_dict()
         job_data['id'] = job.id
-        # Check if employee applied
-        apps = db.collection('applications').where('job_id', '==', job.id).where('employee_id', '==', employee_id).limit(1).get()
-        applied = 1 if len(list(apps)) > 0 else 0
+        applied = 1 if job.id in applied_ids else 0
         jobs.append((
             job.id,
             job_data.get('company_id'),
@@ -154,23 +232,25 @@ def get_company_jobs(company_id, employee_id):
     return jobs
 
 # ========== JOBS ==========
+@cached('jobs', 'applications:{employee_id}', 'saved:{employee_id}')
 def search_jobs(employee_id):
     """Get all active jobs with company details and applied/saved flags."""
-    jobs_ref = db.collection('jobs').where('status', '==', 'active').stream()
+    jobs_ref = list(db.collection('jobs').where('status', '==', 'active').stream())
+    job_ids = [job.id for job in jobs_ref]
+    # Applied/saved flags are direct gets on the deterministic document IDs
+    applied_ids = get_applied_job_ids(employee_id, job_ids)
+    saved_ids = set(get_docs_by_id('saved_jobs', [f"{employee_id}_{job_id}" for job_id in job_ids]))
+    companies = get_cached_docs('companies', (job.to_dict().get('company_id') for job in jobs_ref))
     jobs = []
     for job in jobs_ref:
         job_data = job.to_dict()
         job_data['id'] = job.id
-        # Get company details
-        company_doc = db.collection('companies').document(job_data['company_id']).get()
-        company_name = company_doc.to_dict().get('name') if company_doc.exists else ''
-        logo = company_doc.to_dict().get('logo') if company_doc.exists else ''
-        # Applied flag
-        apps = db.collection('applications').where('job_id', '==', job.id).where('employee_id', '==', employee_id).limit(1).get()
-        applied = 1 if len(list(apps)) > 0 else 0
-        # Saved flag
-        saved = db.collection('saved_jobs').where('employee_id', '==', employee_id).where('job_id', '==', job.id).limit(1).get()
-        saved_flag = 1 if len(list(saved)) > 0 else 0
+        # Company details
+        company = companies.get(job_data['company_id'])
+        company_name = company.get('name') if company else ''
+        logo = company.get('logo') if company else ''
+        applied = 1 if job.id in applied_ids else 0
+        saved_flag = 1 if f"{employee_id}_{job.id}" in saved_ids else 0
         jobs.append((
             job.id,
             job_data.get('company_id'),
@@ -202,9 +282,9 @@ def get_job_by_id(job_id):
     job_data = job_doc.to_dict()
     job_data['id'] = job_doc.id
     # Get company
-    company_doc = db.collection('companies').document(job_data['company_id']).get()
-    company_name = company_doc.to_dict().get('name') if company_doc.exists else ''
-    company_email = company_doc.to_dict().get('email') if company_doc.exists else ''
+    company = get_cached_doc('companies', job_data['company_id'])
+    company_name = company.get('name') if company else ''
+    company_email = company.get('email') if company else ''
     # Return as tuple to match old format: id, company_id, company_name, title, category, description, requirements, location, job_type, salary_range, experience_level, skills_required, status, created_at, deadline, company_name, company_email
     return (
         job_data['id'],
@@ -227,44 +307,67 @@ def get_job_by_id(job_id):
     )
 
 # ========== APPLICATIONS ==========
+# Applications are keyed "<employee_id>_<job_id>" (like saved_jobs), so
+# "already applied?" is a direct document get. Older auto-ID applications
+# are moved over by `python migrations.py application-ids`.
+def application_doc_id(employee_id, job_id):
+    return f"{employee_id}_{job_id}"
+
+def get_applied_job_ids(employee_id, job_ids):
+    """The subset of job_ids the employee has applied to (batched direct gets)."""
+    docs = get_docs_by_id('applications', [application_doc_id(employee_id, job_id) for job_id in job_ids])
+    return {data.get('job_id') for data in docs.values()}
+
 def add_application(job_id, employee_id, company_id, match_score, cover_letter):
-    """Add a new application."""
-    app_ref = db.collection('applications').document()
-    app_ref.set({
-        'job_id': job_id,
-        'employee_id': employee_id,
-        'company_id': company_id,
-        'match_score': match_score,
-        'cover_letter': cover_letter,
-        'status': 'pending',
-        'applied_at': firestore.SERVER_TIMESTAMP,
-        'updated_at': firestore.SERVER_TIMESTAMP
-    })
+    """Add a new application. Returns False if the employee already applied to this job."""
+    app_ref = db.collection('applications').document(application_doc_id(employee_id, job_id))
+
+    @firestore.transactional
+    def _create(transaction):
+        if app_ref.get(transaction=transaction).exists:
+            return False
+        transaction.set(app_ref, {
+            'job_id': job_id,
+            'employee_id': employee_id,
+            'company_id': company_id,
+            'match_score': match_score,
+            'cover_letter': cover_letter,
+            'status': 'pending',
+            'applied_at': firestore.SERVER_TIMESTAMP,
+            'updated_at': firestore.SERVER_TIMESTAMP
+        })
+        _bump_summary(transaction, employee_id, total_applications=1, statuses={'pending': 1})
+        return True
+
+    created = _create(db.transaction())
+    query_cache.invalidate(f"applications:{employee_id}")
+    return created
 
+@cached('jobs', 'applications:{employee_id}')
 def get_user_applications(employee_id):
     """Get all applications for an employee, with job and interview details."""
-    apps_ref = db.collection('applications').where('employee_id', '==', employee_id).order_by('applied_at', direction=firestore.Query.DESCENDING).stream()
+    apps_ref = list(db.collection('applications').where('employee_id', '==', employee_id).order_by('applied_at', direction=firestore.Query.DESCENDING).stream())
+    # Jobs and interviews for every application in a few batched reads
+    jobs = get_cached_docs('jobs', (app.to_dict().get('job_id') for app in apps_ref))
+    interviews = {}
+    for interview in query_in('interviews', 'application_id', [app.id for app in apps_ref]):
+        int_data = interview.to_dict()
+        interviews.setdefault(int_data.get('application_id'), int_data)
     apps = []
     for app in apps_ref:
         app_data = app.to_dict()
         app_data['id'] = app.id
-        # Get job details
-        job_doc = db.collection('jobs').document(app_data['job_id']).get()
-        job_title = job_doc.to_dict().get('title') if job_doc.exists else ''
-        company_name = job_doc.to_dict().get('company_name') if job_doc.exists else ''
-        location = job_doc.to_dict().get('location') if job_doc.exists else ''
-        salary_range = job_doc.to_dict().get('salary_range') if job_doc.exists else ''
-        # Get interview details
-        interview_ref = db.collection('interviews').where('application_id', '==', app.id).limit(1).get()
-        interview = next(iter(interview_ref), None)
-        scheduled_date = None
-        interview_status = None
-        meeting_link = None
-        if interview:
-            int_data = interview.to_dict()
-            scheduled_date = int_data.get('scheduled_date')
-            interview_status = int_data.get('status')
-            meeting_link = int_data.get('meeting_link')
+        # Job details
+        job_data = jobs.get(app_data.get('job_id'))
+        job_title = job_data.get('title') if job_data else ''
+        company_name = job_data.get('company_name') if job_data else ''
+        location = job_data.get('location') if job_data else ''
+        salary_range = job_data.get('salary_range') if job_data else ''
+        # Interview details
+        int_data = interviews.get(app.id, {})
+        scheduled_date = int_data.get('scheduled_date')
+        interview_status = int_data.get('status')
+        meeting_link = int_data.get('meeting_link')
         apps.append((
             app.id,
             app_data.get('employee_id'),
@@ -288,35 +391,52 @@ def get_user_applications(employee_id):
 # ========== SAVED JOBS ==========
 def save_job(employee_id, job_id):
     """Save a job for an employee."""
-    doc_id = f"{employee_id}_{job_id}"
-    db.collection('saved_jobs').document(doc_id).set({
-        'employee_id': employee_id,
-        'job_id': job_id,
-        'saved_at': firestore.SERVER_TIMESTAMP
-    })
+    doc_ref = db.collection('saved_jobs').document(f"{employee_id}_{job_id}")
+
+    @firestore.transactional
+    def _save(transaction):
+        already_saved = doc_ref.get(transaction=transaction).exists
+        transaction.set(doc_ref, {
+            'employee_id': employee_id,
+            'job_id': job_id,
+            'saved_at': firestore.SERVER_TIMESTAMP
+        })
+        if not already_saved:
+            _bump_summary(transaction, employee_id, saved_jobs=1)
+
+    _save(db.transaction())
+    query_cache.invalidate(f"saved:{employee_id}")
 
 def unsave_job(employee_id, job_id):
     """Remove a saved job."""
-    doc_id = f"{employee_id}_{job_id}"
-    db.collection('saved_jobs').document(doc_id).delete()
+    doc_ref = db.collection('saved_jobs').document(f"{employee_id}_{job_id}")
+
+    @firestore.transactional
+    def _unsave(transaction):
+        if doc_ref.get(transaction=transaction).exists:
+            transaction.delete(doc_ref)
+            _bump_summary(transaction, employee_id, saved_jobs=-1)
+
+    _unsave(db.transaction())
+    query_cache.invalidate(f"saved:{employee_id}")
 
+@cached('jobs', 'applications:{employee_id}', 'saved:{employee_id}')
 def get_saved_jobs(employee_id):
     """Get all saved jobs for an employee with applied flag."""
-    saved_ref = db.collection('saved_jobs').where('employee_id', '==', employee_id).stream()
+    saved_ids = [saved.to_dict().get('job_id') for saved in db.collection('saved_jobs').where('employee_id', '==', employee_id).stream()]
+    # Jobs, their companies and the employee's applications in a few batched reads
+    saved_jobs = {job_id: job for job_id, job in get_cached_docs('jobs', saved_ids).items() if job}
+    companies = get_cached_docs('companies', (job.get('company_id') for job in saved_jobs.values()))
+    applied_ids = get_applied_job_ids(employee_id, saved_jobs.keys())
     jobs = []
-    for saved in saved_ref:
-        saved_data = saved.to_dict()
-        job_doc = db.collection('jobs').document(saved_data['job_id']).get()
-        if not job_doc.exists:
+    for job_id in dict.fromkeys(saved_ids):
+        if job_id not in saved_jobs:
             continue
-        job_data = job_doc.to_dict()
-        job_data['id'] = job_doc.id
-        # Get company name
-        company_doc = db.collection('companies').document(job_data['company_id']).get()
-        company_name = company_doc.to_dict().get('name') if company_doc.exists else ''
+        job_data = dict(saved_jobs[job_id], id=job_id)
+        # Company name
+        company_name = (companies.get(job_data.get('company_id')) or {}).get('name', '')
         # Applied flag
-        apps = db.collection('applications').where('job_id', '==', job_data['id']).where('employee_id', '==', employee_id).limit(1).get()
-        applied = 1 if len(list(apps)) > 0 else 0
+        applied = 1 if job_id in applied_ids else 0
         jobs.append((
             job_data['id'],
             job_data.get('company_id'),
@@ -342,7 +462,8 @@ def get_saved_jobs(employee_id):
 def add_notification(employee_id, type_, title, message, related_id=None):
     """Add a notification for an employee."""
     notif_ref = db.collection('notifications').document()
-    notif_ref.set({
+    batch = db.batch()
+    batch.set(notif_ref, {
         'employee_id': employee_id,
         'type': type_,
         'title': title,
@@ -351,31 +472,30 @@ def add_notification(employee_id, type_, title, message, related_id=None):
         'is_read': False,
         'created_at': firestore.SERVER_TIMESTAMP
     })
+    _bump_summary(batch, employee_id, unread_notifications=1)
+    batch.commit()
 
 def get_user_notifications(employee_id, limit=10):
     """Get latest notifications for an employee."""
     notifs_ref = db.collection('notifications').where('employee_id', '==', employee_id).order_by('created_at', direction=firestore.Query.DESCENDING).limit(limit).stream()
-    notifs = []
-    for notif in notifs_ref:
-        data = notif.to_dict()
-        data['id'] = notif.id
-        notifs.append((
-            data['id'],
-            data.get('employee_id'),
-            data.get('type'),
-            data.get('title'),
-            data.get('message'),
-            data.get('related_id'),
-            data.get('is_read'),
-            data.get('created_at')
-        ))
-    return notifs
+    return [notification_tuple(notif.id, notif.to_dict()) for notif in notifs_ref]
+
+def notification_tuple(notif_id, data):
+    return (
+        notif_id,
+        data.get('employee_id'),
+        data.get('type'),
+        data.get('title'),
+        data.get('message'),
+        data.get('related_id'),
+        data.get('is_read'),
+        data.get('created_at')
+    )
 
 def mark_notifications_read(employee_id):
     """Mark all notifications as read for an employee."""
     notifs_ref = db.collection('notifications').where('employee_id', '==', employee_id).where('is_read', '==', False).stream()
-    for notif in notifs_ref:
-        notif.reference.update({'is_read': True})
+    _mark_read([notif.reference for notif in notifs_ref], employee_id, 'unread_notifications')
 
 # ========== JOB REQUESTS ==========
 def add_job_request(user_id, title, description, category, location, budget):
@@ -499,7 +619,8 @@ def get_messages(employee_id, company_id):
 def send_message(sender_id, sender_type, receiver_id, receiver_type, message, application_id=None):
     """Send a message."""
     msg_ref = db.collection('messages').document()
-    msg_ref.set({
+    batch = db.batch()
+    batch.set(msg_ref, {
         'sender_id': sender_id,
         'sender_type': sender_type,
         'receiver_id': receiver_id,
@@ -510,20 +631,27 @@ def send_message(sender_id, sender_type, receiver_id, receiver_type, message, ap
         'attachment_path': None,
         'created_at': firestore.SERVER_TIMESTAMP
     })
+    if receiver_type == 'employee':
+        _bump_summary(batch, receiver_id, unread_messages=1)
+    batch.commit()
+    query_cache.invalidate(f"messages:{sender_id}", f"messages:{receiver_id}")
 
 def mark_messages_read(employee_id, company_id):
     """Mark all messages from company to employee as read."""
     msgs_ref = db.collection('messages').where('sender_id', '==', company_id).where('receiver_id', '==', employee_id).where('is_read', '==', False).stream()
-    for msg in msgs_ref:
-        msg.reference.update({'is_read': True})
+    _mark_read([msg.reference for msg in msgs_ref], employee_id, 'unread_messages')
+    query_cache.invalidate(f"messages:{employee_id}")
 
 # ========== ANALYTICS ==========
 def get_application_stats(employee_id):
     """Get count of applications per status."""
-    stats = {}
     apps_ref = db.collection('applications').where('employee_id', '==', employee_id).stream()
-    for app in apps_ref:
-        status = app.to_dict().get('status')
+    return status_counts(app.to_dict() for app in apps_ref)
+
+def status_counts(app_datas):
+    stats = {}
+    for data in app_datas:
+        status = data.get('status')
         stats[status] = stats.get(status, 0) + 1
     return [(status, count) for status, count in stats.items()]
 
@@ -531,9 +659,12 @@ def get_applications_over_time(employee_id):
     """Get applications per date."""
     # Simple implementation: fetch all and group by date
     apps_ref = db.collection('applications').where('employee_id', '==', employee_id).stream()
+    return counts_per_day(app.to_dict() for app in apps_ref)
+
+def counts_per_day(app_datas):
     dates = {}
-    for app in apps_ref:
-        date_str = app.to_dict().get('applied_at').strftime('%Y-%m-%d')
+    for data in app_datas:
+        date_str = data.get('applied_at').strftime('%Y-%m-%d')
         dates[date_str] = dates.get(date_str, 0) + 1
     return [(date, count) for date, count in sorted(dates.items())]
 
@@ -546,6 +677,109 @@ def get_interview_count(employee_id):
     
     return len(list(interviews_ref))
 
+# ========== DASHBOARD SUMMARY ==========
+# dashboard_summary/<employee_id> holds the employee header counters so a
+# dashboard rerun costs one document read. Writers update it in the same
+# batch/transaction as the change itself; a document that was never built
+# from the source collections (no 'built_at') is rebuilt on first read.
+def _summary_ref(employee_id):
+    return db.collection('dashboard_summary').document(employee_id)
+
+def _bump_summary(writer, employee_id, statuses=None, **deltas):
+    """Queue counter increments on a batch or transaction."""
+    update = {k: firestore.Increment(v) for k, v in deltas.items() if v}
+    status_deltas = {k: firestore.Increment(v) for k, v in (statuses or {}).items() if k and v}
+    if status_deltas:
+        update['status_counts'] = status_deltas
+    if update:
+        update['updated_at'] = firestore.SERVER_TIMESTAMP
+        writer.set(_summary_ref(employee_id), update, merge=True)
+
+def _mark_read(refs, employee_id, counter):
+    """
+    Set is_read on the given docs and decrement the matching summary counter
+    by the number that were still unread, re-read inside a transaction so
+    concurrent calls cannot both count the same document.
+    """
+    @firestore.transactional
+    def _mark(transaction, chunk):
+        unread = [snap.reference for snap in db.get_all(chunk, transaction=transaction)
+                  if snap.exists and not snap.to_dict().get('is_read')]
+        for ref in unread:
+            transaction.update(ref, {'is_read': True})
+        _bump_summary(transaction, employee_id, **{counter: -len(unread)})
+
+    for start in range(0, len(refs), 400):  # stay under the 500 writes per transaction limit
+        _mark(db.transaction(), refs[start:start + 400])
+
+def rebuild_dashboard_summary(employee_id):
+    """
+    Recompute an employee's summary from the source collections. The counts
+    and the write share one transaction that also reads the summary document,
+    so an increment committed in between makes it retry instead of being
+    overwritten.
+    """
+    if not employee_id:
+        return None
+
+    @firestore.transactional
+    def _rebuild(transaction):
+        _summary_ref(employee_id).get(transaction=transaction)
+
+        def count(query):
+            return sum(1 for _ in query.stream(transaction=transaction))
+
+        status_counts = {}
+        for app in db.collection('applications').where('employee_id', '==', employee_id).stream(transaction=transaction):
+            status = app.to_dict().get('status')
+            status_counts[status] = status_counts.get(status, 0) + 1
+        summary = {
+            'total_applications': sum(status_counts.values()),
+            'status_counts': {k: v for k, v in status_counts.items() if k},
+            'scheduled_interviews': count(db.collection('interviews')
+                                          .where('employee_id', '==', employee_id)
+                                          .where('status', '==', 'scheduled')),
+            'saved_jobs': count(db.collection('saved_jobs').where('employee_id', '==', employee_id)),
+            'unread_messages': count(db.collection('messages')
+                                     .where('receiver_id', '==', employee_id)
+                                     .where('receiver_type', '==', 'employee')
+                                     .where('is_read', '==', False)),
+            'unread_notifications': count(db.collection('notifications')
+                                          .where('employee_id', '==', employee_id)
+                                          .where('is_read', '==', False)),
+            'built_at': firestore.SERVER_TIMESTAMP,
+            'updated_at': firestore.SERVER_TIMESTAMP
+        }
+        transaction.set(_summary_ref(employee_id), summary)
+        return summary
+
+    return _rebuild(db.transaction())
+
+def get_dashboard_summary(employee_id):
+    """
+    Header counters for the employee dashboard (one document read):
+    total_applications, pending_applications, accepted_applications,
+    scheduled_interviews, saved_jobs, unread_messages, unread_notifications.
+    """
+    doc = _summary_ref(employee_id).get()
+    data = doc.to_dict() if doc.exists else None
+    if not data or 'built_at' not in data:
+        data = rebuild_dashboard_summary(employee_id)
+    return summary_from_doc(data)
+
+def summary_from_doc(data):
+    # Not clamped: a negative counter means a writer drifted and should show up
+    status_counts = data.get('status_counts') or {}
+    return {
+        'total_applications': data.get('total_applications', 0),
+        'pending_applications': status_counts.get('pending', 0),
+        'accepted_applications': status_counts.get('accepted', 0),
+        'scheduled_interviews': data.get('scheduled_interviews', 0),
+        'saved_jobs': data.get('saved_jobs', 0),
+        'unread_messages': data.get('unread_messages', 0),
+        'unread_notifications': data.get('unread_notifications', 0)
+    }
+
 def is_receiving_alerts(employee_id):
     """Check if employee has job alerts enabled."""
     profile_ref = db.collection('employee_profiles').document(employee_id).get()
@@ -596,43 +830,49 @@ def update_company_profile(company_id, **kwargs):
     """Update company details."""
     kwargs['updated_at'] = firestore.SERVER_TIMESTAMP
     db.collection('companies').document(company_id).update(kwargs)
+    doc_cache.invalidate('companies', company_id)
+    query_cache.clear()  # company names appear in every user's lists
 
 def get_applications_for_company(company_id):
     """Get all applications for jobs posted by this company."""
     # First get all jobs for this company
     jobs_ref = db.collection('jobs').where('company_id', '==', company_id).stream()
-    job_ids = [job.id for job in jobs_ref]
+    job_titles = {job.id: job.to_dict().get('title') for job in jobs_ref}
+    app_docs = query_in('applications', 'job_id', job_titles.keys())
+    # Applicants, profiles and interviews in a few batched reads (no profile writes)
+    employee_ids = [app.to_dict().get('employee_id') for app in app_docs]
+    users = get_cached_docs('users', employee_ids)
+    profiles = get_profiles(employee_ids)
+    interviews = {}
+    for interview in query_in('interviews', 'application_id', [app.id for app in app_docs]):
+        int_data = interview.to_dict()
+        interviews.setdefault(int_data.get('application_id'), int_data)
     apps = []
-    for job_id in job_ids:
-        apps_ref = db.collection('applications').where('job_id', '==', job_id).stream()
-        for app in apps_ref:
+    apps_by_job = {}
+    for app in app_docs:
+        apps_by_job.setdefault(app.to_dict().get('job_id'), []).append(app)
+    for job_id in job_titles:
+        for app in apps_by_job.get(job_id, []):
             app_data = app.to_dict()
             app_data['id'] = app.id
-            # Get applicant details
-            user_doc = db.collection('users').document(app_data['employee_id']).get()
-            applicant_name = user_doc.to_dict().get('name') if user_doc.exists else ''
-            applicant_email = user_doc.to_dict().get('email') if user_doc.exists else ''
-            # Get profile
-            profile = get_or_create_profile(app_data['employee_id'])
+            # Applicant details
+            user_data = users.get(app_data['employee_id'])
+            applicant_name = user_data.get('name') if user_data else ''
+            applicant_email = user_data.get('email') if user_data else ''
+            # Profile
+            profile = profiles.get(app_data['employee_id'])
             skills = profile[5] if profile else ''
             resume_path = profile[4] if profile else ''
             location = profile[2] if profile else ''
             phone = profile[1] if profile else ''
-            # Check if interview exists
-            interview_ref = db.collection('interviews').where('application_id', '==', app.id).limit(1).get()
-            has_interview = 1 if len(list(interview_ref)) > 0 else 0
-            interview = next(iter(interview_ref), None)
-            scheduled_date = None
-            interview_status = None
-            meeting_link = None
-            if interview:
-                int_data = interview.to_dict()
-                scheduled_date = int_data.get('scheduled_date')
-                interview_status = int_data.get('status')
-                meeting_link = int_data.get('meeting_link')
-            # Get job title
-            job_doc = db.collection('jobs').document(job_id).get()
-            job_title = job_doc.to_dict().get('title') if job_doc.exists else ''
+            # Interview
+            int_data = interviews.get(app.id)
+            has_interview = 1 if int_data else 0
+            int_data = int_data or {}
+            scheduled_date = int_data.get('scheduled_date')
+            interview_status = int_data.get('status')
+            meeting_link = int_data.get('meeting_link')
+            job_title = job_titles[job_id] or ''
             apps.append((
                 app.id,
                 app_data.get('employee_id'),
@@ -659,15 +899,28 @@ def get_applications_for_company(company_id):
 
 def update_application_status(application_id, status):
     """Update application status."""
-    db.collection('applications').document(application_id).update({
-        'status': status,
-        'updated_at': firestore.SERVER_TIMESTAMP
-    })
+    app_ref = db.collection('applications').document(application_id)
+
+    @firestore.transactional
+    def _update(transaction):
+        snap = app_ref.get(transaction=transaction)
+        old = snap.to_dict() if snap.exists else {}
+        transaction.update(app_ref, {
+            'status': status,
+            'updated_at': firestore.SERVER_TIMESTAMP
+        })
+        if old.get('employee_id') and old.get('status') != status:
+            _bump_summary(transaction, old['employee_id'], statuses={old.get('status'): -1, status: 1})
+        return old.get('employee_id')
+
+    employee_id = _update(db.transaction())
+    query_cache.invalidate(f"applications:{employee_id}")
 
 def create_interview(application_id, employee_id, company_id, job_id, scheduled_date, interview_type, meeting_link):
     """Create a new interview."""
     interview_ref = db.collection('interviews').document()
-    interview_ref.set({
+    batch = db.batch()
+    batch.set(interview_ref, {
         'application_id': application_id,
         'employee_id': employee_id,
         'company_id': company_id,
@@ -678,18 +931,26 @@ def create_interview(application_id, employee_id, company_id, job_id, scheduled_
         'status': 'scheduled',
         'created_at': firestore.SERVER_TIMESTAMP
     })
+    _bump_summary(batch, employee_id, scheduled_interviews=1)
+    batch.commit()
+    query_cache.invalidate(f"applications:{employee_id}")
 
 def upsert_interview(application_id, employee_id, company_id, job_id, scheduled_date, interview_type, meeting_link):
     """Insert or update interview."""
     interview_ref = db.collection('interviews').where('application_id', '==', application_id).limit(1).get()
     interview = next(iter(interview_ref), None)
     if interview:
-        interview.reference.update({
+        batch = db.batch()
+        batch.update(interview.reference, {
             'scheduled_date': scheduled_date,
             'interview_type': interview_type,
             'meeting_link': meeting_link,
             'status': 'scheduled'
         })
+        if interview.to_dict().get('status') != 'scheduled':
+            _bump_summary(batch, employee_id, scheduled_interviews=1)
+        batch.commit()
+        query_cache.invalidate(f"applications:{employee_id}")
     else:
         create_interview(application_id, employee_id, company_id, job_id, scheduled_date, interview_type, meeting_link)
 
@@ -704,26 +965,43 @@ def mark_expired_interviews():
                    .where('status', 'in', ['scheduled', 'interview']) \
                    .stream()
     
+    @firestore.transactional
+    def _expire(transaction, ref):
+        # Re-read so a concurrent run does not decrement the summary twice
+        snap = ref.get(transaction=transaction)
+        data = snap.to_dict() if snap.exists else {}
+        if data.get('status') not in ('scheduled', 'interview'):
+            return False
+        transaction.update(ref, {'status': 'expired'})
+        if data.get('status') == 'scheduled' and data.get('employee_id'):
+            _bump_summary(transaction, data['employee_id'], scheduled_interviews=-1)
+        return True
+
     for doc in interviews:
         data = doc.to_dict()
         scheduled_date = data.get('scheduled_date')
         
         if scheduled_date and scheduled_date <= now_utc:
             # Update status to expired
-            doc.reference.update({'status': 'expired'})
-            print(f"Interview {doc.id} marked as expired")
+            if _expire(db.transaction(), doc.reference):
+                query_cache.invalidate(f"applications:{data.get('employee_id')}")
+                print(f"Interview {doc.id} marked as expired")
 
 def get_all_open_job_requests():
     """Get all open job requests with employee details."""
     reqs_ref = db.collection('job_requests').where('status', '==', 'open').order_by('created_at', direction=firestore.Query.DESCENDING).stream()
+    reqs_ref = list(reqs_ref)
+    user_ids = [req.to_dict().get('user_id') for req in reqs_ref]
+    users = get_cached_docs('users', user_ids)
+    profiles = get_profiles(user_ids)
     reqs = []
     for req in reqs_ref:
         data = req.to_dict()
         data['id'] = req.id
-        user_doc = db.collection('users').document(data['user_id']).get()
-        employee_name = user_doc.to_dict().get('name') if user_doc.exists else ''
-        employee_email = user_doc.to_dict().get('email') if user_doc.exists else ''
-        profile = get_or_create_profile(data['user_id'])
+        user_data = users.get(data['user_id'])
+        employee_name = user_data.get('name') if user_data else ''
+        employee_email = user_data.get('email') if user_data else ''
+        profile = profiles.get(data['user_id'])
         skills = profile[5] if profile else ''
         resume_path = profile[4] if profile else ''
         location = profile[2] if profile else ''
@@ -774,6 +1052,7 @@ def mark_company_messages_read(company_id, employee_id):
     msgs_ref = db.collection('messages').where('sender_id', '==', employee_id).where('receiver_id', '==', company_id).where('is_read', '==', False).stream()
     for msg in msgs_ref:
         msg.reference.update({'is_read': True})
+    query_cache.invalidate(f"messages:{employee_id}")
 
 def get_job_count_for_company(company_id):
     """Get count of active jobs for a company."""
@@ -816,6 +1095,7 @@ def create_company_for_employer(user_id, company_name, email):
     company_id = company_ref.id
     # Link to user (update user document)
     db.collection('users').document(email).update({'company_id': company_id})
+    doc_cache.invalidate('users', email)
     return company_id
 
 def add_job(company_id, company_name, title, category, description, requirements,
@@ -840,7 +1120,9 @@ def add_job(company_id, company_name, title, category, description, requirements
         'created_at': firestore.SERVER_TIMESTAMP,
         'deadline': deadline
     })
+    query_cache.invalidate('jobs')
 
+@cached('messages:{employee_id}')
 def get_conversations(employee_id):
     """
     Get all conversations for an employee with last message and unread count.
@@ -871,8 +1153,8 @@ def get_conversations(employee_id):
 
         if company_id not in convos:
             # Get company name
-            company_doc = db.collection('companies').document(company_id).get()
-            company_name = company_doc.to_dict().get('name', '') if company_doc.exists else ''
+            company = get_cached_doc('companies', company_id)
+            company_name = company.get('name', '') if company else ''
             # Get job title from application if available
             job_title = ''
             if msg.get('application_id'):
@@ -880,9 +1162,9 @@ def get_conversations(employee_id):
                 if app_doc.exists:
                     job_id = app_doc.to_dict().get('job_id')
                     if job_id:
-                        job_doc = db.collection('jobs').document(job_id).get()
-                        if job_doc.exists:
-                            job_title = job_doc.to_dict().get('title', '')
+                        job = get_cached_doc('jobs', job_id)
+                        if job:
+                            job_title = job.get('title', '')
             convos[company_id] = {
                 'company_id': company_id,
                 'company_name': company_name,
@@ -961,8 +1243,8 @@ def get_company_conversations(company_id):
 
         if employee_id not in convos:
             # Get employee name
-            user_doc = db.collection('users').document(employee_id).get()
-            employee_name = user_doc.to_dict().get('name', '') if user_doc.exists else ''
+            user = get_cached_doc('users', employee_id)
+            employee_name = user.get('name', '') if user else ''
             convos[employee_id] = {
                 'employee_id': employee_id,
                 'employee_name': employee_name,
@@ -1000,6 +1282,8 @@ def update_expired_jobs():
     jobs_ref = db.collection('jobs').where('status', '==', 'active').where('deadline', '<', now).stream()
     for job in jobs_ref:
         job.reference.update({'status': 'expired'})
+        doc_cache.invalidate('jobs', job.id)
+        query_cache.invalidate('jobs')
 
 def get_company_jobs_all(company_id):
     """Get all jobs for a company (for management)."""
@@ -1013,6 +1297,7 @@ def get_company_jobs_all(company_id):
 
 def delete_job(job_id):
     """Delete a job and related data, but keep accepted/rejected applications."""
+    affected = set()
     # Get all applications for this job
     apps = db.collection('applications').where('job_id', '==', job_id).stream()
     for app in apps:
@@ -1021,6 +1306,7 @@ def delete_job(job_id):
         # If status is accepted or rejected, keep application and its related data
         if status in ['accepted', 'rejected']:
             continue
+        affected.add(app_data.get('employee_id'))
         # Otherwise, delete interviews and messages for this application
         interviews = db.collection('interviews').where('application_id', '==', app.id).stream()
         for iv in interviews:
@@ -1034,15 +1320,21 @@ def delete_job(job_id):
     # Delete saved jobs (bookmarks, always removed)
     saved = db.collection('saved_jobs').where('job_id', '==', job_id).stream()
     for s in saved:
+        affected.add(s.to_dict().get('employee_id'))
         s.reference.delete()
 
     # Delete notifications that reference this job (application/save notifications)
     notifs = db.collection('notifications').where('related_id', '==', job_id).where('type', 'in', ['application', 'save']).stream()
     for n in notifs:
+        affected.add(n.to_dict().get('employee_id'))
         n.reference.delete()
 
     # Finally, delete the job itself
     db.collection('jobs').document(job_id).delete()
+    doc_cache.invalidate('jobs', job_id)
+    query_cache.clear()  # applications, saved jobs and messages of many users went with it
+    for employee_id in affected - {None}:
+        rebuild_dashboard_summary(employee_id)
 
 def get_new_applications_count(company_id):
     """Count applications with status 'pending' (new applications)."""
@@ -1085,16 +1377,16 @@ def get_recent_activities(company_id, limit=5):
         # Get employee name from users collection
         employee_name = "Someone"
         if employee_id:
-            user_doc = db.collection('users').document(employee_id).get()
-            if user_doc.exists:
-                employee_name = user_doc.to_dict().get('name', 'Someone')
+            user = get_cached_doc('users', employee_id)
+            if user:
+                employee_name = user.get('name', 'Someone')
 
         # Get job title from jobs collection
         job_title = "a position"
         if job_id:
-            job_doc = db.collection('jobs').document(job_id).get()
-            if job_doc.exists:
-                job_title = job_doc.to_dict().get('title', 'a position')
+            job = get_cached_doc('jobs', job_id)
+            if job:
+                job_title = job.get('title', 'a position')
 
         activities.append({
             'type': 'application',
@@ -1116,9 +1408,9 @@ def get_recent_activities(company_id, limit=5):
 
         sender_name = "Someone"
         if data.get('sender_type') == 'employee' and sender_id:
-            user_doc = db.collection('users').document(sender_id).get()
-            if user_doc.exists:
-                sender_name = user_doc.to_dict().get('name', 'Someone')
+            user = get_cached_doc('users', sender_id)
+            if user:
+                sender_name = user.get('name', 'Someone')
         elif data.get('sender_type') == 'company':
             pass
 
@@ -1144,12 +1436,13 @@ def get_unread_messages_count_employee(employee_id):
 
 def get_all_users():
     """Retrieve all users with their details."""
-    users_ref = db.collection('users').stream()
+    users_ref = list(db.collection('users').stream())
+    profiles = get_profiles([doc.id for doc in users_ref])  # read-only, defaults for missing
     users = []
     for doc in users_ref:
         data = doc.to_dict()
         data['id'] = doc.id
-        profile = get_or_create_profile(doc.id)  # returns tuple
+        profile = profiles[doc.id]  # returns tuple
         # New tuple: (id, name, email, role, is_admin, created_at, phone, location, skills, resume_path)
         users.append((
             data['id'],
@@ -1174,7 +1467,7 @@ def get_user_by_id_admin(user_id):
     user_data['id'] = user_doc.id
     # Add is_admin if not present
     user_data.setdefault('is_admin', False)
-    profile = get_or_create_profile(user_id)
+    profile = get_profile(user_id)
     user_data.update({
         'phone': profile[1],
         'location': profile[2],
@@ -1196,11 +1489,19 @@ def get_user_by_id_admin(user_id):
 def update_user_role(user_id, new_role):
     """Change a user's role (employee, employer, admin)."""
     db.collection('users').document(user_id).update({'role': new_role})
+    doc_cache.invalidate('users', user_id)
 
 def delete_user(user_id):
     """Completely remove a user and all associated data."""
-    # Delete profile
-    db.collection('employee_profiles').document(user_id).delete()
+    import blobstore  # blobstore imports this module
+    # Delete profile, releasing its résumé and video blobs
+    profile_ref = db.collection('employee_profiles').document(user_id)
+    profile = profile_ref.get()
+    if profile.exists:
+        data = profile.to_dict()
+        blobstore.release(data.get('resume_path'))
+        blobstore.release(data.get('video_path'))
+    profile_ref.delete()
     # Delete applications (and cascade interviews/messages for them)
     apps = db.collection('applications').where('employee_id', '==', user_id).stream()
     for app in apps:
@@ -1232,7 +1533,10 @@ def delete_user(user_id):
         # Delete company (will cascade to its jobs etc.)
         delete_company(company_id)
     # Finally delete the user
+    db.collection('dashboard_summary').document(user_id).delete()
     db.collection('users').document(user_id).delete()
+    doc_cache.invalidate('users', user_id)
+    query_cache.clear()
 
 def add_user_admin(name, email, password_hash, role, is_admin=False):
     """Admin creates a new user (bypasses normal signup)."""
@@ -1245,9 +1549,8 @@ def add_user_admin(name, email, password_hash, role, is_admin=False):
         'is_admin': is_admin,
         'created_at': firestore.SERVER_TIMESTAMP
     })
-    # If role is employee, create empty profile
-    if role == 'employee':
-        get_or_create_profile(email)
+    doc_cache.invalidate('users', email)
+    # The employee profile is created on the employee's first visit (get_or_create_profile)
 
 def get_all_companies_admin():
     """Retrieve all companies with full details."""
@@ -1267,7 +1570,9 @@ def delete_company(company_id):
         delete_job(job.id)  # reuses existing delete_job which handles applications etc.
     # Delete messages where company is sender/receiver
     msgs_as_sender = db.collection('messages').where('sender_id', '==', company_id).where('sender_type', '==', 'company').stream()
+    recipients = set()
     for msg in msgs_as_sender:
+        recipients.add(msg.to_dict().get('receiver_id'))
         msg.reference.delete()
     msgs_as_receiver = db.collection('messages').where('receiver_id', '==', company_id).where('receiver_type', '==', 'company').stream()
     for msg in msgs_as_receiver:
@@ -1276,25 +1581,34 @@ def delete_company(company_id):
     employers = db.collection('users').where('company_id', '==', company_id).stream()
     for emp in employers:
         emp.reference.update({'company_id': None})
+        doc_cache.invalidate('users', emp.id)
     # Finally delete the company document
     db.collection('companies').document(company_id).delete()
+    doc_cache.invalidate('companies', company_id)
+    query_cache.clear()
+    for employee_id in recipients - {None}:
+        rebuild_dashboard_summary(employee_id)
 
 def update_company_admin(company_id, **kwargs):
     """Update any company field (admin version)."""
     kwargs['updated_at'] = firestore.SERVER_TIMESTAMP
     db.collection('companies').document(company_id).update(kwargs)
+    doc_cache.invalidate('companies', company_id)
+    query_cache.clear()  # company names appear in every user's lists
 
 def get_all_jobs_admin():
     """Retrieve all jobs with company name and status."""
     jobs_ref = db.collection('jobs').stream()
     jobs = []
+    jobs_ref = list(jobs_ref)
+    companies = get_cached_docs('companies', (job.to_dict().get('company_id') for job in jobs_ref))
     for job in jobs_ref:
         data = job.to_dict()
         data['id'] = job.id
         # Add company name for convenience
         if data.get('company_id'):
-            comp_doc = db.collection('companies').document(data['company_id']).get()
-            data['company_name'] = comp_doc.to_dict().get('name', '') if comp_doc.exists else ''
+            company = companies.get(data['company_id'])
+            data['company_name'] = company.get('name', '') if company else ''
         jobs.append(data)
     return jobs
 
@@ -1303,6 +1617,8 @@ def update_job_admin(job_id, **kwargs):
     if 'deadline' in kwargs and isinstance(kwargs['deadline'], dt.date) and not isinstance(kwargs['deadline'], datetime):
         kwargs['deadline'] = datetime.combine(kwargs['deadline'], datetime.min.time()).replace(tzinfo=timezone.utc)
     db.collection('jobs').document(job_id).update(kwargs)
+    doc_cache.invalidate('jobs', job_id)
+    query_cache.invalidate('jobs')
 
 def delete_application_admin(application_id):
     """Delete an application and cascade interviews/messages."""
@@ -1320,6 +1636,8 @@ def delete_application_admin(application_id):
         msg.reference.delete()
     # Delete the application
     app_doc.reference.delete()
+    rebuild_dashboard_summary(app_doc.to_dict().get('employee_id'))
+    query_cache.clear()
 
 def get_all_job_requests_admin():
     """Retrieve all job requests with employee details."""
@@ -1330,9 +1648,9 @@ def get_all_job_requests_admin():
         data['id'] = req.id
         # Add employee details
         if data.get('user_id'):
-            user_doc = db.collection('users').document(data['user_id']).get()
-            data['employee_name'] = user_doc.to_dict().get('name', '') if user_doc.exists else ''
-            data['employee_email'] = user_doc.to_dict().get('email', '') if user_doc.exists else ''
+            user = get_cached_doc('users', data['user_id'])
+            data['employee_name'] = user.get('name', '') if user else ''
+            data['employee_email'] = user.get('email', '') if user else ''
         reqs.append(data)
     return reqs
 
@@ -1381,6 +1699,7 @@ def update_is_admin(user_id, is_admin):
     """
     user_ref = db.collection('users').document(user_id)
     user_ref.update({'is_admin': is_admin})
+    doc_cache.invalidate('users', user_id)
 
 def get_users_by_role(role):
     """Get all users with a specific role."""
@@ -1420,8 +1739,8 @@ def get_recent_activities_admin(limit=20):
         # Get employee name
         emp_name = ''
         if data.get('employee_id'):
-            emp_doc = db.collection('users').document(data['employee_id']).get()
-            emp_name = emp_doc.to_dict().get('name', '') if emp_doc.exists else ''
+            emp = get_cached_doc('users', data['employee_id'])
+            emp_name = emp.get('name', '') if emp else ''
         activities.append({
             'type': 'application',
             'content': f"Application from {emp_name} for job {data.get('job_id')}",
@@ -1431,15 +1750,6 @@ def get_recent_activities_admin(limit=20):
     activities.sort(key=lambda x: x['time'] if x['time'] else datetime.min, reverse=True)
     return activities[:limit]
 
-def get_resume_download_link(resume_path, text="Download Resume"):
-    if resume_path and os.path.exists(resume_path):
-        with open(resume_path, "rb") as f:
-            bytes_data = f.read()
-        b64 = base64.b64encode(bytes_data).decode()
-        href = f'<a href="data:application/octet-stream;base64,{b64}" download="{os.path.basename(resume_path)}" class="badge badge-info">{text}</a>'
-        return href
-    return None
-
 def update_user_password(user_id, new_password_hash):
     """
     Update a user's password in Firestore.
@@ -1487,7 +1797,6 @@ def get_profile_strength(profile):
 
 def get_upcoming_interviews(user_id):
     """Fetch interviews that are scheduled and in the future."""
-    from database import db
     import datetime
     now = datetime.datetime.now(timezone.utc)
 
@@ -1506,7 +1815,6 @@ def get_upcoming_interviews(user_id):
 
 def get_recent_activities(user_id, limit=5):
     """Combine recent notifications and application updates."""
-    from database import db
     activities = []
     # Notifications
     notifs = get_user_notifications(user_id, limit=limit)
@@ -1520,4 +1828,8 @@ def get_recent_activities(user_id, limit=5):
         })
     # Sort by time desc
     activities.sort(key=lambda x: x['time'] if x['time'] else datetime.datetime.min, reverse=True)
-    return activities[:limit]
\ No newline at end of file
+    return activities[:limit]
+
+# ========== INSTRUMENTATION ==========
+# Record time, documents read and round trips of every public function per page run (see profiler.py)
+profiler.instrument(globals(), __name__)
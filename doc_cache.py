@@ -0,0 +1,107 @@
+"""
+Process-wide read-through cache for hot reference documents.
+
+Company, job and user documents are looked up again and again while a page
+renders (a company name per job, a user name per message...). This keeps
+recently read documents in memory, per collection, with a TTL and an LRU
+size bound:
+
+    DOC_CACHE_TTL_COMPANIES / _JOBS / _USERS   seconds (default 300 / 60 / 300)
+    DOC_CACHE_SIZE                             entries per collection (default 5000)
+
+Missing documents are cached too (as None). The TTL bounds staleness for
+writes made by other processes; writes made through database.py invalidate
+the entry immediately. Documents loaded while their collection was
+invalidated are returned but not stored, so an in-flight read cannot put
+back data older than the write. stats() returns hit/miss/eviction counters.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTLS = {'companies': 300, 'jobs': 60, 'users': 300}
+CACHE_SIZE = int(os.getenv("DOC_CACHE_SIZE", 5000))
+
+_caches = {}   # collection -> OrderedDict(doc_id -> (loaded_at, data or None))
+_stats = {}    # collection -> {'hits', 'misses', 'evictions', 'invalidations'}
+_versions = {}  # collection -> int, bumped on invalidation
+_lock = threading.Lock()
+
+
+def ttl_for(collection):
+    return float(os.getenv(f"DOC_CACHE_TTL_{collection.upper()}", DEFAULT_TTLS.get(collection, 60)))
+
+
+def _collection(collection):
+    if collection not in _caches:
+        _caches[collection] = OrderedDict()
+        _stats[collection] = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+    return _caches[collection], _stats[collection]
+
+
+def get_many(collection, doc_ids, loader):
+    """
+    Return {doc_id: data or None} for doc_ids. Ids not cached (or expired)
+    are fetched together with loader(ids) -> {doc_id: data}.
+    """
+    doc_ids = list(dict.fromkeys(i for i in doc_ids if i))
+    ttl = ttl_for(collection)
+    now = time.monotonic()
+    found, missing = {}, []
+    with _lock:
+        cache, stats = _collection(collection)
+        for doc_id in doc_ids:
+            entry = cache.get(doc_id)
+            if entry and now - entry[0] < ttl:
+                cache.move_to_end(doc_id)
+                found[doc_id] = entry[1]
+                stats['hits'] += 1
+            else:
+                missing.append(doc_id)
+        stats['misses'] += len(missing)
+        version = _versions.get(collection, 0)
+
+    if missing:
+        loaded = loader(missing)
+        with _lock:
+            cache, stats = _collection(collection)
+            store = _versions.get(collection, 0) == version
+            for doc_id in missing:
+                data = loaded.get(doc_id)
+                found[doc_id] = data
+                if store:
+                    cache[doc_id] = (now, data)
+                    cache.move_to_end(doc_id)
+            while len(cache) > CACHE_SIZE:
+                cache.popitem(last=False)
+                stats['evictions'] += 1
+    # Callers add keys (e.g. 'id') to the dicts they get back
+    return {doc_id: dict(data) if data is not None else None for doc_id, data in found.items()}
+
+
+def get(collection, doc_id, loader):
+    return get_many(collection, [doc_id], loader).get(doc_id)
+
+
+def invalidate(collection, doc_id=None):
+    """Drop one document (or the whole collection) from the cache."""
+    with _lock:
+        cache, stats = _collection(collection)
+        if doc_id is None:
+            cache.clear()
+        else:
+            cache.pop(doc_id, None)
+        _versions[collection] = _versions.get(collection, 0) + 1
+        stats['invalidations'] += 1
+
+
+def stats():
+    """{collection: {'hits', 'misses', 'evictions', 'invalidations', 'size', 'hit_rate'}}"""
+    with _lock:
+        result = {}
+        for collection, counters in _stats.items():
+            lookups = counters['hits'] + counters['misses']
+            result[collection] = dict(counters, size=len(_caches[collection]),
+                                      hit_rate=round(counters['hits'] / lookups, 3) if lookups else 0.0)
+        return result
@@ -0,0 +1,47 @@
+"""
+Résumé downloads.
+
+Résumés are blobstore references (or legacy file paths). Pages render a
+download button per résumé, but the file is only read when that button is
+clicked: st.download_button receives a callable, so the page itself
+carries no file bytes however many applicants are on screen.
+Streamlit versions without deferred download data get a two-step button
+(click to load, click to save) instead.
+"""
+import hashlib
+import mimetypes
+import streamlit as st
+import blobstore
+
+
+def _widget_key(resume_path, key):
+    if key:
+        return f"resume_dl_{key}"
+    return "resume_dl_" + hashlib.sha1(resume_path.encode("utf-8")).hexdigest()[:12]
+
+
+def resume_download_button(resume_path, label="Download Resume", key=None):
+    """
+    Show a download button for a stored résumé; returns False (and renders
+    nothing) if the file is missing. Pass `key` when the same résumé can
+    appear more than once on a page.
+    """
+    if not resume_path or not blobstore.exists(resume_path):
+        return False
+
+    file_name = blobstore.file_name(resume_path)
+    mime = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+    widget_key = _widget_key(resume_path, key)
+    try:
+        st.download_button(label, data=lambda: blobstore.read(resume_path), file_name=file_name,
+                           mime=mime, key=widget_key, on_click="ignore")
+    except Exception:
+        # Older Streamlit: no callable data. Load the file only after a first click.
+        loaded_key = f"{widget_key}_loaded"
+        if st.session_state.get(loaded_key):
+            st.download_button(label, data=blobstore.read(resume_path), file_name=file_name,
+                               mime=mime, key=f"{widget_key}_file")
+        elif st.button(label, key=f"{widget_key}_prepare"):
+            st.session_state[loaded_key] = True
+            st.rerun()
+    return True
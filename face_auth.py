@@ -0,0 +1,344 @@
+import os
+import streamlit as st
+import face_service
+import face_embeddings
+import face_index
+from face_detection import face_candidates, ALIGN_DETECTOR
+
+# DeepFace (TensorFlow) runs in the face_service worker process; this process
+# only loads it if the worker cannot be started. OpenCV (for the fast detection
+# pass) is imported on the first processed photo.
+
+# from insightface.app import FaceAnalysis
+# import mediapipe as mp
+# from mediapipe.tasks import python
+# from mediapipe.tasks.python import vision
+# from modelDownload import download_model
+
+
+# -------------------------------------------------------------------
+# Helper: Check if user has a registered face (embedding exists)
+# -------------------------------------------------------------------
+def has_face_registered(email):
+    """Return True if a face embedding exists for this email."""
+    return face_embeddings.get_embedding(email) is not None
+
+# ===== OLD FACE FUNCTIONS (keep intact) =====
+# def capture_face(email):
+#     """
+#     Capture face from browser camera and store in Firestore as Base64.
+#     Returns True if face detected and saved.
+#     """
+#     import streamlit as st
+
+#     st.info("📸 Please capture your face for registration")
+
+#     # Persist camera input across reruns
+#     if "reg_face" not in st.session_state:
+#         st.session_state.reg_face = None
+
+#     img_file = st.camera_input("Take a photo", key="register_camera")
+
+#     if img_file is not None:
+#         st.session_state.reg_face = img_file
+
+#     if st.session_state.reg_face is None:
+#         return False  # No photo captured yet
+
+#     # Convert to OpenCV format
+#     bytes_data = st.session_state.reg_face.getvalue()
+#     np_arr = np.frombuffer(bytes_data, np.uint8)
+#     frame = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
+
+#     if frame is None:
+#         st.error("Could not process image")
+#         return False
+
+#     gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+#     face_cascade = cv2.CascadeClassifier(
+#         cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+#     )
+
+#     faces = face_cascade.detectMultiScale(gray, 1.3, 5)
+
+#     if len(faces) == 0:
+#         st.error("No face detected. Make sure you are in good lighting and try again.")
+#         return False
+
+#     # Take the first detected face
+#     x, y, w, h = faces[0]
+#     face = gray[y:y+h, x:x+w]
+#     face = cv2.resize(face, (200, 200))
+
+#     # Encode face as JPEG bytes
+#     ret, buffer = cv2.imencode('.jpg', face)
+#     if not ret:
+#         st.error("Failed to encode face image")
+#         return False
+
+#     # Convert to Base64 string
+#     face_base64 = base64.b64encode(buffer.tobytes()).decode('utf-8')
+
+#     # Store in Firestore (faces collection, document ID = email)
+#     db.collection('faces').document(email).set({
+#         'image': face_base64,
+#         'uploaded_at': firestore.SERVER_TIMESTAMP
+#     })
+
+#     st.success("✅ Face captured and saved successfully!")
+#     st.session_state.reg_face = None
+#     return True
+
+# def verify_face(email):
+#     """
+#     Capture a new face and compare with stored face from Firestore.
+#     Returns True if matched.
+#     """
+#     import streamlit as st
+
+#     # Retrieve stored face from Firestore
+#     face_doc = db.collection('faces').document(email).get()
+#     if not face_doc.exists:
+#         st.error("No registered face found. Please register first.")
+#         return False
+
+#     stored_base64 = face_doc.to_dict().get('image')
+#     if not stored_base64:
+#         st.error("Stored face data is missing.")
+#         return False
+
+#     # Decode Base64 to image
+#     stored_bytes = base64.b64decode(stored_base64)
+#     np_arr_stored = np.frombuffer(stored_bytes, np.uint8)
+#     stored_face = cv2.imdecode(np_arr_stored, cv2.IMREAD_GRAYSCALE)
+
+#     if stored_face is None:
+#         st.error("Stored face image is corrupted.")
+#         return False
+
+#     # Persist camera input across reruns
+#     if "verify_face_img" not in st.session_state:
+#         st.session_state.verify_face_img = None
+
+#     img_file = st.camera_input("Take a photo", key="verify_camera")
+
+#     if img_file is not None:
+#         st.session_state.verify_face_img = img_file
+
+#     if st.session_state.verify_face_img is None:
+#         st.info("📸 Please take a photo to continue.")
+#         return False
+
+#     # Convert to OpenCV format
+#     bytes_data = st.session_state.verify_face_img.getvalue()
+#     np_arr = np.frombuffer(bytes_data, np.uint8)
+#     frame = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
+
+#     if frame is None:
+#         st.error("Could not process image")
+#         return False
+
+#     gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+#     face_cascade = cv2.CascadeClassifier(
+#         cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+#     )
+
+#     faces = face_cascade.detectMultiScale(gray, 1.3, 5)
+
+#     if len(faces) == 0:
+#         st.error("Face not detected. Make sure you are in good lighting.")
+#         return False
+
+#     # Take the first detected face
+#     x, y, w, h = faces[0]
+#     face = gray[y:y+h, x:x+w]
+#     face = cv2.resize(face, (200, 200))
+
+#     # Compare with stored face
+#     diff = cv2.absdiff(stored_face, face)
+#     score = np.mean(diff)
+#     st.write(f"Face difference score: {score:.2f}")
+
+#     if score < 50:  # threshold can be tuned
+#         st.success("✅ Face verified successfully!")
+#         st.session_state.verify_face_img = None
+#         return True
+#     else:
+#         st.error("❌ Face does not match the registered one.")
+#         st.session_state.verify_face_img = None
+#         return False
+
+# Embedding model and cosine similarity threshold (higher is stricter).
+# Pick both with benchmarks/face_benchmark.py on your own photos.
+MODEL_NAME = face_service.FACE_MODEL  # FACE_MODEL, default Facenet512
+SIMILARITY_THRESHOLD = float(os.getenv("FACE_SIMILARITY_THRESHOLD", 0.6))
+# Face-only login (1:N identification against every registered face)
+FACE_IDENTIFICATION_ENABLED = os.getenv("FACE_IDENTIFICATION_ENABLED", "0") == "1"
+IDENTIFY_MARGIN = float(os.getenv("FACE_IDENTIFY_MARGIN", 0.05))  # best match must beat the runner-up by this much
+
+def _embed_photo(bytes_data, model_name, detector_backend=ALIGN_DETECTOR):
+    """
+    Embed the face in a camera photo. The Haar face region is tried first;
+    if the detector finds nothing there (a cascade false positive) the whole
+    downscaled frame is used. Raises ValueError when no face is found.
+    """
+    candidates = face_candidates(bytes_data)
+    for i, image in enumerate(candidates):
+        try:
+            return face_service.represent(
+                image,
+                model_name=model_name,
+                detector_backend=detector_backend,
+                enforce_detection=True
+            )
+        except ValueError:
+            if i == len(candidates) - 1:
+                raise
+
+
+def capture_face(email):
+    """Capture and store face embedding using DeepFace (MODEL_NAME)"""
+    st.info("📸 Please capture your face for registration")
+    face_service.get_face_service()  # start loading models while the user poses
+    
+    if "reg_face" not in st.session_state:
+        st.session_state.reg_face = None
+    
+    img_file = st.camera_input("Take a photo", key="register_camera")
+    if img_file is not None:
+        st.session_state.reg_face = img_file
+    
+    if st.session_state.reg_face is None:
+        return False
+    
+    bytes_data = st.session_state.reg_face.getvalue()
+    
+    try:
+        # Fast Haar pass narrows the frame; RetinaFace detects and aligns in the shared worker
+        embeddings = _embed_photo(bytes_data, MODEL_NAME)
+        
+        if not embeddings:
+            st.error("No face detected. Please try again.")
+            return False
+        
+        # Optional: if multiple faces, take the largest (you could also error)
+        if len(embeddings) > 1:
+            st.warning("Multiple faces detected. Using the largest one.")
+            # One embedding per detected face; the first is the largest
+        
+        embedding = embeddings[0]
+        
+        # Store in Firestore as packed float32 (also refreshes the local cache)
+        record = face_embeddings.save_embedding(email, embedding, MODEL_NAME, ALIGN_DETECTOR)
+        face_index.note_registration(email, record['vector'], MODEL_NAME)
+        
+        st.success("✅ Face registered successfully!")
+        return True
+        
+    except Exception as e:
+        st.error(f"Face detection failed: {str(e)}")
+        return False
+
+
+def verify_face(email):
+    """Verify face using DeepFace comparison with stricter threshold."""
+    # Retrieve stored embedding (cached across reruns)
+    stored = face_embeddings.get_embedding(email)
+    if stored is None:
+        st.error("No registered face found. Please register first.")
+        return False
+    
+    stored_model = stored['model'] or MODEL_NAME
+    
+    if stored['vector'] is None:
+        st.error("Stored face data is corrupted.")
+        return False
+    
+    # Capture new face
+    face_service.get_face_service()  # start loading models while the user poses
+    if "verify_img" not in st.session_state:
+        st.session_state.verify_img = None
+    
+    img_file = st.camera_input("Take a photo", key="verify_camera")
+    if img_file is not None:
+        st.session_state.verify_img = img_file
+    
+    if st.session_state.verify_img is None:
+        st.info("📸 Please take a photo")
+        return False
+    
+    bytes_data = st.session_state.verify_img.getvalue()
+    
+    try:
+        # Same detector and model the stored embedding was made with
+        new_embeddings = _embed_photo(bytes_data, stored_model, stored['detector'])
+        
+        if not new_embeddings:
+            st.error("No face detected in the new image.")
+            return False
+        
+        new_embedding = new_embeddings[0]
+        
+        # Calculate cosine similarity
+        similarity = face_embeddings.cosine_similarity(stored, new_embedding)
+        
+        threshold = SIMILARITY_THRESHOLD
+        
+        st.write(f"Similarity score: {similarity:.3f} (threshold: {threshold})")
+        
+        if similarity >= threshold:
+            st.success("✅ Face verified successfully!")
+            return True
+        else:
+            st.error("❌ Face does not match the registered one.")
+            return False
+            
+    except Exception as e:
+        st.error(f"Verification failed: {str(e)}")
+        return False
+
+
+def identify_face():
+    """
+    Identify the user from a photo alone (no email).
+    Returns the matched email, or None if nobody matches clearly enough.
+    """
+    face_service.get_face_service()  # start loading models while the user poses
+    if "identify_img" not in st.session_state:
+        st.session_state.identify_img = None
+    
+    img_file = st.camera_input("Take a photo", key="identify_camera")
+    if img_file is not None:
+        st.session_state.identify_img = img_file
+    
+    if st.session_state.identify_img is None:
+        st.info("📸 Please take a photo")
+        return None
+    
+    bytes_data = st.session_state.identify_img.getvalue()
+    
+    try:
+        embeddings = _embed_photo(bytes_data, MODEL_NAME)
+        
+        if not embeddings:
+            st.error("No face detected. Please try again.")
+            return None
+        
+        matches = face_index.get_face_index(MODEL_NAME).search(embeddings[0], k=2)
+        if not matches:
+            st.error("No registered faces found.")
+            return None
+        
+        best_email, best_score = matches[0]
+        runner_up = matches[1][1] if len(matches) > 1 else -1.0
+        
+        # 1:N needs a clear winner, not just a score above the 1:1 threshold
+        if best_score >= SIMILARITY_THRESHOLD and best_score - runner_up >= IDENTIFY_MARGIN:
+            return best_email
+        
+        st.error("❌ Face not recognised. Please log in with your email instead.")
+        return None
+    
+    except Exception as e:
+        st.error(f"Identification failed: {str(e)}")
+        return None
@@ -0,0 +1,108 @@
+"""
+Tiered face detection for camera frames.
+
+1. Downscale the frame so its longest side is at most FACE_DETECT_MAX_SIDE.
+2. Run OpenCV's Haar cascade (milliseconds on CPU) on the small frame.
+3. If it finds one confident face, crop the region around it from the
+   full-resolution frame. RetinaFace then runs on that small crop, which is
+   fast, and still detects and aligns the face exactly as it does on a full
+   frame. If it finds no face there (a cascade false positive) the caller
+   moves on to the downscaled frame.
+4. Otherwise hand the downscaled frame to RetinaFace.
+
+Every path ends in the same detector and alignment (ALIGN_DETECTOR), so the
+embeddings are comparable with each other and with older enrollments, which
+were all made by RetinaFace on the whole frame.
+
+OpenCV is imported lazily, like the rest of the face stack.
+"""
+import os
+
+FACE_DETECT_MAX_SIDE = int(os.getenv("FACE_DETECT_MAX_SIDE", 640))
+HAAR_MIN_WEIGHT = float(os.getenv("FACE_HAAR_MIN_WEIGHT", 3.0))   # cascade level weight; higher is stricter
+HAAR_MIN_FACE_RATIO = 0.15   # ignore faces narrower than 15% of the frame (background people, posters)
+CROP_MARGIN = 0.5            # context around the Haar box so RetinaFace can find and align the face
+ALIGN_DETECTOR = "retinaface"
+
+_cascade = None
+
+
+def _get_cascade():
+    """Haar cascade, or None on OpenCV builds without it (the cascade then always falls back)."""
+    global _cascade
+    import cv2
+    if _cascade is None:
+        if not hasattr(cv2, "CascadeClassifier"):
+            return None
+        _cascade = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
+    return _cascade
+
+
+def decode_image(bytes_data):
+    """Decode camera bytes into a BGR frame (None if unreadable)."""
+    import cv2
+    import numpy as np
+    return cv2.imdecode(np.frombuffer(bytes_data, np.uint8), cv2.IMREAD_COLOR)
+
+
+def downscale(frame, max_side=FACE_DETECT_MAX_SIDE):
+    """Resize so the longest side is at most max_side. Returns (small_frame, scale)."""
+    import cv2
+    h, w = frame.shape[:2]
+    scale = min(1.0, max_side / max(h, w))
+    if scale == 1.0:
+        return frame, 1.0
+    small = cv2.resize(frame, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+    return small, scale
+
+
+def detect_fast(small):
+    """
+    Haar cascade pass. Returns (x, y, w, h, weight) of the largest face in
+    `small` coordinates, or None when no face passes the size/confidence bar.
+    """
+    import cv2
+    cascade = _get_cascade()
+    if cascade is None:
+        return None
+    gray = cv2.equalizeHist(cv2.cvtColor(small, cv2.COLOR_BGR2GRAY))
+    min_side = int(min(gray.shape[:2]) * HAAR_MIN_FACE_RATIO)
+    rects, _, weights = cascade.detectMultiScale3(
+        gray, scaleFactor=1.1, minNeighbors=5, minSize=(min_side, min_side), outputRejectLevels=True
+    )
+    if len(rects) == 0:
+        return None
+    best = max(range(len(rects)), key=lambda i: rects[i][2] * rects[i][3])
+    weight = float(weights[best])
+    if weight < HAAR_MIN_WEIGHT:
+        return None
+    x, y, w, h = (int(v) for v in rects[best])
+    return x, y, w, h, weight
+
+
+def crop_face(frame, box, scale, margin=CROP_MARGIN):
+    """Crop a box found on the downscaled frame out of the full-resolution frame."""
+    x, y, w, h = (v / scale for v in box[:4])
+    mx, my = w * margin, h * margin
+    H, W = frame.shape[:2]
+    x0, y0 = max(0, int(x - mx)), max(0, int(y - my))
+    x1, y1 = min(W, int(x + w + mx)), min(H, int(y + h + my))
+    return frame[y0:y1, x0:x1].copy()
+
+
+def face_candidates(bytes_data):
+    """
+    Run the cascade on camera bytes.
+    Returns the images to embed with detector_backend=ALIGN_DETECTOR, in order:
+      - [face_region, downscaled_frame] when the fast detector found a confident face;
+      - [downscaled_frame] otherwise.
+    Raises ValueError if the bytes are not an image.
+    """
+    frame = decode_image(bytes_data)
+    if frame is None:
+        raise ValueError("Could not process image")
+    small, scale = downscale(frame)
+    box = detect_fast(small)
+    if box is not None:
+        return [crop_face(frame, box, scale), small]
+    return [small]
@@ -0,0 +1,111 @@
+"""
+Compact storage and fast comparison of face embeddings.
+
+Embeddings are stored in `faces/<email>` as packed little-endian float32
+bytes ('embedding_f32') with their L2 norm precomputed at write time
+('embedding_norm'). Decoded vectors are kept in a small in-process LRU cache
+so verifying a returning user is a dictionary lookup plus one dot product.
+Documents written before this format (a plain 'embedding' list of doubles)
+are still read.
+
+Each document also records the detector that found and aligned the face
+('detector'); embeddings are only comparable when made the same way.
+Documents without it were all made by RetinaFace.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from database import db, firestore
+
+EMBEDDING_CACHE_SIZE = int(os.getenv("FACE_EMBEDDING_CACHE_SIZE", 2048))
+EMBEDDING_CACHE_TTL = float(os.getenv("FACE_EMBEDDING_CACHE_TTL", 600))  # seconds; bounds staleness across processes
+LEGACY_DETECTOR = "retinaface"
+
+_cache = OrderedDict()   # email -> (loaded_at, record)
+_cache_lock = threading.Lock()
+
+
+def pack_embedding(embedding):
+    """Return (float32 bytes, L2 norm) for an embedding list/array."""
+    vec = np.asarray(embedding, dtype='<f4')
+    return vec.tobytes(), float(np.linalg.norm(vec))
+
+
+def embedding_from_doc(data):
+    """
+    Decode a faces document into a record dict:
+        {'vector': float32 array or None, 'norm': float, 'model': str or None, 'detector': str}
+    """
+    raw = data.get('embedding_f32')
+    if raw:
+        vec = np.frombuffer(raw, dtype='<f4')
+        norm = data.get('embedding_norm') or float(np.linalg.norm(vec))
+    elif data.get('embedding'):
+        vec = np.asarray(data['embedding'], dtype=np.float32)   # legacy list of doubles
+        norm = float(np.linalg.norm(vec))
+    else:
+        vec, norm = None, 0.0
+    return {'vector': vec, 'norm': norm, 'model': data.get('model'),
+            'detector': data.get('detector') or LEGACY_DETECTOR}
+
+
+def cosine_similarity(record, embedding):
+    """Cosine similarity between a stored record and a new embedding (one dot product)."""
+    new_vec = np.asarray(embedding, dtype=np.float32)
+    denom = record['norm'] * float(np.linalg.norm(new_vec))
+    if denom == 0:
+        return 0.0
+    return float(np.dot(record['vector'], new_vec) / denom)
+
+
+def save_embedding(email, embedding, model_name, detector):
+    """Store an embedding in packed form and refresh the cache."""
+    packed, norm = pack_embedding(embedding)
+    db.collection('faces').document(email).set({
+        'embedding_f32': packed,
+        'embedding_norm': norm,
+        'embedding_dim': len(packed) // 4,
+        'model': model_name,
+        'detector': detector,
+        'uploaded_at': firestore.SERVER_TIMESTAMP
+    })
+    record = {'vector': np.frombuffer(packed, dtype='<f4'), 'norm': norm, 'model': model_name,
+              'detector': detector}
+    _cache_put(email, record)
+    return record
+
+
+def get_embedding(email):
+    """
+    Return the stored record for an email (see embedding_from_doc), or None if
+    no face is registered. Served from the LRU cache when fresh.
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(email)
+        if entry and now - entry[0] < EMBEDDING_CACHE_TTL:
+            _cache.move_to_end(email)
+            return entry[1]
+
+    doc = db.collection('faces').document(email).get()
+    if not doc.exists:
+        invalidate(email)
+        return None
+    record = embedding_from_doc(doc.to_dict())
+    _cache_put(email, record)
+    return record
+
+
+def invalidate(email):
+    with _cache_lock:
+        _cache.pop(email, None)
+
+
+def _cache_put(email, record):
+    with _cache_lock:
+        _cache[email] = (time.monotonic(), record)
+        _cache.move_to_end(email)
+        while len(_cache) > EMBEDDING_CACHE_SIZE:
+            _cache.popitem(last=False)
@@ -0,0 +1,155 @@
+"""
+In-memory 1:N face identification index.
+
+All registered embeddings of one model (made with face_detection's
+ALIGN_DETECTOR, like the probe photos) are kept L2-normalised in a
+contiguous float32 matrix, so identifying a face is one matrix-vector
+product plus a partial sort (a few milliseconds for 100k faces).
+
+The index is loaded from the `faces` collection on first use and then
+refreshed incrementally: only documents whose `uploaded_at` is newer than
+the last sync are fetched. A full reload every FACE_INDEX_FULL_RELOAD
+seconds picks up deleted documents.
+"""
+import os
+import threading
+import time
+import numpy as np
+from database import db
+from face_embeddings import embedding_from_doc
+from face_detection import ALIGN_DETECTOR
+
+FACE_INDEX_REFRESH = float(os.getenv("FACE_INDEX_REFRESH", 30))          # seconds between incremental syncs
+FACE_INDEX_FULL_RELOAD = float(os.getenv("FACE_INDEX_FULL_RELOAD", 3600))
+
+
+class FaceIndex:
+    """Contiguous matrix of normalised embeddings with an email <-> row mapping."""
+
+    def __init__(self, model_name, dim=None):
+        self.model_name = model_name
+        self.dim = dim
+        self._matrix = np.zeros((0, dim or 0), dtype=np.float32)
+        self._size = 0
+        self.emails = []
+        self._rows = {}            # email -> row
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._last_uploaded = None
+        self._last_sync = 0.0
+        self._last_full = 0.0
+
+    def __len__(self):
+        return self._size
+
+    # ----- building -----
+    def upsert(self, email, vector):
+        """Insert or replace one embedding. Vectors of another dimension are ignored."""
+        vec = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vec))
+        if norm == 0:
+            return False
+        with self._lock:
+            if self.dim is None:
+                self.dim = vec.shape[0]
+                self._matrix = np.zeros((0, self.dim), dtype=np.float32)
+            if vec.shape[0] != self.dim:
+                return False
+            row = self._rows.get(email)
+            if row is None:
+                row = self._size
+                if row == self._matrix.shape[0]:
+                    grown = np.zeros((max(64, row * 2), self.dim), dtype=np.float32)
+                    grown[:row] = self._matrix[:row]
+                    self._matrix = grown
+                self._rows[email] = row
+                self.emails.append(email)
+                self._size += 1
+            self._matrix[row] = vec / norm
+        return True
+
+    def _load_docs(self, docs):
+        newest = self._last_uploaded
+        for doc in docs:
+            data = doc.to_dict()
+            record = embedding_from_doc(data)
+            if (record['vector'] is not None and (record['model'] or self.model_name) == self.model_name
+                    and record['detector'] == ALIGN_DETECTOR):
+                self.upsert(doc.id, record['vector'])
+            uploaded = data.get('uploaded_at')
+            if uploaded is not None and (newest is None or uploaded > newest):
+                newest = uploaded
+        self._last_uploaded = newest
+
+    def reload(self):
+        """Rebuild the whole index from Firestore."""
+        fresh = FaceIndex(self.model_name, self.dim)
+        fresh._load_docs(db.collection('faces').stream())
+        with self._lock:
+            self._matrix, self._size = fresh._matrix, fresh._size
+            self.emails, self._rows, self.dim = fresh.emails, fresh._rows, fresh.dim
+            self._last_uploaded = fresh._last_uploaded
+            self._last_sync = self._last_full = time.monotonic()
+
+    def refresh(self, force=False):
+        """Fetch faces registered since the last sync (or reload everything when due)."""
+        now = time.monotonic()
+        loaded = self._last_full > 0
+        if loaded and not force and now - self._last_sync < FACE_INDEX_REFRESH:
+            return
+        # One sync at a time; once loaded, other sessions just search the current matrix
+        if not self._refresh_lock.acquire(blocking=not loaded):
+            return
+        try:
+            if not loaded and self._last_full:
+                return  # another session finished the initial load while we waited
+            if not self._last_full or now - self._last_full > FACE_INDEX_FULL_RELOAD:
+                self.reload()
+                return
+            query = db.collection('faces')
+            if self._last_uploaded is not None:
+                query = query.where('uploaded_at', '>', self._last_uploaded)
+            self._load_docs(query.stream())
+            self._last_sync = now
+        finally:
+            self._refresh_lock.release()
+
+    # ----- searching -----
+    def search(self, embedding, k=2):
+        """Return up to k (email, cosine similarity) pairs, best first."""
+        with self._lock:
+            n = self._size
+            if n == 0:
+                return []
+            matrix = self._matrix[:n]
+            emails = self.emails
+        q = np.asarray(embedding, dtype=np.float32).ravel()
+        q_norm = float(np.linalg.norm(q))
+        if q_norm == 0 or q.shape[0] != matrix.shape[1]:
+            return []
+        scores = matrix @ (q / q_norm)
+        k = min(k, n)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(emails[i], float(scores[i])) for i in top]
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_face_index(model_name):
+    """Process-wide index for a model, loaded on first use and kept fresh."""
+    with _indexes_lock:
+        index = _indexes.get(model_name)
+        if index is None:
+            index = _indexes[model_name] = FaceIndex(model_name)
+    index.refresh()
+    return index
+
+
+def note_registration(email, vector, model_name):
+    """Add a just-registered face to an already loaded index (no-op otherwise)."""
+    index = _indexes.get(model_name)
+    if index is not None:
+        index.upsert(email, vector)
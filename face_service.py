@@ -0,0 +1,284 @@
+"""
+Face inference service.
+
+A single long-lived worker process loads the embedding model and face
+detector once, then serves embedding jobs from every Streamlit session over
+a multiprocessing queue. Jobs that arrive close together are processed as
+one micro-batch. The worker is started on first use; if it cannot be started
+(or FACE_SERVICE_ENABLED=0) callers fall back to running DeepFace in-process.
+
+This module deliberately imports neither TensorFlow nor OpenCV at module
+level: only the worker process (or the in-process fallback) loads them.
+"""
+import itertools
+import multiprocessing as mp
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+FACE_SERVICE_ENABLED = os.getenv("FACE_SERVICE_ENABLED", "1") != "0"
+FACE_MODEL = os.getenv("FACE_MODEL", "Facenet512")
+FACE_DETECTOR = os.getenv("FACE_DETECTOR", "retinaface")
+FACE_BATCH_SIZE = int(os.getenv("FACE_BATCH_SIZE", 8))
+FACE_BATCH_WAIT_MS = int(os.getenv("FACE_BATCH_WAIT_MS", 15))
+FACE_JOB_TIMEOUT = float(os.getenv("FACE_JOB_TIMEOUT", 60))
+FACE_STARTUP_TIMEOUT = float(os.getenv("FACE_STARTUP_TIMEOUT", 180))  # first start may download weights
+WORKER_CHECK_INTERVAL = 0.5   # seconds between liveness checks while no results arrive
+
+
+class FaceServiceUnavailable(RuntimeError):
+    """The worker process died before answering; represent() falls back to in-process DeepFace."""
+
+
+# ===== WORKER PROCESS =====
+def _decode(image):
+    """Jobs carry either encoded image bytes (camera JPEG/PNG) or a BGR numpy array."""
+    if isinstance(image, (bytes, bytearray)):
+        import cv2
+        import numpy as np
+        return cv2.imdecode(np.frombuffer(image, np.uint8), cv2.IMREAD_COLOR)
+    return image
+
+
+def _represent_one(DeepFace, img, model_name, detector_backend, enforce_detection):
+    objs = DeepFace.represent(
+        img_path=img,
+        model_name=model_name,
+        detector_backend=detector_backend,
+        enforce_detection=enforce_detection
+    )
+    return [o['embedding'] for o in objs]
+
+
+def _run_batch(DeepFace, jobs):
+    """
+    Embed a micro-batch. Jobs sharing model/detector settings are sent to
+    DeepFace as one batched call where the installed version supports it;
+    otherwise (or on any batch error) each job is embedded on its own.
+    Returns [(job_id, embeddings, error)].
+    """
+    results = []
+    groups = {}
+    for job in jobs:
+        job_id, image, model_name, detector_backend, enforce_detection = job
+        try:
+            img = _decode(image)
+            if img is None:
+                raise ValueError("Could not decode image")
+        except Exception as e:
+            results.append((job_id, None, str(e)))
+            continue
+        groups.setdefault((model_name, detector_backend, enforce_detection), []).append((job_id, img))
+
+    for (model_name, detector_backend, enforce_detection), items in groups.items():
+        batched = None
+        if len(items) > 1:
+            try:
+                out = DeepFace.represent(
+                    img_path=[img for _, img in items],
+                    model_name=model_name,
+                    detector_backend=detector_backend,
+                    enforce_detection=enforce_detection
+                )
+                if len(out) == len(items) and all(isinstance(o, list) for o in out):
+                    batched = [[face['embedding'] for face in o] for o in out]
+            except Exception:
+                batched = None  # older DeepFace without batch support, or one bad image
+
+        for i, (job_id, img) in enumerate(items):
+            if batched is not None:
+                results.append((job_id, batched[i], None))
+                continue
+            try:
+                results.append((job_id, _represent_one(DeepFace, img, model_name, detector_backend, enforce_detection), None))
+            except Exception as e:
+                results.append((job_id, None, str(e)))
+    return results
+
+
+def _worker_main(requests, responses, model_name, detector_backend, batch_size, batch_wait_ms):
+    """Entry point of the inference process."""
+    import numpy as np
+    from deepface import DeepFace
+
+    # Load the embedding model and detector once, before reporting ready
+    DeepFace.build_model(model_name)
+    try:
+        DeepFace.represent(
+            img_path=np.zeros((160, 160, 3), dtype=np.uint8),
+            model_name=model_name,
+            detector_backend=detector_backend,
+            enforce_detection=False
+        )
+    except Exception:
+        pass
+    responses.put(("__ready__", None, None))
+
+    while True:
+        job = requests.get()
+        if job is None:
+            break
+        batch = [job]
+        while len(batch) < batch_size:
+            try:
+                nxt = requests.get(timeout=batch_wait_ms / 1000)
+            except queue.Empty:
+                break
+            if nxt is None:
+                requests.put(None)  # finish this batch, then stop
+                break
+            batch.append(nxt)
+        for result in _run_batch(DeepFace, batch):
+            responses.put(result)
+
+
+# ===== CLIENT =====
+class FaceService:
+    """Client side of the worker process. Thread-safe; shared by all sessions."""
+
+    def __init__(self, model_name=FACE_MODEL, detector_backend=FACE_DETECTOR,
+                 batch_size=FACE_BATCH_SIZE, batch_wait_ms=FACE_BATCH_WAIT_MS):
+        self.model_name = model_name
+        self.detector_backend = detector_backend
+        ctx = mp.get_context("spawn")  # never fork the multi-threaded Streamlit server
+        self._requests = ctx.Queue()
+        self._responses = ctx.Queue()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._dead = False
+        self.ready = threading.Event()
+        self._process = ctx.Process(
+            target=_worker_main,
+            args=(self._requests, self._responses, model_name, detector_backend, batch_size, batch_wait_ms),
+            name="face-inference",
+            daemon=True
+        )
+        self._process.start()
+        threading.Thread(target=self._dispatch, name="face-inference-results", daemon=True).start()
+
+    def _dispatch(self):
+        while True:
+            try:
+                job_id, embeddings, error = self._responses.get(timeout=WORKER_CHECK_INTERVAL)
+            except queue.Empty:
+                if self._process.is_alive():
+                    continue
+                self._fail_pending()
+                break
+            except (EOFError, OSError):
+                self._fail_pending()
+                break
+            self._resolve(job_id, embeddings, error)
+
+    def _resolve(self, job_id, embeddings, error):
+        if job_id == "__ready__":
+            self.ready.set()
+            return
+        with self._lock:
+            future = self._pending.pop(job_id, None)
+        if future is None:
+            return
+        if error:
+            future.set_exception(ValueError(error))
+        else:
+            future.set_result(embeddings)
+
+    def _fail_pending(self):
+        """The worker died (OOM, TensorFlow crash): fail every unanswered job now."""
+        while True:  # results it sent before dying
+            try:
+                self._resolve(*self._responses.get_nowait())
+            except (queue.Empty, EOFError, OSError):
+                break
+        with self._lock:
+            self._dead = True
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(FaceServiceUnavailable("Face inference worker died"))
+
+    def is_alive(self):
+        return self._process.is_alive()
+
+    def wait_ready(self, timeout=FACE_STARTUP_TIMEOUT):
+        """Block until the models are loaded. False if the worker died or timed out."""
+        deadline = time.monotonic() + timeout
+        while not self.ready.wait(0.25):
+            if not self.is_alive() or time.monotonic() > deadline:
+                return False
+        return True
+
+    def submit(self, image, model_name=None, detector_backend=None, enforce_detection=True):
+        """Queue an embedding job; returns a Future resolving to a list of embeddings (one per face)."""
+        future = Future()
+        job_id = next(self._ids)
+        with self._lock:
+            if self._dead:
+                future.set_exception(FaceServiceUnavailable("Face inference worker died"))
+                return future
+            self._pending[job_id] = future
+        self._requests.put((
+            job_id, image,
+            model_name or self.model_name,
+            detector_backend or self.detector_backend,
+            enforce_detection
+        ))
+        return future
+
+    def represent(self, image, model_name=None, detector_backend=None, enforce_detection=True,
+                  timeout=FACE_JOB_TIMEOUT):
+        """Blocking helper around submit()."""
+        return self.submit(image, model_name, detector_backend, enforce_detection).result(timeout=timeout)
+
+    def stop(self):
+        self._requests.put(None)
+        self._process.join(timeout=5)
+
+
+_service = None
+_service_failed = False
+_service_lock = threading.Lock()
+
+
+def get_face_service():
+    """Return the process-wide FaceService, starting the worker on first call (None if disabled)."""
+    global _service, _service_failed
+    if not FACE_SERVICE_ENABLED or _service_failed:
+        return None
+    with _service_lock:
+        if _service is not None and not _service.is_alive() and not _service.ready.is_set():
+            # Died while loading models (e.g. DeepFace missing): don't keep respawning it
+            print("Face inference worker failed to start, using in-process DeepFace.")
+            _service, _service_failed = None, True
+            return None
+        if _service is None or not _service.is_alive():
+            try:
+                _service = FaceService()
+            except Exception as e:
+                print(f"Face inference service unavailable, using in-process DeepFace: {e}")
+                _service = None
+    return _service
+
+
+def represent(image, model_name=None, detector_backend=None, enforce_detection=True):
+    """
+    Embed the face(s) in an image (encoded bytes or BGR array).
+    Returns a list of embeddings, largest/first face first. Raises ValueError
+    when no face is found (with enforce_detection) or the image is unreadable.
+    """
+    model_name = model_name or FACE_MODEL
+    detector_backend = detector_backend or FACE_DETECTOR
+    service = get_face_service()
+    if service is not None and service.wait_ready():
+        try:
+            return service.represent(image, model_name, detector_backend, enforce_detection)
+        except FaceServiceUnavailable as e:
+            print(f"{e}, using in-process DeepFace for this job.")
+
+    from deepface import DeepFace
+    img = _decode(image)
+    if img is None:
+        raise ValueError("Could not decode image")
+    return _represent_one(DeepFace, img, model_name, detector_backend, enforce_detection)
@@ -0,0 +1,182 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# Local metrics store (SQLite file, shared by every process on the node)
+METRICS_DB_PATH = os.getenv("LLM_METRICS_DB", "llm_metrics.db")
+
+_lock = threading.Lock()
+_initialized = False
+
+
+def _connect():
+    global _initialized
+    conn = sqlite3.connect(METRICS_DB_PATH, timeout=5)
+    try:
+        if not _initialized:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_calls (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    model TEXT,
+                    started_at REAL NOT NULL,
+                    latency_ms REAL NOT NULL,
+                    prompt_tokens INTEGER DEFAULT 0,
+                    completion_tokens INTEGER DEFAULT 0,
+                    retries INTEGER DEFAULT 0,
+                    fallbacks INTEGER DEFAULT 0,
+                    cache_hit INTEGER DEFAULT 0,
+                    success INTEGER DEFAULT 1,
+                    error TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_calls_name_time ON llm_calls (name, started_at)")
+            _initialized = True
+    except Exception:
+        conn.close()
+        raise
+    return conn
+
+
+class LLMCall:
+    """Mutable record filled in by the code making the call."""
+
+    def __init__(self, name, model=None):
+        self.name = name
+        self.model = model
+        self.started_at = time.time()
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.retries = 0
+        self.fallbacks = 0
+        self.cache_hit = False
+        self.success = True
+        self.error = None
+
+    def add_usage(self, prompt_tokens, completion_tokens):
+        self.prompt_tokens += prompt_tokens or 0
+        self.completion_tokens += completion_tokens or 0
+
+
+def record(call, latency_ms):
+    """Persist one call. Metrics must never break the feature, so errors are only printed."""
+    try:
+        with _lock:
+            conn = _connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT INTO llm_calls (name, model, started_at, latency_ms, prompt_tokens, completion_tokens,"
+                        " retries, fallbacks, cache_hit, success, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (call.name, call.model, call.started_at, latency_ms, call.prompt_tokens, call.completion_tokens,
+                         call.retries, call.fallbacks, int(call.cache_hit), int(call.success), call.error)
+                    )
+            finally:
+                conn.close()
+    except Exception as e:
+        print(f"Failed to record LLM metrics: {e}")
+
+
+def _read(sql, params=()):
+    """
+    Run a read query. A locked, corrupt or unreadable metrics file must not
+    break the admin page: the error is shown as a warning and no rows are returned.
+    """
+    try:
+        with _lock:
+            conn = _connect()
+            try:
+                return conn.execute(sql, params).fetchall()
+            finally:
+                conn.close()
+    except Exception as e:
+        print(f"Failed to read LLM metrics: {e}")
+        import streamlit as st
+        st.warning(f"AI usage metrics are unavailable: {e}")
+        return []
+
+
+@contextmanager
+def track_llm_call(name, model=None):
+    """
+    Time an LLM call and record it on exit.
+
+        with track_llm_call("parse_resume_with_groq", model) as call:
+            ...
+            call.add_usage(usage.prompt_tokens, usage.completion_tokens)
+
+    An exception escaping the block marks the call as failed and is re-raised.
+    """
+    call = LLMCall(name, model)
+    t0 = time.perf_counter()
+    try:
+        yield call
+    except Exception as e:
+        call.success = False
+        call.error = str(e)[:500]
+        raise
+    finally:
+        record(call, (time.perf_counter() - t0) * 1000)
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def get_summary(since_hours=24):
+    """Per-function aggregates for the last `since_hours` hours, slowest p95 first."""
+    since = time.time() - since_hours * 3600
+    rows = _read(
+        "SELECT name, latency_ms, prompt_tokens, completion_tokens, retries, fallbacks, cache_hit, success"
+        " FROM llm_calls WHERE started_at >= ?", (since,)
+    )
+
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(row[0], []).append(row)
+
+    summary = []
+    for name, calls in grouped.items():
+        latencies = sorted(c[1] for c in calls)
+        summary.append({
+            'name': name,
+            'calls': len(calls),
+            'errors': sum(1 for c in calls if not c[7]),
+            'cache_hits': sum(c[6] for c in calls),
+            'p50_ms': _percentile(latencies, 50),
+            'p95_ms': _percentile(latencies, 95),
+            'p99_ms': _percentile(latencies, 99),
+            'prompt_tokens': sum(c[2] for c in calls),
+            'completion_tokens': sum(c[3] for c in calls),
+            'retries': sum(c[4] for c in calls),
+            'fallbacks': sum(c[5] for c in calls),
+        })
+    summary.sort(key=lambda s: s['p95_ms'], reverse=True)
+    return summary
+
+
+def get_latencies(since_hours=24):
+    """(name, latency_ms) for every call in the window, for histograms."""
+    since = time.time() - since_hours * 3600
+    return _read("SELECT name, latency_ms FROM llm_calls WHERE started_at >= ? AND cache_hit = 0", (since,))
+
+
+def clear_metrics():
+    """Delete all recorded calls. Returns False (after printing the error) if that failed."""
+    try:
+        with _lock:
+            conn = _connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM llm_calls")
+            finally:
+                conn.close()
+    except Exception as e:
+        print(f"Failed to clear LLM metrics: {e}")
+        return False
+    return True
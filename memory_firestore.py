@@ -0,0 +1,633 @@
+"""
+In-memory, Firestore-compatible storage backend.
+
+Set DATA_BACKEND=memory (st.secrets or environment) and resources.py hands
+this client to database.py and the other data modules in place of
+firebase_admin's. The data layer then runs with no network and no
+credentials, for example for offline benchmarks, load tests and demos.
+The module can also stand in for `firebase_admin.firestore` itself:
+it provides SERVER_TIMESTAMP, Increment, Query.ASCENDING/DESCENDING,
+transactional and client().
+
+Supported, with Firestore's semantics:
+  * documents: get/set(merge)/update (dotted paths)/create/delete
+  * queries: where ==, !=, <, <=, >, >=, in, not-in, array_contains(_any),
+    order_by (several fields), limit, stream/get. Documents without an
+    order_by field are left out of the result, and 'in' is limited to 30
+    values as in Firestore.
+  * batches, transactions (serialised; reads after writes are rejected),
+    get_all, SERVER_TIMESTAMP and Increment transforms
+  * an AsyncClient look-alike for async_db.py
+
+Equality and 'in' filters use hash indexes built on first use and kept
+up to date on every write, so selective queries stay fast with millions
+of documents. MEMORY_DB_PATH names a pickle snapshot that is loaded when
+the client is created; client().save(path) writes one.
+"""
+import functools
+import os
+import pickle
+import random
+import string
+import threading
+from datetime import datetime, timezone
+
+IN_QUERY_LIMIT = 30
+AUTO_ID_CHARS = string.ascii_letters + string.digits
+
+
+class NotFound(Exception):
+    pass
+
+
+class Conflict(Exception):
+    pass
+
+
+# ===== SENTINELS / TRANSFORMS =====
+class _ServerTimestamp:
+    def __repr__(self):
+        return "SERVER_TIMESTAMP"
+
+
+class _DeleteField:
+    def __repr__(self):
+        return "DELETE_FIELD"
+
+
+SERVER_TIMESTAMP = _ServerTimestamp()
+DELETE_FIELD = _DeleteField()
+
+
+class Increment:
+    def __init__(self, value):
+        self.value = value
+
+
+class Query:
+    ASCENDING = "ASCENDING"
+    DESCENDING = "DESCENDING"
+
+
+def _is_server_timestamp(value):
+    # Also accept firebase_admin's sentinels, so either namespace works
+    return value is SERVER_TIMESTAMP or (type(value).__name__ == "Sentinel"
+                                         and "timestamp" in str(getattr(value, "description", "")).lower())
+
+
+def _is_delete(value):
+    return value is DELETE_FIELD or (type(value).__name__ == "Sentinel"
+                                     and "delete" in str(getattr(value, "description", "")).lower())
+
+
+def _increment(value):
+    if type(value).__name__ == "Increment" and hasattr(value, "value"):
+        return value.value
+    return None
+
+
+def _store(value, old=None):
+    """Resolve transforms and normalise a value the way Firestore stores it."""
+    if _is_server_timestamp(value):
+        return datetime.now(timezone.utc)
+    step = _increment(value)
+    if step is not None:
+        base = old if isinstance(old, (int, float)) and not isinstance(old, bool) else 0
+        return base + step
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)  # naive datetimes are stored as UTC
+    if isinstance(value, dict):
+        old = old if isinstance(old, dict) else {}
+        return {k: _store(v, old.get(k)) for k, v in value.items() if not _is_delete(v)}
+    if isinstance(value, (list, tuple)):
+        return [_store(v) for v in value]
+    return value
+
+
+def _copy(value):
+    """Copy nested dicts/lists so callers never share stored state."""
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+def _merge(old, new):
+    for key, value in new.items():
+        if _is_delete(value):
+            old.pop(key, None)
+        elif (isinstance(value, dict) and isinstance(old.get(key), dict)):
+            old[key] = _merge(dict(old[key]), value)
+        else:
+            old[key] = _store(value, old.get(key))
+    return old
+
+
+def _get_field(data, field_path):
+    value = data
+    for part in field_path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            raise KeyError(field_path)
+        value = value[part]
+    return value
+
+
+def _set_field(data, field_path, value):
+    parts = field_path.split(".")
+    target = data
+    for part in parts[:-1]:
+        if not isinstance(target.get(part), dict):
+            target[part] = {}
+        target = target[part]
+    if _is_delete(value):
+        target.pop(parts[-1], None)
+    else:
+        target[parts[-1]] = _store(value, target.get(parts[-1]))
+
+
+# ===== VALUE ORDERING (Firestore type order) =====
+def _type_rank(value):
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float)):
+        return 2
+    if isinstance(value, datetime):
+        return 3
+    if isinstance(value, str):
+        return 4
+    if isinstance(value, bytes):
+        return 5
+    if isinstance(value, list):
+        return 8
+    return 9
+
+
+def _sort_key(value):
+    rank = _type_rank(value)
+    return (rank, value) if rank in (1, 2, 3, 4, 5) else (rank, repr(value))
+
+
+def _index_key(value):
+    """Hashable equality key; True and 1 stay distinct, 1 and 1.0 do not."""
+    rank = _type_rank(value)
+    if rank in (8, 9):
+        return None
+    if isinstance(value, datetime) and value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (rank, value)
+
+
+def _equal(a, b):
+    ka, kb = _index_key(a), _index_key(b)
+    if ka is None or kb is None:
+        return a == b
+    return ka == kb
+
+
+def _compare(a, b, op):
+    if _type_rank(a) != _type_rank(b) or _type_rank(a) in (0, 8, 9):
+        return False
+    if isinstance(b, datetime) and b.tzinfo is None:
+        b = b.replace(tzinfo=timezone.utc)
+    if op == "<":
+        return a < b
+    if op == "<=":
+        return a <= b
+    if op == ">":
+        return a > b
+    return a >= b
+
+
+def _matches(data, field, op, value):
+    try:
+        actual = _get_field(data, field)
+    except KeyError:
+        return False
+    if op == "==":
+        return _equal(actual, value)
+    if op == "!=":
+        return actual is not None and not _equal(actual, value)
+    if op in ("<", "<=", ">", ">="):
+        return _compare(actual, value, op)
+    if op == "in":
+        return any(_equal(actual, v) for v in value)
+    if op == "not-in":
+        return actual is not None and not any(_equal(actual, v) for v in value)
+    if op == "array_contains":
+        return isinstance(actual, list) and any(_equal(item, value) for item in actual)
+    if op == "array_contains_any":
+        return isinstance(actual, list) and any(_equal(item, v) for item in actual for v in value)
+    raise ValueError(f"Unsupported operator {op!r}")
+
+
+# ===== SNAPSHOTS / REFERENCES =====
+class DocumentSnapshot:
+    def __init__(self, reference, data):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+        self.exists = data is not None
+        self.create_time = self.update_time = self.read_time = None
+
+    def to_dict(self):
+        return _copy(self._data) if self._data is not None else None
+
+    def get(self, field_path):
+        return _copy(_get_field(self._data or {}, field_path))
+
+
+class DocumentReference:
+    def __init__(self, client, collection, doc_id):
+        self._client = client
+        self.id = doc_id
+        self._collection = collection
+        self.path = f"{collection}/{doc_id}"
+
+    @property
+    def parent(self):
+        return CollectionReference(self._client, self._collection)
+
+    def __eq__(self, other):
+        return isinstance(other, DocumentReference) and other.path == self.path
+
+    def __hash__(self):
+        return hash(self.path)
+
+    def get(self, field_paths=None, transaction=None, **kwargs):
+        if transaction is not None:
+            transaction._check_read()
+        return DocumentSnapshot(self, self._client._read(self._collection, self.id))
+
+    def set(self, document_data, merge=False):
+        self._client._commit([("set", self, document_data, merge)])
+
+    def update(self, field_updates):
+        self._client._commit([("update", self, field_updates, None)])
+
+    def create(self, document_data):
+        self._client._commit([("create", self, document_data, None)])
+
+    def delete(self):
+        self._client._commit([("delete", self, None, None)])
+
+
+class BaseQuery:
+    def __init__(self, client, collection, filters=(), orders=(), limit=None):
+        self._client = client
+        self._collection = collection
+        self._filters = tuple(filters)
+        self._orders = tuple(orders)
+        self._limit = limit
+
+    def _copy_with(self, **changes):
+        args = dict(filters=self._filters, orders=self._orders, limit=self._limit)
+        args.update(changes)
+        return BaseQuery(self._client, self._collection, **args)
+
+    def where(self, field_path=None, op_string=None, value=None, *, filter=None):
+        if filter is not None:  # FieldFilter(field_path, op_string, value)
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        if op_string in ("in", "not-in", "array_contains_any"):
+            value = list(value)
+            if len(value) > IN_QUERY_LIMIT:
+                raise ValueError(f"'{op_string}' filters support at most {IN_QUERY_LIMIT} values")
+        return self._copy_with(filters=self._filters + ((field_path, op_string, value),))
+
+    def order_by(self, field_path, direction=Query.ASCENDING):
+        return self._copy_with(orders=self._orders + ((field_path, direction),))
+
+    def limit(self, count):
+        return self._copy_with(limit=count)
+
+    def stream(self, transaction=None, **kwargs):
+        if transaction is not None:
+            transaction._check_read()
+        for doc_id, data in self._client._query(self._collection, self._filters, self._orders, self._limit):
+            yield DocumentSnapshot(DocumentReference(self._client, self._collection, doc_id), data)
+
+    def get(self, transaction=None, **kwargs):
+        return list(self.stream(transaction=transaction))
+
+
+class CollectionReference(BaseQuery):
+    def __init__(self, client, collection):
+        super().__init__(client, collection)
+        self.id = collection
+
+    def document(self, document_id=None):
+        if document_id is None:
+            document_id = "".join(random.choices(AUTO_ID_CHARS, k=20))
+        return DocumentReference(self._client, self.id, document_id)
+
+    def add(self, document_data, document_id=None):
+        ref = self.document(document_id)
+        ref.create(document_data)
+        return None, ref
+
+    def list_documents(self):
+        return [self.document(doc_id) for doc_id in self._client._doc_ids(self.id)]
+
+
+# ===== WRITES =====
+class WriteBatch:
+    def __init__(self, client):
+        self._client = client
+        self._writes = []
+
+    def set(self, reference, document_data, merge=False):
+        self._writes.append(("set", reference, document_data, merge))
+        return self
+
+    def update(self, reference, field_updates):
+        self._writes.append(("update", reference, field_updates, None))
+        return self
+
+    def create(self, reference, document_data):
+        self._writes.append(("create", reference, document_data, None))
+        return self
+
+    def delete(self, reference):
+        self._writes.append(("delete", reference, None, None))
+        return self
+
+    def commit(self):
+        writes, self._writes = self._writes, []
+        self._client._commit(writes)
+        return []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+
+
+class Transaction(WriteBatch):
+    def __init__(self, client):
+        super().__init__(client)
+        self.id = None
+
+    def _check_read(self):
+        if self._writes:
+            raise ValueError("Firestore transactions require all reads to happen before any writes")
+
+
+def transactional(func):
+    """Run func(transaction, ...) with the store locked, then commit its writes."""
+    @functools.wraps(func)
+    def wrapper(transaction, *args, **kwargs):
+        with transaction._client._lock:
+            transaction._writes = []
+            result = func(transaction, *args, **kwargs)
+            transaction.commit()
+        return result
+    return wrapper
+
+
+# ===== CLIENT =====
+class MemoryClient:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._data = {}      # collection -> {doc_id: data}
+        self._indexes = {}   # (collection, field) -> {index key: set(doc_id)}
+
+    # ----- public API (firestore.Client look-alike) -----
+    def collection(self, collection_path):
+        return CollectionReference(self, collection_path)
+
+    def document(self, document_path):
+        collection, doc_id = document_path.rsplit("/", 1)
+        return DocumentReference(self, collection, doc_id)
+
+    def collections(self):
+        with self._lock:
+            return [CollectionReference(self, name) for name in self._data]
+
+    def batch(self):
+        return WriteBatch(self)
+
+    def transaction(self, **kwargs):
+        return Transaction(self)
+
+    def get_all(self, references, field_paths=None, transaction=None, **kwargs):
+        if transaction is not None:
+            transaction._check_read()
+        for ref in references:
+            yield DocumentSnapshot(ref, self._read(ref._collection, ref.id))
+
+    def save(self, path):
+        """Write a pickle snapshot of every collection."""
+        with self._lock:
+            data = {name: dict(docs) for name, docs in self._data.items()}
+        with open(path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load(self, path):
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        with self._lock:
+            self._data = data
+            self._indexes = {}
+
+    def count(self, collection):
+        with self._lock:
+            return len(self._data.get(collection, {}))
+
+    # ----- storage -----
+    def _doc_ids(self, collection):
+        with self._lock:
+            return list(self._data.get(collection, {}))
+
+    def _read(self, collection, doc_id):
+        with self._lock:
+            data = self._data.get(collection, {}).get(doc_id)
+            return _copy(data) if data is not None else None
+
+    def _index(self, collection, field):
+        key = (collection, field)
+        index = self._indexes.get(key)
+        if index is None:
+            index = {}
+            for doc_id, data in self._data.get(collection, {}).items():
+                self._index_add(index, field, doc_id, data)
+            self._indexes[key] = index
+        return index
+
+    @staticmethod
+    def _index_add(index, field, doc_id, data):
+        try:
+            key = _index_key(_get_field(data, field))
+        except KeyError:
+            return
+        if key is not None:
+            index.setdefault(key, set()).add(doc_id)
+
+    @staticmethod
+    def _index_remove(index, field, doc_id, data):
+        try:
+            key = _index_key(_get_field(data, field))
+        except KeyError:
+            return
+        ids = index.get(key)
+        if ids:
+            ids.discard(doc_id)
+            if not ids:
+                del index[key]
+
+    def _put(self, collection, doc_id, new):
+        docs = self._data.setdefault(collection, {})
+        old = docs.get(doc_id)
+        for (coll, field), index in self._indexes.items():
+            if coll != collection:
+                continue
+            if old is not None:
+                self._index_remove(index, field, doc_id, old)
+            if new is not None:
+                self._index_add(index, field, doc_id, new)
+        if new is None:
+            docs.pop(doc_id, None)
+        else:
+            docs[doc_id] = new
+
+    def _commit(self, writes):
+        with self._lock:
+            docs_of = lambda ref: self._data.get(ref._collection, {})
+            # Validate first so a failing batch applies nothing
+            for op, ref, _, _ in writes:
+                if op == "update" and ref.id not in docs_of(ref):
+                    raise NotFound(f"No document to update: {ref.path}")
+                if op == "create" and ref.id in docs_of(ref):
+                    raise Conflict(f"Document already exists: {ref.path}")
+            for op, ref, payload, merge in writes:
+                old = docs_of(ref).get(ref.id)
+                if op == "delete":
+                    new = None
+                elif op == "update":
+                    new = _copy(old)
+                    for field_path, value in payload.items():
+                        _set_field(new, field_path, value)
+                elif op == "set" and merge and old is not None:
+                    new = _merge(_copy(old), payload)
+                else:
+                    new = _store(payload)
+                self._put(ref._collection, ref.id, new)
+
+    def _query(self, collection, filters, orders, limit):
+        with self._lock:
+            docs = self._data.get(collection, {})
+            candidates = None
+            for field, op, value in filters:
+                if op == "==" and _index_key(value) is not None:
+                    ids = self._index(collection, field).get(_index_key(value), set())
+                elif op == "in" and all(_index_key(v) is not None for v in value):
+                    index = self._index(collection, field)
+                    ids = set().union(*(index.get(_index_key(v), ()) for v in value)) if value else set()
+                else:
+                    continue
+                candidates = set(ids) if candidates is None else candidates & ids
+                if not candidates:
+                    return []
+            items = docs.items() if candidates is None else ((i, docs[i]) for i in candidates)
+            results = [(doc_id, data) for doc_id, data in items
+                       if all(_matches(data, f, op, v) for f, op, v in filters)]
+
+            results.sort(key=lambda item: item[0])  # Firestore's implicit order: document ID
+            for field, direction in reversed(orders):
+                results = [r for r in results if _has_field(r[1], field)]
+                results.sort(key=lambda item: _sort_key(_get_field(item[1], field)),
+                             reverse=str(direction).upper() == Query.DESCENDING)
+            if limit is not None:
+                results = results[:limit]
+            return [(doc_id, _copy(data)) for doc_id, data in results]
+
+
+def _has_field(data, field):
+    try:
+        _get_field(data, field)
+        return True
+    except KeyError:
+        return False
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def client(app=None):
+    """The process-wide in-memory client (loaded from MEMORY_DB_PATH if that file exists)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = MemoryClient()
+            path = os.getenv("MEMORY_DB_PATH")
+            if path and os.path.exists(path):
+                _client.load(path)
+        return _client
+
+
+# ===== ASYNC LOOK-ALIKE (for async_db.py) =====
+class AsyncQuery:
+    def __init__(self, query):
+        self._query = query
+
+    def where(self, *args, **kwargs):
+        return AsyncQuery(self._query.where(*args, **kwargs))
+
+    def order_by(self, *args, **kwargs):
+        return AsyncQuery(self._query.order_by(*args, **kwargs))
+
+    def limit(self, count):
+        return AsyncQuery(self._query.limit(count))
+
+    async def stream(self, **kwargs):
+        for snapshot in self._query.stream():
+            yield snapshot
+
+    async def get(self, **kwargs):
+        return self._query.get()
+
+
+class AsyncCollectionReference(AsyncQuery):
+    def __init__(self, collection):
+        super().__init__(collection)
+
+    def document(self, document_id=None):
+        return AsyncDocumentReference(self._query.document(document_id))
+
+
+class AsyncDocumentReference:
+    def __init__(self, reference):
+        self._reference = reference
+        self.id = reference.id
+
+    async def get(self, **kwargs):
+        return self._reference.get()
+
+    async def set(self, document_data, merge=False):
+        self._reference.set(document_data, merge=merge)
+
+    async def update(self, field_updates):
+        self._reference.update(field_updates)
+
+    async def delete(self):
+        self._reference.delete()
+
+
+class AsyncClient:
+    def __init__(self, sync_client):
+        self._client = sync_client
+
+    def collection(self, collection_path):
+        return AsyncCollectionReference(self._client.collection(collection_path))
+
+    async def get_all(self, references, **kwargs):
+        for snapshot in self._client.get_all([getattr(r, "_reference", r) for r in references]):
+            yield snapshot
+
+
+def async_client():
+    return AsyncClient(client())
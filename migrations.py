@@ -0,0 +1,76 @@
+"""
+One-off data migrations.
+
+    python migrations.py application-ids [--dry-run]
+
+application-ids: re-key applications from auto IDs to
+"<employee_id>_<job_id>" (see database.application_doc_id). Each
+application is copied to its new ID and the interviews and messages that
+point at it are updated in the same batch, then the old document is
+deleted. If an employee has more than one application for the same job,
+only the first one is moved; the others keep their auto ID and are
+listed so an admin can resolve them. Safe to re-run.
+
+Run it before deploying the code that keys applications this way: until
+it has run, legacy auto-ID applications are invisible to
+get_applied_job_ids() and to add_application()'s duplicate check.
+"""
+import sys
+from database import db, application_doc_id
+
+BATCH_LIMIT = 450  # Firestore allows 500 writes per batch
+
+
+def migrate_application_ids(dry_run=False):
+    """Returns (moved, already_keyed, duplicates) where duplicates is a list of old IDs left in place."""
+    moved, already_keyed, duplicates = 0, 0, []
+    planned = set()  # new IDs taken during a dry run
+    for app in db.collection('applications').stream():
+        data = app.to_dict()
+        new_id = application_doc_id(data.get('employee_id'), data.get('job_id'))
+        if app.id == new_id:
+            already_keyed += 1
+            continue
+        new_ref = db.collection('applications').document(new_id)
+        if new_id in planned or new_ref.get().exists:
+            duplicates.append(app.id)
+            continue
+
+        refs = [doc.reference for name in ('interviews', 'messages')
+                for doc in db.collection(name).where('application_id', '==', app.id).stream()]
+        if dry_run:
+            planned.add(new_id)
+            moved += 1
+            continue
+        if len(refs) + 2 > BATCH_LIMIT:
+            # Point the references at the new ID first; the old document goes last
+            new_ref.set(data)
+            for start in range(0, len(refs), BATCH_LIMIT):
+                batch = db.batch()
+                for ref in refs[start:start + BATCH_LIMIT]:
+                    batch.update(ref, {'application_id': new_id})
+                batch.commit()
+            app.reference.delete()
+        else:
+            batch = db.batch()
+            batch.set(new_ref, data)
+            for ref in refs:
+                batch.update(ref, {'application_id': new_id})
+            batch.delete(app.reference)
+            batch.commit()
+        moved += 1
+    return moved, already_keyed, duplicates
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args and args[0] == "application-ids":
+        dry_run = "--dry-run" in args
+        moved, already_keyed, duplicates = migrate_application_ids(dry_run=dry_run)
+        print(f"{'Would move' if dry_run else 'Moved'} {moved} applications ({already_keyed} already keyed)")
+        if duplicates:
+            print(f"{len(duplicates)} duplicate applications left with their old ID:")
+            for app_id in duplicates:
+                print(f"  {app_id}")
+    else:
+        print("usage: python migrations.py application-ids [--dry-run]")
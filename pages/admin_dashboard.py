@@ -35,10 +35,16 @@ from database import (
     # Others
     get_company_by_id, get_job_by_id, get_user, add_notification,
     send_message, get_messages_between_company_and_employee,
-    update_expired_jobs, get_or_create_profile, get_resume_download_link
+    update_expired_jobs, get_or_create_profile
 )
 
+from llm_metrics import get_summary as get_llm_summary, get_latencies as get_llm_latencies, clear_metrics as clear_llm_metrics
+from assets import use_stylesheet
+from downloads import resume_download_button
+import profiler
+
 # Update expired jobs
+profiler.begin_run("admin_dashboard")
 update_expired_jobs()
 
 # --- Page config ---
@@ -115,290 +121,7 @@ def confirm_action(key, message):
     return False
 
 # --- Custom CSS (glass-morphism + pills styling) ---
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-
-    * {
-        font-family: 'Inter', sans-serif;
-    }
-
-    :root {
-        --primary: #4F46E5;
-        --primary-light: #818CF8;
-        --primary-dark: #3730A3;
-        --secondary: #0EA5E9;
-        --accent: #10B981;
-        --danger: #EF4444;
-        --warning: #F59E0B;
-        --bg: #F8FAFC;
-        --card-bg: rgba(255,255,255,0.9);
-        --text: #0F172A;
-        --text-light: #475569;
-        --border: #E2E8F0;
-        --shadow-sm: 0 4px 6px -1px rgba(0,0,0,0.05), 0 2px 4px -1px rgba(0,0,0,0.03);
-        --shadow-lg: 0 20px 25px -5px rgba(0,0,0,0.1), 0 10px 10px -5px rgba(0,0,0,0.02);
-        --glass-bg: rgba(255,255,255,0.7);
-        --glass-border: 1px solid rgba(255,255,255,0.5);
-    }
-
-    .stApp {
-        background: radial-gradient(circle at 10% 30%, rgba(255,255,255,0.95) 0%, #f1f5f9 100%);
-    }
-
-    .badge-count {
-        background: #EF4444;
-        color: white;
-        font-size: 0.75rem;
-        font-weight: 600;
-        padding: 0.25rem 0.6rem;
-        border-radius: 40px;
-        line-height: 1;
-        display: inline-block;
-        box-shadow: 0 2px 4px rgba(239, 68, 68, 0.3);
-    }
-
-    /* Hero header */
-    .hero-header {
-        background: linear-gradient(135deg, var(--primary), var(--secondary));
-        padding: 2rem 2.5rem;
-        border-radius: 40px;
-        color: white;
-        margin: 1.5rem 0 2rem 0;
-        box-shadow: var(--shadow-lg);
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        backdrop-filter: blur(5px);
-    }
-
-    .hero-header h1 {
-        margin: 0;
-        font-size: 2.2rem;
-        font-weight: 700;
-        letter-spacing: -0.02em;
-    }
-
-    .hero-header p {
-        margin: 0.5rem 0 0;
-        opacity: 0.9;
-        font-size: 1.1rem;
-    }
-
-    .date-badge {
-        background: rgba(255,255,255,0.2);
-        padding: 0.5rem 1.5rem;
-        border-radius: 40px;
-        font-weight: 500;
-        backdrop-filter: blur(5px);
-        border: 1px solid rgba(255,255,255,0.3);
-    }
-
-    /* Stat cards */
-    .stat-card {
-        background: var(--glass-bg);
-        backdrop-filter: blur(10px);
-        -webkit-backdrop-filter: blur(10px);
-        padding: 1.5rem;
-        border-radius: 30px;
-        border: var(--glass-border);
-        box-shadow: var(--shadow-sm);
-        transition: transform 0.2s, box-shadow 0.2s;
-        text-align: center;
-    }
-
-    .stat-card:hover {
-        transform: translateY(-5px);
-        box-shadow: var(--shadow-lg);
-    }
-
-    .stat-card h3 {
-        color: var(--text-light);
-        font-size: 0.9rem;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-        margin-bottom: 0.5rem;
-    }
-
-    .stat-card p {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: var(--primary);
-        margin: 0;
-    }
-
-    /* Data table styling */
-    .data-table {
-        background: white;
-        border-radius: 24px;
-        padding: 1rem;
-        border: 1px solid var(--border);
-        margin: 1rem 0;
-    }
-
-    .role-badge {
-        padding: 0.25rem 0.75rem;
-        border-radius: 40px;
-        font-size: 0.8rem;
-        font-weight: 500;
-        display: inline-block;
-    }
-
-    .role-employee { background: #DBEAFE; color: #1E40AF; }
-    .role-employer { background: #DCFCE7; color: #166534; }
-    .role-admin { background: #FEF3C7; color: #92400E; }
-
-    .status-badge {
-        padding: 0.25rem 0.75rem;
-        border-radius: 40px;
-        font-size: 0.8rem;
-        font-weight: 500;
-        display: inline-block;
-    }
-    
-    .status-active { background: #DCFCE7; color: #166534; }
-    .status-expired { background: #FEE2E2; color: #991B1B; }
-    .status-pending { background: #FEF3C7; color: #92400E; }
-    .status-closed { background: #E2E8F0; color: #475569; }
-
-    /* Section title */
-    .section-title {
-        font-size: 1.5rem;
-        font-weight: 600;
-        color: var(--text);
-        margin: 2rem 0 1rem;
-        letter-spacing: -0.01em;
-        display: flex;
-        align-items: center;
-        gap: 1rem;
-    }
-
-    /* Metric cards */
-    .metric-card {
-        background: var(--glass-bg);
-        backdrop-filter: blur(10px);
-        -webkit-backdrop-filter: blur(10px);
-        padding: 1rem 1.5rem;
-        border-radius: 30px;
-        border: var(--glass-border);
-        box-shadow: var(--shadow-sm);
-        text-align: center;
-    }
-
-    .metric-card .label {
-        color: var(--text-light);
-        font-size: 0.8rem;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-
-    .metric-card .value {
-        font-size: 1.8rem;
-        font-weight: 700;
-        color: var(--primary);
-        line-height: 1.2;
-    }
-
-    /* Buttons */
-    .stButton > button {
-        border-radius: 40px;
-        font-weight: 500;
-        transition: all 0.2s;
-        border: none;
-        padding: 0.5rem 1.5rem;
-        background: var(--primary);
-        color: white;
-        box-shadow: var(--shadow-sm);
-    }
-
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 16px -4px rgba(79, 70, 229, 0.4);
-    }
-
-    .delete-btn > button {
-        background: var(--danger);
-    }
-    
-    .delete-btn > button:hover {
-        box-shadow: 0 8px 16px -4px rgba(239, 68, 68, 0.4);
-    }
-
-    hr {
-        margin: 2rem 0;
-        border: 0;
-        border-top: 1px solid var(--border);
-    }
-
-    /* ===== PILLS STYLING (admin theme) ===== */
-    div[class*="st-key-"] button {
-        all: unset;
-        background: none !important;
-        border: none !important;
-        box-shadow: none !important;
-        padding: 0.5rem 0.8rem !important;
-        margin: 0 !important;
-        font-family: inherit !important;
-        font-size: 1rem !important;
-        font-weight: 500 !important;
-        cursor: pointer !important;
-        border-radius: 0 !important;
-        transition: color 0.2s, border-color 0.2s !important;
-        outline: none !important;
-        line-height: normal !important;
-        text-transform: none !important;
-        letter-spacing: normal !important;
-        display: inline-block !important;
-        color: var(--text-light) !important;
-        border-bottom: 2px solid transparent !important;
-    }
-
-    .st-key-main_pills {
-        border-bottom: 1px solid var(--border) !important;
-        margin-bottom: 1.5rem !important;
-        padding-bottom: 0.5rem !important;
-        display: flex;
-        flex-wrap: wrap;
-        gap: 0.5rem;
-    }
-
-    .st-key-main_pills button:hover {
-        color: var(--primary) !important;
-        border-bottom-color: var(--primary-light) !important;
-    }
-
-    .st-key-main_pills button[aria-pressed="true"],
-    .st-key-main_pills button[kind="pillsActive"] {
-        color: var(--primary) !important;
-        border-bottom-color: var(--primary) !important;
-    }
-
-    div[class*="st-key-sub_pills"] {
-        margin-bottom: 1rem;
-    }
-
-    div[class*="st-key-sub_pills"] button:hover {
-        color: #dc2626 !important;
-        border-bottom-color: #f87171 !important;
-    }
-
-    div[class*="st-key-sub_pills"] button[aria-pressed="true"],
-    div[class*="st-key-sub_pills"] button[kind="pillsActive"] {
-        color: #b91c1c !important;
-        border-bottom: 2px solid #b91c1c !important;
-        background: none !important;
-    }
-
-    .st-key-main_pills button:focus,
-    .st-key-main_pills button:active,
-    div[class*="st-key-sub_pills"] button:focus,
-    div[class*="st-key-sub_pills"] button:active {
-        outline: none !important;
-        box-shadow: none !important;
-        background: none !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet("admin_dashboard")
 
 # --- Get System Stats ---
 stats = get_system_stats()
@@ -461,8 +184,8 @@ elif st.session_state.main_tab == "Communication":
     sub_tabs = ["Messages"]
     sub_icons = {"Messages": "💬"}
 elif st.session_state.main_tab == "System":
-    sub_tabs = ["Analytics", "Settings"]
-    sub_icons = {"Analytics": "📈", "Settings": "⚙️"}
+    sub_tabs = ["Analytics", "AI Usage", "Settings"]
+    sub_icons = {"Analytics": "📈", "AI Usage": "🤖", "Settings": "⚙️"}
 else:
     sub_tabs = []
     sub_icons = {}
@@ -723,13 +446,7 @@ elif current_page == "Users":
                     with col_b:
                         st.markdown("**Skills & Resume:**")
                         st.markdown(f"- **Skills:** {user['skills'] or 'Not provided'}")
-                        if user['resume_path'] and os.path.exists(user['resume_path']):
-                            with open(user['resume_path'], "rb") as f:
-                                bytes_data = f.read()
-                            b64 = base64.b64encode(bytes_data).decode()
-                            href = f'<a href="data:application/octet-stream;base64,{b64}" download="{os.path.basename(user["resume_path"])}">📄 Download Resume</a>'
-                            st.markdown(href, unsafe_allow_html=True)
-                        else:
+                        if not resume_download_button(user['resume_path'], "📄 Download Resume", key=f"user_{user['id']}"):
                             st.markdown("- **Resume:** Not uploaded")
                     
                     # Role change
@@ -1040,11 +757,7 @@ elif current_page == "Applications":
                         st.markdown(f"**Cover Letter:** {app[6][:200]}...")
                     
                     if app[13]:
-                        with open(app[13], "rb") as f:
-                            bytes_data = f.read()
-                        b64 = base64.b64encode(bytes_data).decode()
-                        href = f'<a href="data:application/octet-stream;base64,{b64}" download="{os.path.basename(app[13])}">📄 Download Resume</a>'
-                        st.markdown(href, unsafe_allow_html=True)
+                        resume_download_button(app[13], "📄 Download Resume", key=f"admin_app_{app[0]}")
                     
                     if st.button("❌ Close", key=f"close_app_{app[0]}"):
                         st.session_state.pop("view_app_id", None)
@@ -1250,6 +963,61 @@ elif current_page == "Analytics":
     fig.update_layout(plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
     st.plotly_chart(fig, use_container_width=True)
 
+# --- SYSTEM: AI USAGE sub-tab ---
+elif current_page == "AI Usage":
+    st.markdown("## 🤖 AI Usage")
+
+    window = st.selectbox("Time window", [1, 24, 24 * 7, 24 * 30], index=1,
+                          format_func=lambda h: f"Last {h} hours" if h < 48 else f"Last {h // 24} days")
+    summary = get_llm_summary(since_hours=window)
+
+    if not summary:
+        st.info("No AI calls recorded in this window.")
+    else:
+        total_calls = sum(s['calls'] for s in summary)
+        total_tokens = sum(s['prompt_tokens'] + s['completion_tokens'] for s in summary)
+        total_hits = sum(s['cache_hits'] for s in summary)
+        total_fallbacks = sum(s['fallbacks'] for s in summary)
+
+        col1, col2, col3, col4 = st.columns(4)
+        for col, label, value in [
+            (col1, "AI Calls", total_calls),
+            (col2, "Tokens Used", f"{total_tokens:,}"),
+            (col3, "Shared (coalesced)", total_hits),
+            (col4, "Key Fallbacks", total_fallbacks),
+        ]:
+            with col:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div class="label">{label}</div>
+                    <div class="value">{value}</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown("### ⏱️ Latency and Tokens by Function")
+        df_summary = pd.DataFrame(summary).rename(columns={
+            'name': 'Function', 'calls': 'Calls', 'errors': 'Errors', 'cache_hits': 'Shared',
+            'p50_ms': 'p50 (ms)', 'p95_ms': 'p95 (ms)', 'p99_ms': 'p99 (ms)',
+            'prompt_tokens': 'Prompt Tokens', 'completion_tokens': 'Completion Tokens',
+            'retries': 'Retries', 'fallbacks': 'Fallbacks'
+        })
+        st.dataframe(df_summary.round(1), use_container_width=True, hide_index=True)
+
+        latencies = get_llm_latencies(since_hours=window)
+        if latencies:
+            st.markdown("### 📊 Latency Distribution")
+            df_lat = pd.DataFrame(latencies, columns=['Function', 'Latency (ms)'])
+            fig = px.histogram(df_lat, x='Latency (ms)', color='Function', nbins=40, barmode='overlay')
+            fig.update_layout(plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
+            st.plotly_chart(fig, use_container_width=True)
+
+    if st.button("🧹 Clear AI Metrics", use_container_width=True):
+        if clear_llm_metrics():
+            st.success("AI metrics cleared!")
+            st.rerun()
+        else:
+            st.error("Could not clear AI metrics (see server log).")
+
 # --- SYSTEM: SETTINGS sub-tab ---
 elif current_page == "Settings":
     st.markdown("## ⚙️ System Settings")
@@ -1309,4 +1077,7 @@ elif current_page == "Settings":
                     st.success("Cleanup completed!")
             with col_no:
                 if st.button("❌ Cancel"):
-                    st.rerun()
\ No newline at end of file
+                    st.rerun()
+
+# --- Firestore profile of this run (logs; sidebar panel with ?profile=1) ---
+profiler.render_panel()
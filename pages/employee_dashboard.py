@@ -3,12 +3,12 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import os
-import base64
 import time
 import plotly.express as px
 import random
 import string
 from datetime import datetime, timezone
+from functools import partial
 from streamlit_option_menu import option_menu
 from auth_utils import send_email, hash_password  
 from database import (
@@ -18,16 +18,23 @@ from database import (
     add_notification, get_user_notifications, mark_notifications_read,
     add_job_request, get_user_requests,
     get_conversations, get_messages, send_message, mark_messages_read,
-    get_application_stats, get_applications_over_time, get_interview_count,
+    status_counts, counts_per_day,
     delete_job_request, update_job_request, update_user_password, mark_expired_interviews, update_expired_jobs
 )
 
+from semantic_match import rank_jobs_for_profile
+import async_db
+from async_db import fan_out
+from assets import use_stylesheet
+from downloads import resume_download_button
+import profiler
+import blobstore
 from utils import get_resume_goodness_score, parse_resume_with_groq, extract_text_from_pdf, get_ai_career_suggestions, fetch_github_repos
 import json
 import re
 
-update_expired_jobs()
-mark_expired_interviews()
+profiler.begin_run("employee_dashboard")
+mark_expired_interviews()  # before the summary read: it updates scheduled_interviews
 
 # --- EMAIL FUNCTION (place in auth_utils.py, but included here for completeness) ---
 from email.message import EmailMessage
@@ -54,25 +61,6 @@ def send_email(to_email, subject, body):
         print(f"Email error: {e}")
         return False
 
-# --- Helper to count unread messages for employee ---
-def get_unread_messages_count_employee(employee_id):
-    """Count unread messages from companies to this employee."""
-    from database import db
-    msgs_ref = db.collection('messages')\
-                 .where('receiver_id', '==', employee_id)\
-                 .where('receiver_type', '==', 'employee')\
-                 .where('is_read', '==', False)
-    return len(list(msgs_ref.stream()))
-
-# --- Helper to count unread notifications ---
-def get_unread_notifications_count(user_id):
-    """Return the number of unread notifications for the employee."""
-    from database import db
-    notifications_ref = db.collection('notifications')\
-                          .where('user_id', '==', user_id)\
-                          .where('is_read', '==', False)
-    return len(list(notifications_ref.stream()))
-
 # --- Password change OTP handling ---
 def generate_otp(length=6):
     return ''.join(random.choices(string.digits, k=length))
@@ -182,15 +170,6 @@ def calculate_match_score(job, profile):
 
     return int(score)
 
-def get_resume_download_link(resume_path, text="Download Resume"):
-    if resume_path and os.path.exists(resume_path):
-        with open(resume_path, "rb") as f:
-            bytes_data = f.read()
-        b64 = base64.b64encode(bytes_data).decode()
-        href = f'<a href="data:application/octet-stream;base64,{b64}" download="{os.path.basename(resume_path)}" style="color: var(--primary); text-decoration: none;">{text}</a>'
-        return href
-    return None
-
 def display_recruiter_profile(user, profile):
     # Index constants (should be defined earlier)
     IDX_PHONE = 1
@@ -208,57 +187,6 @@ def display_recruiter_profile(user, profile):
     IDX_JOB_ALERTS = 14
     IDX_VIDEO = 15
 
-    # Cover image placeholder (gradient)
-    st.markdown("""
-    <style>
-    .cover-image {
-        height: 200px;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 16px 16px 0 0;
-        margin-bottom: -60px;
-    }
-    .profile-pic {
-        width: 120px;
-        height: 120px;
-        border-radius: 50%;
-        border: 4px solid white;
-        background: linear-gradient(135deg, var(--primary), #3B82F6);
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        color: white;
-        font-size: 3rem;
-        font-weight: bold;
-        margin-left: 2rem;
-        margin-bottom: 1rem;
-        box-shadow: 0 4px 10px rgba(0,0,0,0.1);
-    }
-    .section-title {
-        font-size: 1.4rem;
-        font-weight: 600;
-        margin: 1.5rem 0 1rem;
-        color: var(--text);
-    }
-    .skill-tag {
-        background: #e2e8f0;
-        padding: 0.3rem 1rem;
-        border-radius: 30px;
-        font-size: 0.9rem;
-        margin-right: 0.5rem;
-        margin-bottom: 0.5rem;
-        display: inline-block;
-    }
-    .project-card {
-        background: white;
-        border: 1px solid var(--border);
-        border-radius: 16px;
-        padding: 1rem;
-        margin-bottom: 1rem;
-        box-shadow: var(--shadow-sm);
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
     # Cover
     st.markdown('<div class="cover-image"></div>', unsafe_allow_html=True)
 
@@ -370,9 +298,9 @@ def display_recruiter_profile(user, profile):
             st.info("No projects added.")
 
         # Video Introduction
-        if len(profile) > IDX_VIDEO and profile[IDX_VIDEO] and os.path.exists(profile[IDX_VIDEO]):
+        if len(profile) > IDX_VIDEO and profile[IDX_VIDEO] and blobstore.exists(profile[IDX_VIDEO]):
             st.markdown("### 🎥 Video Introduction")
-            st.video(profile[IDX_VIDEO])
+            st.video(blobstore.local_path(profile[IDX_VIDEO]) or blobstore.read(profile[IDX_VIDEO]))
 
     st.markdown("---")
 
@@ -388,321 +316,22 @@ def display_recruiter_profile(user, profile):
         st.markdown("### 🌐 Connect")
         st.markdown(" | ".join(social_links))
 
-# --- Custom CSS (softer, less blue, buttons auto width) ---
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-
-    * {
-        font-family: 'Inter', sans-serif;
-    }
-
-    :root {
-        --primary: #2563EB;
-        --primary-light: #60A5FA;
-        --primary-dark: #1E40AF;
-        --secondary: #0EA5E9;
-        --accent: #10B981;
-        --bg: #F8FAFC;
-        --card-bg: #FFFFFF;
-        --text: #1E293B;
-        --text-light: #64748B;
-        --border: #E2E8F0;
-        --shadow-sm: 0 1px 3px 0 rgba(0,0,0,0.1), 0 1px 2px 0 rgba(0,0,0,0.06);
-        --shadow-lg: 0 10px 15px -3px rgba(0,0,0,0.1), 0 4px 6px -2px rgba(0,0,0,0.05);
-    }
-
-    .stApp {
-        background: #F1F5F9;
-    }
-
-    .badge-count {
-        background: #EF4444;
-        color: white;
-        font-size: 0.7rem;
-        font-weight: 600;
-        padding: 0.2rem 0.5rem;
-        border-radius: 40px;
-        line-height: 1;
-        display: inline-block;
-        margin-left: 0.3rem;
-    }
-
-    /* Hero header */
-    .hero-header {
-        background: linear-gradient(135deg, var(--primary), #3B82F6);
-        padding: 1.5rem 2rem;
-        border-radius: 30px;
-        color: white;
-        margin: 1rem 0 1.5rem 0;
-        box-shadow: var(--shadow-lg);
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-    }
-
-    .hero-header h1 {
-        margin: 0;
-        font-size: 1.8rem;
-        font-weight: 600;
-    }
-
-    .hero-header p {
-        margin: 0.2rem 0 0;
-        opacity: 0.9;
-        font-size: 1rem;
-    }
-
-    .date-badge {
-        background: rgba(255,255,255,0.2);
-        padding: 0.4rem 1.2rem;
-        border-radius: 40px;
-        font-weight: 500;
-        backdrop-filter: blur(5px);
-        border: 1px solid rgba(255,255,255,0.3);
-    }
-
-    /* Notification card */
-    .notification-card {
-        background: white;
-        border-radius: 20px;
-        padding: 1rem;
-        border: 1px solid var(--border);
-        box-shadow: var(--shadow-sm);
-        transition: transform 0.2s;
-        height: 100%;
-        display: flex;
-        flex-direction: column;
-    }
-
-    .notification-card:hover {
-        transform: translateY(-3px);
-        box-shadow: var(--shadow-lg);
-    }
-
-    .notification-icon {
-        width: 36px;
-        height: 36px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.1rem;
-        margin-bottom: 0.5rem;
-    }
-
-    .notification-title {
-        font-weight: 600;
-        color: var(--text);
-        margin-bottom: 0.2rem;
-        font-size: 0.9rem;
-    }
-
-    .notification-content {
-        font-size: 0.85rem;
-        color: var(--text-light);
-        margin-bottom: 0.3rem;
-    }
-
-    .notification-time {
-        font-size: 0.65rem;
-        color: var(--text-light);
-        margin-top: auto;
-    }
-
-    /* Stat cards */
-    .stat-card {
-        background: white;
-        padding: 1.2rem;
-        border-radius: 24px;
-        border: 1px solid var(--border);
-        box-shadow: var(--shadow-sm);
-        transition: transform 0.2s;
-        text-align: center;
-    }
-
-    .stat-card:hover {
-        transform: translateY(-3px);
-        box-shadow: var(--shadow-lg);
-    }
-
-    .stat-card h3 {
-        color: var(--text-light);
-        font-size: 0.85rem;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-        margin-bottom: 0.3rem;
-    }
-
-    .stat-card p {
-        font-size: 2rem;
-        font-weight: 600;
-        color: var(--primary);
-        margin: 0;
-    }
-
-    .metric-card {
-        background: white;
-        padding: 0.8rem 1.2rem;
-        border-radius: 24px;
-        border: 1px solid var(--border);
-        box-shadow: var(--shadow-sm);
-        text-align: center;
-    }
-
-    .metric-card .label {
-        color: var(--text-light);
-        font-size: 0.75rem;
-        text-transform: uppercase;
-    }
-
-    .metric-card .value {
-        font-size: 1.5rem;
-        font-weight: 600;
-        color: var(--primary);
-        line-height: 1.2;
-    }
-
-    .metric-card .delta {
-        font-size: 0.75rem;
-        color: var(--accent);
-    }
-
-    .section-title {
-        font-size: 1.3rem;
-        font-weight: 600;
-        color: var(--text);
-        margin: 1.5rem 0 1rem;
-    }
+# --- Custom CSS (softer, less blue, buttons auto width; also pills and profile header) ---
+use_stylesheet("employee_dashboard")
 
-    /* Job / company cards */
-    .job-card, .company-card {
-        background: white;
-        padding: 1.2rem;
-        border-radius: 20px;
-        border: 1px solid var(--border);
-        transition: all 0.2s;
-        margin-bottom: 0.8rem;
-    }
-    .job-card:hover, .company-card:hover {
-        box-shadow: var(--shadow-lg);
-        border-color: var(--primary);
-    }
-
-    /* Buttons - auto width, outline for secondary */
-    .stButton > button {
-        border-radius: 40px;
-        font-weight: 500;
-        transition: all 0.2s;
-        border: 1px solid transparent;
-        padding: 0.4rem 1.2rem;
-        background: var(--primary);
-        color: white;
-        box-shadow: var(--shadow-sm);
-        width: auto !important;
-    }
-
-    .stButton > button[kind="secondary"] {
-        background: white;
-        color: var(--primary);
-        border: 1px solid var(--primary);
-    }
-
-    .stButton > button:hover {
-        transform: translateY(-1px);
-        box-shadow: 0 4px 8px -2px rgba(37, 99, 235, 0.3);
-    }
-
-    /* Text links for navigation */
-    .nav-link {
-        color: var(--text-light);
-        font-weight: 500;
-        padding: 0.5rem 0;
-        text-decoration: none;
-        border-bottom: 2px solid transparent;
-        transition: all 0.2s;
-        cursor: pointer;
-        display: inline-block;
-        margin-right: 1.5rem;
-    }
-    .nav-link.active {
-        color: var(--primary);
-        border-bottom-color: var(--primary);
-    }
-    .nav-link:hover {
-        color: var(--primary);
-    }
-
-    /* Form inputs */
-    .stTextInput > div > div > input, .stTextArea > div > textarea, .stSelectbox > div > div > select {
-        border-radius: 30px;
-        border: 1px solid var(--border);
-        padding: 0.6rem 1.2rem;
-        background: white;
-        box-shadow: inset 0 1px 2px rgba(0,0,0,0.02);
-    }
-
-    .stTextInput > div > div > input:focus {
-        border-color: var(--primary);
-        box-shadow: 0 0 0 2px rgba(37, 99, 235, 0.2);
-    }
-
-    /* Chat container */
-    .chat-container {
-        max-height: 400px;
-        overflow-y: auto;
-        padding: 1rem;
-        border-radius: 24px;
-        background: #F9FAFB;
-        border: 1px solid var(--border);
-        margin-bottom: 1rem;
-    }
-
-    .chat-bubble-employee {
-        background: var(--primary);
-        color: white;
-        padding: 0.6rem 1rem;
-        border-radius: 20px 20px 0 20px;
-        max-width: 70%;
-        display: inline-block;
-        margin: 0.3rem 0;
-        text-align: left;
-    }
-
-    .chat-bubble-company {
-        background: white;
-        color: var(--text);
-        padding: 0.6rem 1rem;
-        border-radius: 20px 20px 20px 0;
-        max-width: 70%;
-        display: inline-block;
-        margin: 0.3rem 0;
-        text-align: left;
-        border: 1px solid var(--border);
-    }
-
-    .chat-timestamp {
-        font-size: 0.65rem;
-        opacity: 0.7;
-        margin-top: 0.2rem;
-    }
-
-    hr {
-        margin: 1.5rem 0;
-        border: 0;
-        border-top: 1px solid var(--border);
-    }
-""", unsafe_allow_html=True)
-
-# --- Fetch counts for badges ---
+# --- Fetch counts for badges (one summary document read, alongside the job expiry sweep) ---
 user_id = st.session_state.user_id
-applications = get_user_applications(user_id)
-total_apps = len(applications)
-pending_apps = sum(1 for a in applications if a[4] == 'pending')
-interview_count = get_interview_count(user_id)
-saved_count = len(get_saved_jobs(user_id))
-unread_msgs = get_unread_messages_count_employee(user_id)
-unread_notifications = get_unread_notifications_count(user_id)
+header = fan_out(
+    expired_jobs=update_expired_jobs,
+    summary=async_db.dashboard_summary(user_id),
+)
+summary = header['summary']
+total_apps = summary['total_applications']
+pending_apps = summary['pending_applications']
+interview_count = summary['scheduled_interviews']
+saved_count = summary['saved_jobs']
+unread_msgs = summary['unread_messages']
+unread_notifications = summary['unread_notifications']
 
 # --- Hero Header ---
 st.markdown(f"""
@@ -717,110 +346,6 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-# --- Styling for pills as underlined tabs ---
-st.markdown("""
-<style>
-    /* ===== RESET ONLY FOR PILLS BUTTONS ===== */
-    /* Main pills buttons */
-    .st-key-main_pills button {
-        all: unset; /* start fresh */
-        background: none !important;
-        border: none !important;
-        box-shadow: none !important;
-        padding: 0.5rem 0.8rem !important;
-        margin: 0 !important;
-        font-family: inherit !important;
-        font-size: 1rem !important;
-        font-weight: 500 !important;
-        cursor: pointer !important;
-        border-radius: 0 !important;
-        transition: color 0.2s, border-color 0.2s !important;
-        outline: none !important;
-        line-height: normal !important;
-        text-transform: none !important;
-        letter-spacing: normal !important;
-        display: inline-block !important;
-        color: var(--text-light) !important;
-        border-bottom: 2px solid transparent !important;
-    }
-
-    /* Sub pills buttons – any container with class containing "st-key-sub_pills" */
-    div[class*="st-key-sub_pills"] button {
-        all: unset;
-        background: none !important;
-        border: none !important;
-        box-shadow: none !important;
-        padding: 0.5rem 0.8rem !important;
-        margin: 0 !important;
-        font-family: inherit !important;
-        font-size: 1rem !important;
-        font-weight: 500 !important;
-        cursor: pointer !important;
-        border-radius: 0 !important;
-        transition: color 0.2s, border-color 0.2s !important;
-        outline: none !important;
-        line-height: normal !important;
-        text-transform: none !important;
-        letter-spacing: normal !important;
-        display: inline-block !important;
-        color: var(--text-light) !important;
-        border-bottom: 2px solid transparent !important;
-    }
-
-    /* ===== MAIN PILLS CONTAINER ===== */
-    .st-key-main_pills {
-        border-bottom: 1px solid var(--border) !important;
-        margin-bottom: 1.5rem !important;
-        padding-bottom: 0.5rem !important;
-        display: flex;
-        flex-wrap: wrap;
-        gap: 0.5rem;
-    }
-
-    /* Main pills hover */
-    .st-key-main_pills button:hover {
-        color: var(--primary) !important;
-        border-bottom-color: var(--primary-light) !important;
-    }
-
-    /* Main pills active (opened) – using both aria and kind attributes */
-    .st-key-main_pills button[aria-pressed="true"],
-    .st-key-main_pills button[kind="pillsActive"] {
-        color: var(--primary) !important;
-        border-bottom-color: var(--primary) !important;
-    }
-
-    /* ===== SUB PILLS CONTAINER ===== */
-    div[class*="st-key-sub_pills"] {
-        margin-bottom: 1rem;
-    }
-
-    /* Sub pills hover */
-    div[class*="st-key-sub_pills"] button:hover {
-        color: #dc2626 !important;
-        border-bottom-color: #f87171 !important;
-    }
-
-    /* Sub pills active (opened) – red theme */
-    div[class*="st-key-sub_pills"] button[aria-pressed="true"],
-    div[class*="st-key-sub_pills"] button[kind="pillsActive"] {
-        color: #b91c1c !important;
-        border-bottom: 2px solid #b91c1c !important;
-        background: none !important;
-    }
-
-    /* Remove focus rings from all pills buttons */
-    .st-key-main_pills button:focus,
-    .st-key-main_pills button:active,
-    div[class*="st-key-sub_pills"] button:focus,
-    div[class*="st-key-sub_pills"] button:active {
-        outline: none !important;
-        box-shadow: none !important;
-        background: none !important;
-    }
-</style>
-""", unsafe_allow_html=True)
-
 # --- NAVIGATION using pills ---
 
 if "main_tab" not in st.session_state:
@@ -916,6 +441,16 @@ else:
 current_page = st.session_state.sub_tab if st.session_state.sub_tab else st.session_state.main_tab
 if current_page == "Dashboard":
     st.markdown("## 📊 Overview")
+    # Independent reads for this page, run concurrently
+    overview = fan_out(
+        applications=partial(get_user_applications, user_id),
+        notifications=async_db.user_notifications(user_id, limit=10),
+        profile=partial(get_or_create_profile, user_id),
+        jobs=partial(search_jobs, user_id),
+    )
+    applications = overview['applications']
+    # The charts come from the same applications read (status is [4], applied_at [7])
+    app_datas = [{'status': app[4], 'applied_at': app[7]} for app in applications]
 
     # --- Key Metrics Row (6 cards) ---
     metric1, metric2, metric3, metric4, metric5, metric6 = st.columns(6)
@@ -927,7 +462,7 @@ if current_page == "Dashboard":
         st.markdown(f'<div class="stat-card"><h3>⏳ Pending</h3><p>{pending_apps}</p></div>', unsafe_allow_html=True)
     with metric4:
         # Calculate offers (accepted applications)
-        offers = sum(1 for a in applications if a[4] == 'accepted')
+        offers = summary['accepted_applications']
         st.markdown(f'<div class="stat-card"><h3>🎉 Offers</h3><p>{offers}</p></div>', unsafe_allow_html=True)
     with metric5:
         st.markdown(f'<div class="stat-card"><h3>🔖 Saved</h3><p>{saved_count}</p></div>', unsafe_allow_html=True)
@@ -969,7 +504,7 @@ if current_page == "Dashboard":
 
     with col_right:
         st.markdown("#### 🔔 Recent Activity")
-        recent_notifications = get_user_notifications(user_id, limit=10)
+        recent_notifications = overview['notifications']
         if recent_notifications:
             for notif in recent_notifications[:2]:  # show latest 2
                 icon = "📝" if notif[2] == 'application' else "💬" if notif[2] == 'message' else "🔔"
@@ -995,7 +530,7 @@ if current_page == "Dashboard":
     col_chart1, col_chart2 = st.columns(2)
 
     with col_chart1:
-        stats = get_application_stats(user_id)
+        stats = status_counts(app_datas)
         if stats:
             df_stats = pd.DataFrame(stats, columns=['status', 'count'])
             fig_pie = px.pie(df_stats, values='count', names='status', title='🥧 Application Status',
@@ -1011,7 +546,7 @@ if current_page == "Dashboard":
             st.info("No application status data.")
 
     with col_chart2:
-        timeline = get_applications_over_time(user_id)
+        timeline = counts_per_day(app_datas)
         if timeline:
             df_timeline = pd.DataFrame(timeline, columns=['date', 'count'])
             fig_line = px.line(df_timeline, x='date', y='count', title='📈 Applications Over Time',
@@ -1055,22 +590,22 @@ if current_page == "Dashboard":
 
     with col_bottom2:
         st.markdown("#### 💡 Job Recommendations")
-        profile = get_or_create_profile(user_id)
+        profile = overview['profile']
         employee_skills = profile[5] if profile else ""
-        jobs = search_jobs(user_id)
-        # Compute match score and filter for not applied, good match
+        jobs = overview['jobs']
+        # A match of 70 needs skill points (everything else is worth 40), so only
+        # not-applied jobs whose skills overlap the profile's can qualify: skip the rest
+        open_jobs = [job_tuple_to_dict(j) for j in jobs if j[17] != 1]
         recommendations = []
-        for job_tuple in jobs:
-            if job_tuple[17] == 1:  # already applied
-                continue
-            match = calculate_match_score(job_tuple_to_dict(job_tuple), profile)
+        for job, _ in rank_jobs_for_profile(open_jobs, profile, skills_only=True):
+            match = calculate_match_score(job, profile)
             if match >= 70:  # good match threshold
                 recommendations.append({
-                    'id': job_tuple[0],
-                    'title': job_tuple[3],
-                    'company': job_tuple[15],
-                    'location': job_tuple[7],
-                    'job_type': job_tuple[8],
+                    'id': job['id'],
+                    'title': job['title'],
+                    'company': job['company_name2'],
+                    'location': job['location'],
+                    'job_type': job['job_type'],
                     'match': match
                 })
         recommendations = sorted(recommendations, key=lambda x: x['match'], reverse=True)[:2]  # top 2 recommendations
@@ -1153,7 +688,9 @@ elif current_page == "Find Jobs":
                 if not profile[4]:
                     st.error("Please upload your resume first")
                 else:
-                    add_application(job['id'], user_id, job['company_id'], match_score, cover_letter)
+                    if not add_application(job['id'], user_id, job['company_id'], match_score, cover_letter):
+                        st.warning("You have already applied for this job.")
+                        st.stop()
                     add_notification(user_id, "application", "Application Submitted",
                                    f"You applied for {job['title']} at {job['company_name']}")
                     send_email(
@@ -1384,7 +921,9 @@ elif current_page == "Companies":
                 if not profile[4]:
                     st.error("Please upload your resume first")
                 else:
-                    add_application(job['id'], user_id, job['company_id'], match_score, cover_letter)
+                    if not add_application(job['id'], user_id, job['company_id'], match_score, cover_letter):
+                        st.warning("You have already applied for this job.")
+                        st.stop()
                     add_notification(user_id, "application", "Application Submitted",
                                    f"You applied for {job['title']} at {job['company_name']}")
                     send_email(
@@ -2117,7 +1656,7 @@ elif current_page == "Profile":
         st.markdown("#### 📄 Resume/CV")
 
         if profile[IDX_RESUME]:
-            st.markdown(get_resume_download_link(profile[IDX_RESUME], "📥 Download Current Resume"), unsafe_allow_html=True)
+            resume_download_button(profile[IDX_RESUME], "📥 Download Current Resume")
 
         uploaded_file = st.file_uploader("Upload New Resume (PDF)", type=['pdf'], key="resume_uploader")
 
@@ -2161,11 +1700,8 @@ elif current_page == "Profile":
                         else:
                             parsed = parse_resume_with_groq(resume_text)
                             if parsed:
-                                resume_dir = "resumes"
-                                os.makedirs(resume_dir, exist_ok=True)
-                                resume_path = os.path.join(resume_dir, f"{user[2]}_{st.session_state.uploaded_resume.name}")
-                                with open(resume_path, "wb") as f:
-                                    f.write(file_bytes)
+                                # Stored by content hash; the profile keeps only the reference
+                                resume_path = blobstore.put(file_bytes, st.session_state.uploaded_resume.name, "application/pdf")
 
                                 # Filter projects
                                 projects = [
@@ -2186,6 +1722,7 @@ elif current_page == "Profile":
                                     projects=json.dumps(projects),
                                     resume_path=resume_path
                                 )
+                                blobstore.release(profile[IDX_RESUME])
 
                                 st.success("✅ Profile autofilled from resume!")
                                 st.session_state.uploaded_resume = None
@@ -2219,19 +1756,20 @@ elif current_page == "Profile":
 
         video_path = profile[IDX_VIDEO] if len(profile) > IDX_VIDEO else None
 
-        if video_path and os.path.exists(video_path):
-            st.video(video_path)
+        if video_path and blobstore.exists(video_path):
+            st.video(blobstore.local_path(video_path) or blobstore.read(video_path))
             col_dl, col_del = st.columns(2)
             with col_dl:
-                with open(video_path, "rb") as f:
-                    video_bytes = f.read()
-                st.download_button("📥 Download Video", data=video_bytes,
-                                   file_name=os.path.basename(video_path),
-                                   use_container_width=True)
+                st.download_button("📥 Download Video", data=lambda: blobstore.read(video_path),
+                                   file_name=blobstore.file_name(video_path),
+                                   use_container_width=True, on_click="ignore")
             with col_del:
                 if st.button("🗑️ Delete Video", use_container_width=True):
-                    os.remove(video_path)
                     update_profile(user_id, video_path="")
+                    if blobstore.is_blob_ref(video_path):
+                        blobstore.release(video_path)
+                    else:
+                        os.remove(video_path)
                     st.rerun()
         else:
             st.info("No video introduction uploaded.")
@@ -2245,13 +1783,10 @@ elif current_page == "Profile":
                 st.error("File too large. Please keep under 50MB.")
             else:
                 if st.button("💾 Save Video Introduction"):
-                    video_dir = "videos"
-                    os.makedirs(video_dir, exist_ok=True)
-                    video_filename = f"{user[2]}_{uploaded_video.name}"
-                    video_path_save = os.path.join(video_dir, video_filename)
-                    with open(video_path_save, "wb") as f:
-                        f.write(uploaded_video.getbuffer())
-                    update_profile(user_id, video_path=video_path_save)
+                    video_ref = blobstore.put(uploaded_video.getvalue(), uploaded_video.name, uploaded_video.type)
+                    update_profile(user_id, video_path=video_ref)
+                    if video_path and blobstore.is_blob_ref(video_path):
+                        blobstore.release(video_path)
                     st.success("Video uploaded successfully!")
                     st.rerun()
 
@@ -2498,9 +2033,11 @@ elif current_page == "Profile":
                     
 elif current_page == "Analytics":
     st.markdown("## 📊 My Analytics")
-    stats = get_application_stats(user_id)
-    timeline = get_applications_over_time(user_id)
-    interview_count = get_interview_count(user_id)
+    analytics = fan_out(
+        charts=async_db.application_charts(user_id),
+        interview_count=async_db.interview_count(user_id),
+    )
+    (stats, timeline), interview_count = analytics['charts'], analytics['interview_count']
     total = sum(s[1] for s in stats)
     pending = next((s[1] for s in stats if s[0] == 'pending'), 0)
     accepted = next((s[1] for s in stats if s[0] == 'accepted'), 0)
@@ -2540,3 +2077,5 @@ elif current_page == "Analytics":
         </div>
         """, unsafe_allow_html=True)
 
+# --- Firestore profile of this run (logs; sidebar panel with ?profile=1) ---
+profiler.render_panel()
@@ -1,7 +1,6 @@
 import streamlit as st
 import pandas as pd
 import os
-import base64
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
@@ -18,16 +17,22 @@ from database import (
     upsert_interview, mark_company_messages_read, get_company_conversations,
     delete_job, get_company_jobs_all,
     get_new_applications_count, get_unread_messages_count, get_recent_activities,
-    get_job_by_id, get_users_by_role, get_or_create_profile,
+    get_job_by_id, get_users_by_role, get_profiles,
     update_company_password, is_receiving_alerts
 )
 import random
 from database import update_expired_jobs
 from ATSService import evaluate_candidate
+from semantic_match import rank_profiles_for_job, SemanticIndex
+from assets import use_stylesheet
+from downloads import resume_download_button
+import profiler
+import blobstore
 import io
 import time
 import pytz
 
+profiler.begin_run("employer_dashboard")
 update_expired_jobs()
 mark_expired_interviews()
     
@@ -44,355 +49,14 @@ if "employer_authenticated" not in st.session_state or not st.session_state.empl
     st.switch_page("pages/login_employer.py")
     st.stop()
 
-# --- Helper functions ---
-def get_resume_download_link(resume_path, text="Download Resume"):
-    if resume_path and os.path.exists(resume_path):
-        with open(resume_path, "rb") as f:
-            bytes_data = f.read()
-        b64 = base64.b64encode(bytes_data).decode()
-        href = f'<a href="data:application/octet-stream;base64,{b64}" download="{os.path.basename(resume_path)}" class="badge badge-info">{text}</a>'
-        return href
-    return None
+# Alerts need calculate_match_score >= 60, and everything except skills is worth
+# at most 40, so a candidate needs a skill that fuzzy-matches one of the job's.
+# Such skills share words or character trigrams, so skipping only candidates
+# whose skills share no feature at all (similarity 0) drops nobody who qualifies.
+ALERT_MIN_SIMILARITY = 0.0
 
 # --- Custom CSS (ultra‑classy) ---
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-
-    * {
-        font-family: 'Inter', sans-serif;
-    }
-
-    :root {
-        --primary: #4F46E5;
-        --primary-light: #818CF8;
-        --primary-dark: #3730A3;
-        --secondary: #0EA5E9;
-        --accent: #10B981;
-        --bg: #F8FAFC;
-        --card-bg: rgba(255,255,255,0.9);
-        --text: #0F172A;
-        --text-light: #475569;
-        --border: #E2E8F0;
-        --shadow-sm: 0 4px 6px -1px rgba(0,0,0,0.05), 0 2px 4px -1px rgba(0,0,0,0.03);
-        --shadow-lg: 0 20px 25px -5px rgba(0,0,0,0.1), 0 10px 10px -5px rgba(0,0,0,0.02);
-        --glass-bg: rgba(255,255,255,0.7);
-        --glass-border: 1px solid rgba(255,255,255,0.5);
-    }
-
-    .stApp {
-        background: radial-gradient(circle at 10% 30%, rgba(255,255,255,0.95) 0%, #f1f5f9 100%);
-    }
-
-    .badge-count {
-        background: #EF4444;
-        color: white;
-        font-size: 0.75rem;
-        font-weight: 600;
-        padding: 0.25rem 0.6rem;
-        border-radius: 40px;
-        line-height: 1;
-        display: inline-block;
-        box-shadow: 0 2px 4px rgba(239, 68, 68, 0.3);
-    }
-
-    /* Hero header */
-    .hero-header {
-        background: linear-gradient(135deg, var(--primary), var(--secondary));
-        padding: 2rem 2.5rem;
-        border-radius: 40px;
-        color: white;
-        margin: 1.5rem 0 2rem 0;
-        box-shadow: var(--shadow-lg);
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        backdrop-filter: blur(5px);
-    }
-
-    .hero-header h1 {
-        margin: 0;
-        font-size: 2.2rem;
-        font-weight: 700;
-        letter-spacing: -0.02em;
-    }
-
-    .hero-header p {
-        margin: 0.5rem 0 0;
-        opacity: 0.9;
-        font-size: 1.1rem;
-    }
-
-    .date-badge {
-        background: rgba(255,255,255,0.2);
-        padding: 0.5rem 1.5rem;
-        border-radius: 40px;
-        font-weight: 500;
-        backdrop-filter: blur(5px);
-        border: 1px solid rgba(255,255,255,0.3);
-    }
-
-    /* Notification card */
-    .notification-card {
-        background: var(--glass-bg);
-        backdrop-filter: blur(10px);
-        -webkit-backdrop-filter: blur(10px);
-        border-radius: 24px;
-        padding: 1rem;
-        border: var(--glass-border);
-        box-shadow: var(--shadow-sm);
-        transition: transform 0.2s, box-shadow 0.2s;
-        height: 100%;
-        display: flex;
-        flex-direction: column;
-    }
-
-    .notification-card:hover {
-        transform: translateY(-5px);
-        box-shadow: var(--shadow-lg);
-    }
-
-    .notification-icon {
-        width: 40px;
-        height: 40px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.2rem;
-        margin-bottom: 0.75rem;
-    }
-
-    .notification-title {
-        font-weight: 600;
-        color: var(--text);
-        margin-bottom: 0.25rem;
-        font-size: 0.95rem;
-    }
-
-    .notification-time {
-        font-size: 0.7rem;
-        color: var(--text-light);
-        margin-top: auto;
-    }
-
-    /* Stat cards */
-    .stat-card {
-        background: var(--glass-bg);
-        backdrop-filter: blur(10px);
-        -webkit-backdrop-filter: blur(10px);
-        padding: 1.5rem;
-        border-radius: 30px;
-        border: var(--glass-border);
-        box-shadow: var(--shadow-sm);
-        transition: transform 0.2s, box-shadow 0.2s;
-        text-align: center;
-    }
-
-    .stat-card:hover {
-        transform: translateY(-5px);
-        box-shadow: var(--shadow-lg);
-    }
-
-    .stat-card h3 {
-        color: var(--text-light);
-        font-size: 0.9rem;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-        margin-bottom: 0.5rem;
-    }
-
-    .stat-card p {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: var(--primary);
-        margin: 0;
-    }
-
-    .metric-card {
-        background: var(--glass-bg);
-        backdrop-filter: blur(10px);
-        -webkit-backdrop-filter: blur(10px);
-        padding: 1rem 1.5rem;
-        border-radius: 30px;
-        border: var(--glass-border);
-        box-shadow: var(--shadow-sm);
-        text-align: center;
-    }
-
-    .metric-card .label {
-        color: var(--text-light);
-        font-size: 0.8rem;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-
-    .metric-card .value {
-        font-size: 1.8rem;
-        font-weight: 700;
-        color: var(--primary);
-        line-height: 1.2;
-    }
-
-    .metric-card .delta {
-        font-size: 0.8rem;
-        color: var(--accent);
-    }
-
-    .section-title {
-        font-size: 1.5rem;
-        font-weight: 600;
-        color: var(--text);
-        margin: 2rem 0 1rem;
-        letter-spacing: -0.01em;
-    }
-
-    /* Buttons */
-    .stButton > button {
-        border-radius: 40px;
-        font-weight: 500;
-        transition: all 0.2s;
-        border: none;
-        padding: 0.5rem 1.5rem;
-        background: var(--primary);
-        color: white;
-        box-shadow: var(--shadow-sm);
-    }
-
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 16px -4px rgba(79, 70, 229, 0.4);
-    }
-
-    /* Form inputs */
-    .stTextInput > div > div > input, .stTextArea > div > textarea, .stSelectbox > div > div > select {
-        border-radius: 30px;
-        border: 1px solid var(--border);
-        padding: 0.75rem 1.5rem;
-        background: white;
-        box-shadow: inset 0 2px 4px rgba(0,0,0,0.02);
-    }
-
-    .stTextInput > div > div > input:focus, .stTextArea > div > textarea:focus {
-        border-color: var(--primary);
-        box-shadow: 0 0 0 3px rgba(79, 70, 229, 0.2);
-    }
-
-    /* Chat container */
-    .chat-container {
-        max-height: 400px;
-        overflow-y: auto;
-        padding: 1rem;
-        border-radius: 30px;
-        background: var(--glass-bg);
-        backdrop-filter: blur(10px);
-        -webkit-backdrop-filter: blur(10px);
-        border: var(--glass-border);
-        margin-bottom: 1rem;
-    }
-
-    .chat-bubble-company {
-        background: var(--primary);
-        color: white;
-        padding: 0.75rem 1rem;
-        border-radius: 20px 20px 0 20px;
-        max-width: 70%;
-        display: inline-block;
-        margin: 0.5rem 0;
-        text-align: left;
-        box-shadow: var(--shadow-sm);
-    }
-
-    .chat-bubble-employee {
-        background: white;
-        color: var(--text);
-        padding: 0.75rem 1rem;
-        border-radius: 20px 20px 20px 0;
-        max-width: 70%;
-        display: inline-block;
-        margin: 0.5rem 0;
-        text-align: left;
-        box-shadow: var(--shadow-sm);
-        border: 1px solid var(--border);
-    }
-
-    .chat-timestamp {
-        font-size: 0.7rem;
-        opacity: 0.7;
-        margin-top: 0.25rem;
-    }
-
-    hr {
-        margin: 2rem 0;
-        border: 0;
-        border-top: 1px solid var(--border);
-    }
-
-    /* ===== PILLS STYLING (employer theme) ===== */
-    div[class*="st-key-"] button {
-        background: none !important;
-        border: none !important;
-        box-shadow: none !important;
-        padding: 0.5rem 0.8rem !important;
-        margin: 0 !important;
-        font-family: inherit !important;
-        font-size: 1rem !important;
-        font-weight: 500 !important;
-        cursor: pointer !important;
-        border-radius: 0 !important;
-        border-bottom: 2px solid transparent !important;
-        transition: color 0.2s, border-color 0.2s !important;
-        outline: none !important;
-        line-height: normal !important;
-        text-transform: none !important;
-        letter-spacing: normal !important;
-        display: inline-block !important;
-        color: var(--text-light) !important;
-    }
-
-    .st-key-main_pills {
-        border-bottom: 1px solid var(--border) !important;
-        margin-bottom: 1.5rem !important;
-        padding-bottom: 0.5rem !important;
-        display: flex;
-        flex-wrap: wrap;
-        gap: 0.5rem;
-    }
-
-    .st-key-main_pills button:hover {
-        color: var(--primary) !important;
-        border-bottom-color: var(--primary-light) !important;
-    }
-
-    .st-key-main_pills button[aria-pressed="true"],
-    .st-key-main_pills button[kind="pillsActive"] {
-        color: var(--primary) !important;
-        border-bottom-color: var(--primary) !important;
-    }
-
-    div[class*="st-key-sub_pills"] {
-        margin-bottom: 1rem;
-    }
-
-    div[class*="st-key-sub_pills"] button:hover {
-        color: var(--secondary) !important;
-        border-bottom-color: var(--secondary) !important;
-    }
-
-    div[class*="st-key-sub_pills"] button[aria-pressed="true"],
-    div[class*="st-key-sub_pills"] button[kind="pillsActive"] {
-        color: var(--secondary) !important;
-        border-bottom-color: var(--secondary) !important;
-    }
-
-    div[class*="st-key-"] button:focus,
-    div[class*="st-key-"] button:active {
-        outline: none !important;
-        box-shadow: none !important;
-        background: none !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet("employer_dashboard")
 
 # --- Fetch counts for badges (still used in content) ---
 company_id = st.session_state.company_id
@@ -694,9 +358,14 @@ elif current_page == "Post a Job":
                             'saved': 0,
                         }
 
-                        for emp in employees:
-                            emp_email = emp['email']
-                            profile = get_or_create_profile(emp_email)
+                        profiles = get_profiles([emp['email'] for emp in employees])
+                        # Compare skills in one pass and only run the detailed fuzzy
+                        # scoring for candidates whose skills overlap the job's
+                        candidates = rank_profiles_for_job(job, profiles, min_score=ALERT_MIN_SIMILARITY,
+                                                           skills_only=True)
+
+                        for emp_email, _ in candidates:
+                            profile = profiles[emp_email]
                             emp_skills = profile[5] if len(profile) > 5 else ''
                             
                             if emp_skills and skills_required:
@@ -842,7 +511,7 @@ elif current_page in ["All Applications", "Pending", "Interview", "Accepted", "R
                         st.markdown(f"**Applied:** {app[7].astimezone(pytz.timezone("Asia/Kathmandu"))}")
                         st.markdown(f"**Match Score:** {app[5]}%")
                         if app[13]:
-                            st.markdown(get_resume_download_link(app[13], "📄 Download Resume"), unsafe_allow_html=True)
+                            resume_download_button(app[13], "📄 Download Resume", key=f"app_{app[0]}_{i}")
                     with col2:
                         if st.button("🔍 Run ATS Review", key=f"ats_{app[0]}_{i}"):
                             with st.spinner("Analyzing resume with AI..."):
@@ -854,11 +523,10 @@ elif current_page in ["All Applications", "Pending", "Interview", "Accepted", "R
                                     job_desc = job_details[5]
                                     job_skills = job_details[11]
                                     resume_path = app[13]
-                                    if not resume_path or not os.path.exists(resume_path):
+                                    if not resume_path or not blobstore.exists(resume_path):
                                         st.error("Resume file not found.")
                                     else:
-                                        with open(resume_path, "rb") as f:
-                                            resume_file = io.BytesIO(f.read())
+                                        resume_file = io.BytesIO(blobstore.read(resume_path))
                                         result = evaluate_candidate(resume_file, job_desc, job_skills)
                                         if result:
                                             score = result['score']
@@ -920,6 +588,14 @@ elif current_page in ["Open Requests", "My Interests"]:
     if current_page == "Open Requests":
         st.markdown(f"## 👥 Open Job Requests")
         requests = get_all_open_job_requests()
+        talent_query = st.text_input("🔎 Search talent", placeholder="Skills, role or keywords...", key="talent_search")
+        if requests and talent_query:
+            # Rank requests by semantic similarity of title, description, skills and bio
+            index = SemanticIndex(
+                list(range(len(requests))),
+                [" ".join(str(f) for f in (req[2], req[3], req[4], req[12], req[12], req[16]) if f) for req in requests]
+            )
+            requests = [requests[i] for i, score in index.search(talent_query, k=len(requests), min_score=0.0)]
         if not requests:
             st.info("No open job requests.")
         else:
@@ -935,7 +611,7 @@ elif current_page in ["Open Requests", "My Interests"]:
                         st.markdown(f"**Bio:** {req[15]}")
                     with col2:
                         if req[13]:
-                            st.markdown(get_resume_download_link(req[13], "📄 Download Resume"), unsafe_allow_html=True)
+                            resume_download_button(req[13], "📄 Download Resume", key=f"req_{req[0]}")
                         with st.form(key=f"interest_form_{req[0]}", clear_on_submit=True):
                             message = st.text_input("Message to employee")
                             if st.form_submit_button("✋ Express Interest", use_container_width=True) and message:
@@ -1110,3 +786,5 @@ elif current_page == "Settings":
                     time.sleep(2)
                     st.rerun()
 
+# --- Firestore profile of this run (logs; sidebar panel with ?profile=1) ---
+profiler.render_panel()
@@ -1,178 +1,22 @@
 import streamlit as st
-from auth_utils import check_password, verify_face, capture_face, has_face_registered
+from auth_utils import check_password
+from face_auth import verify_face, capture_face, has_face_registered, identify_face, FACE_IDENTIFICATION_ENABLED
 from database import get_user
-import base64
+from assets import asset_url, use_stylesheet
 import time
 
 # --- Page config ---
 st.set_page_config(page_title="Employee Login - Anvaya", layout="wide", initial_sidebar_state="collapsed")
 
 # --- Page-specific CSS overrides (your original design) ---
-st.markdown("""
-<style>
-    /* Hide Streamlit default UI */
-    #MainMenu {visibility: hidden;}
-    header {visibility: hidden;}
-    footer {visibility: hidden;}
-
-    /* Main container styling */
-    .block-container {
-        padding-top: 2rem;
-        padding-bottom: 4rem;
-        padding-left: 6rem;
-        padding-right: 6rem;
-        max-width: 1200px;
-        margin: 0 auto;
-    }
-
-    /* Form container styling - override for this page only */
-    div.stForm {
-        background-color: #ffffff !important;
-        padding: 30px 35px !important;
-        border-radius: 16px !important;
-        box-shadow: 0px 10px 30px rgba(0,0,0,0.1) !important;
-        max-width: 450px !important;
-        margin: 0 auto !important;
-        border: 1px solid #eaeef2 !important;
-    }
-
-    /* Input field styling - make them visible */
-    div.stTextInput {
-        margin-bottom: 20px !important;
-    }
-
-    div.stTextInput > label {
-        color: #374151 !important;
-        font-size: 14px !important;
-        font-weight: 500 !important;
-        margin-bottom: 6px !important;
-        display: block !important;
-    }
-
-    div.stTextInput > div > input {
-        background-color: #f8fafc !important;
-        border: 1.5px solid #e2e8f0 !important;
-        border-radius: 10px !important;
-        padding: 12px 16px !important;
-        width: 100% !important;
-        font-size: 15px !important;
-        color: #1e293b !important;
-        transition: all 0.2s ease !important;
-    }
-
-    div.stTextInput > div > input:focus {
-        border-color: #2563EB !important;
-        background-color: #ffffff !important;
-        box-shadow: 0 0 0 3px rgba(37,99,235,0.1) !important;
-        outline: none !important;
-    }
-
-    div.stTextInput > div > input:hover {
-        border-color: #94a3b8 !important;
-        background-color: #ffffff !important;
-    }
-
-    div.stTextInput > div > input[type="password"] {
-        background-color: #f8fafc !important;
-        letter-spacing: 2px;
-    }
-
-    div.stForm button:first-child {
-        background-color: #2563EB !important;
-        color: white !important;
-        font-weight: 600 !important;
-        font-size: 16px !important;
-        border-radius: 10px !important;
-        padding: 12px 20px !important;
-        width: 100% !important;
-        border: none !important;
-        margin-top: 10px !important;
-        transition: all 0.2s ease !important;
-        box-shadow: 0 4px 6px -1px rgba(37,99,235,0.2) !important;
-    }
-
-    div.stForm button:first-child:hover {
-        background-color: #1E40AF !important;
-        transform: translateY(-1px) !important;
-        box-shadow: 0 6px 8px -1px rgba(37,99,235,0.3) !important;
-    }
-
-    /* Navigation buttons styling */
-    div.stButton > button {
-        background-color: white !important;
-        color: #2563EB !important;
-        font-weight: 500 !important;
-        padding: 8px 20px !important;
-        border-radius: 8px !important;
-        font-size: 14px !important;
-        border: 1.5px solid #2563EB !important;
-        transition: all 0.2s ease !important;
-        width: auto !important;
-        min-width: 160px !important;
-    }
-
-    div.stButton > button:hover {
-        background-color: #2563EB !important;
-        color: white !important;
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 6px -1px rgba(37,99,235,0.2) !important;
-    }
-
-    /* Message styling */
-    .stAlert {
-        border-radius: 10px !important;
-        margin-top: 20px !important;
-        padding: 12px 16px !important;
-    }
-
-    .stAlert.success {
-        background-color: #f0fdf4 !important;
-        border-color: #86efac !important;
-        color: #166534 !important;
-    }
-
-    .stAlert.error {
-        background-color: #fef2f2 !important;
-        border-color: #fecaca !important;
-        color: #991b1b !important;
-    }
-
-    .stAlert.info {
-        background-color: #eff6ff !important;
-        border-color: #bfdbfe !important;
-        color: #1e40af !important;
-    }
-
-    /* Spinner styling */
-    .stSpinner > div {
-        border-color: #2563EB !important;
-    }
-
-    /* Keep theme colors for other elements */
-    h1, h2, h3, h4, h5, h6 {
-        color: var(--text-color) !important;
-    }
-    
-    p {
-        color: var(--text-color) !important;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# --- Function to get base64 image ---
-def get_base64_image(path):
-    try:
-        with open(path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    except FileNotFoundError:
-        return None
+use_stylesheet("login", "login_employee")
 
 # --- Logo ---
-logo_base64 = get_base64_image("logo.jpg")
-if logo_base64:
+logo_url = asset_url("logo.jpg")
+if logo_url:
     st.markdown(f"""
     <div style="text-align:center; margin-bottom:25px;">
-        <img src="data:image/png;base64,{logo_base64}" 
+        <img src="{logo_url}" 
              style="width:100px; height:100px; border-radius:50%; object-fit:cover; box-shadow:0px 8px 20px rgba(0,0,0,0.1); border: 2px solid white;">
     </div>
     """, unsafe_allow_html=True)
@@ -206,6 +50,13 @@ if st.session_state.login_step == "credentials":
         with col2:
             login_clicked = st.form_submit_button("Login", use_container_width=True)
 
+    if FACE_IDENTIFICATION_ENABLED:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            if st.button("📸 Login with face only", key="face_only_btn", use_container_width=True):
+                st.session_state.login_step = "identifying"
+                st.rerun()
+
     st.markdown("<br>", unsafe_allow_html=True)
 
     col1, col2, col3, col4 = st.columns([1, 0.5, 0.6, 1])
@@ -316,3 +167,42 @@ if st.session_state.login_step == "verifying":
             st.session_state.login_step = "credentials"
             st.session_state.user_data = None
             st.rerun()
+
+# --- Face-only login (1:N identification, optional) ---
+if st.session_state.login_step == "identifying":
+    st.markdown("### 📸 Face Login")
+    st.write("Look at the camera. We'll find your account from your face.")
+
+    matched_email = identify_face()
+    user = get_user(matched_email) if matched_email else None
+    if user and user[4] == "employee":
+        st.session_state.authenticated = True
+        st.session_state.user_id = user[0]
+        st.session_state.user_name = user[1]
+        st.session_state.user_email = user[2]
+        st.session_state.user_role = user[4]
+        st.session_state.is_admin = user[5]
+
+        st.success("✅ Login successful! Welcome back.")
+        st.balloons()
+        st.markdown(f"""
+        <div style="text-align:center; padding:20px; background-color:#f0fdf4; border-radius:10px; margin-top:20px;">
+            <h4 style="color:#166534; margin-bottom:5px;">Welcome, {user[1]}!</h4>
+            <p style="color:#166534;">You have successfully logged in.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.session_state.login_step = "credentials"
+        st.session_state.identify_img = None
+        time.sleep(2)
+        st.switch_page("pages/employee_dashboard.py")
+    else:
+        if matched_email:
+            st.error("❌ This account is not registered as an employee.")
+        if st.button("Try Again"):
+            st.session_state.identify_img = None
+            st.rerun()
+        if st.button("Back to Login"):
+            st.session_state.login_step = "credentials"
+            st.session_state.identify_img = None
+            st.rerun()
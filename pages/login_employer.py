@@ -1,6 +1,6 @@
 import streamlit as st
 from auth_utils import check_password, generate_otp, send_otp
-import base64
+from assets import asset_url, use_stylesheet
 import time
 from database import get_user, get_company_by_email, create_company_for_employer, get_company_by_id
 
@@ -8,160 +8,7 @@ from database import get_user, get_company_by_email, create_company_for_employer
 st.set_page_config(page_title="Employer Login - Anvaya", layout="wide", initial_sidebar_state="collapsed")
 
 # --- Page-specific CSS overrides ---
-st.markdown("""
-<style>
-    /* Hide Streamlit default UI */
-    #MainMenu {visibility: hidden;}
-    header {visibility: hidden;}
-    footer {visibility: hidden;}
-
-    /* Main container styling */
-    .block-container {
-        padding-top: 2rem;
-        padding-bottom: 4rem;
-        padding-left: 6rem;
-        padding-right: 6rem;
-        max-width: 1200px;
-        margin: 0 auto;
-    }
-
-    /* Form container styling */
-    div.stForm {
-        background-color: #ffffff !important;
-        padding: 30px 35px !important;
-        border-radius: 16px !important;
-        box-shadow: 0px 10px 30px rgba(0,0,0,0.1) !important;
-        max-width: 450px !important;
-        margin: 0 auto !important;
-        border: 1px solid #eaeef2 !important;
-    }
-
-    /* Input fields */
-    div.stTextInput {
-        margin-bottom: 20px !important;
-    }
-    div.stTextInput > label {
-        color: #374151 !important;
-        font-size: 14px !important;
-        font-weight: 500 !important;
-        margin-bottom: 6px !important;
-        display: block !important;
-    }
-    div.stTextInput > div > input {
-        background-color: #f8fafc !important;
-        border: 1.5px solid #e2e8f0 !important;
-        border-radius: 10px !important;
-        padding: 12px 16px !important;
-        width: 100% !important;
-        font-size: 15px !important;
-        color: #1e293b !important;
-        transition: all 0.2s ease !important;
-    }
-    div.stTextInput > div > input:focus {
-        border-color: #2563EB !important;
-        background-color: #ffffff !important;
-        box-shadow: 0 0 0 3px rgba(37,99,235,0.1) !important;
-        outline: none !important;
-    }
-    div.stTextInput > div > input:hover {
-        border-color: #94a3b8 !important;
-        background-color: #ffffff !important;
-    }
-    div.stTextInput > div > input[type="password"] {
-        background-color: #f8fafc !important;
-        letter-spacing: 2px;
-    }
-
-    /* Form submit button */
-    div.stForm button:first-child {
-        background-color: #2563EB !important;
-        color: white !important;
-        font-weight: 600 !important;
-        font-size: 16px !important;
-        border-radius: 10px !important;
-        padding: 12px 20px !important;
-        width: 100% !important;
-        border: none !important;
-        margin-top: 10px !important;
-        transition: all 0.2s ease !important;
-        box-shadow: 0 4px 6px -1px rgba(37,99,235,0.2) !important;
-    }
-    div.stForm button:first-child:hover {
-        background-color: #1E40AF !important;
-        transform: translateY(-1px) !important;
-        box-shadow: 0 6px 8px -1px rgba(37,99,235,0.3) !important;
-    }
-
-    /* Navigation buttons styling */
-    div.stButton > button {
-        background-color: white !important;
-        color: #2563EB !important;
-        font-weight: 500 !important;
-        padding: 8px 20px !important;
-        border-radius: 8px !important;
-        font-size: 14px !important;
-        border: 1.5px solid #2563EB !important;
-        transition: all 0.2s ease !important;
-        width: auto !important;
-        min-width: 160px !important;
-    }
-    div.stButton > button:hover {
-        background-color: #2563EB !important;
-        color: white !important;
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 6px -1px rgba(37,99,235,0.2) !important;
-    }
-
-    /* Messages */
-    .stAlert {
-        border-radius: 10px !important;
-        margin-top: 20px !important;
-        padding: 12px 16px !important;
-    }
-    .stAlert.success {
-        background-color: #f0fdf4 !important;
-        border-color: #86efac !important;
-        color: #166534 !important;
-    }
-    .stAlert.error {
-        background-color: #fef2f2 !important;
-        border-color: #fecaca !important;
-        color: #991b1b !important;
-    }
-    .stAlert.info {
-        background-color: #eff6ff !important;
-        border-color: #bfdbfe !important;
-        color: #1e40af !important;
-    }
-    
-    /* OTP section styling */
-    .otp-section {
-        margin-top: 20px;
-        padding: 20px;
-        background-color: #f8fafc;
-        border-radius: 12px;
-        border: 1px solid #e2e8f0;
-    }
-    
-    .resend-link {
-        color: #2563EB;
-        cursor: pointer;
-        text-decoration: underline;
-        font-size: 14px;
-    }
-    .resend-link:hover {
-        color: #1E40AF;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# --- Function to get base64 image ---
-def get_base64_image(path):
-    try:
-        with open(path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    except FileNotFoundError:
-        return None
+use_stylesheet("login", "login_employer")
 
 # --- Initialize session state for OTP ---
 if "otp_sent" not in st.session_state:
@@ -176,13 +23,13 @@ if "login_user_data" not in st.session_state:
     st.session_state.login_user_data = None
 
 # --- Logo ---
-logo_base64 = get_base64_image("logo.jpg")
+logo_url = asset_url("logo.jpg")
 
 # --- Header ---
-if logo_base64:
+if logo_url:
     st.markdown(f"""
     <div style="text-align:center; margin-bottom:25px;">
-        <img src="data:image/png;base64,{logo_base64}" 
+        <img src="{logo_url}" 
              style="width:100px; height:100px; border-radius:50%; object-fit:cover; box-shadow:0px 8px 20px rgba(0,0,0,0.1); border: 2px solid white;">
     </div>
     """, unsafe_allow_html=True)
@@ -1,205 +1,20 @@
 import streamlit as st
-from auth_utils import generate_otp, send_otp, hash_password, capture_face
+from auth_utils import generate_otp, send_otp, hash_password
+from face_auth import capture_face
 from database import add_user, get_user
-import base64
+from assets import asset_url, use_stylesheet
 import time
 
 st.set_page_config(page_title="Employee Sign Up - Anvaya", layout="wide", initial_sidebar_state="collapsed")
 
-st.markdown("""
-<style>
-    /* Hide Streamlit default UI */
-    #MainMenu {visibility: hidden;}
-    header {visibility: hidden;}
-    footer {visibility: hidden;}
-    [data-testid="stSidebar"] {display: none;}
+use_stylesheet("signup")
 
-    /* Main container styling */
-    .block-container {
-        padding-top: 2rem;
-        padding-bottom: 4rem;
-        padding-left: 6rem;
-        padding-right: 6rem;
-        max-width: 1200px;
-        margin: 0 auto;
-    }
+logo_url = asset_url("logo.jpg")
 
-    div.stTextInput div[role="progressbar"] {
-        display: none !important;
-    }
-
-    /* Form container styling - matching login page */
-    div.stForm {
-        background-color: #ffffff !important;
-        padding: 30px 35px !important;
-        border-radius: 16px !important;
-        box-shadow: 0px 10px 30px rgba(0,0,0,0.1) !important;
-        max-width: 550px !important;
-        margin: 0 auto !important;
-        border: 1px solid #eaeef2 !important;
-        transition: all 0.3s ease !important;
-    }
-
-    /* Input field styling */
-    div.stTextInput {
-        margin-bottom: 20px !important;
-    }
-
-    div.stTextInput > label {
-        color: #374151 !important;
-        font-size: 14px !important;
-        font-weight: 500 !important;
-        margin-bottom: 6px !important;
-        display: block !important;
-    }
-
-    div.stTextInput > div > input {
-        background-color: #f8fafc !important;
-        border: 1.5px solid #e2e8f0 !important;
-        border-radius: 10px !important;
-        padding: 12px 16px !important;
-        width: 100% !important;
-        font-size: 15px !important;
-        color: #1e293b !important;
-        transition: all 0.2s ease !important;
-    }
-
-    div.stTextInput > div > input:focus {
-        border-color: #2563EB !important;
-        background-color: #ffffff !important;
-        box-shadow: 0 0 0 3px rgba(37,99,235,0.1) !important;
-        outline: none !important;
-    }
-
-    div.stTextInput > div > input:hover {
-        border-color: #94a3b8 !important;
-        background-color: #ffffff !important;
-    }
-
-    /* Password field */
-    div.stTextInput > div > input[type="password"] {
-        background-color: #f8fafc !important;
-        letter-spacing: 2px;
-    }
-
-    /* Button styling inside form */
-    div.stForm button {
-        border-radius: 10px !important;
-        padding: 12px 20px !important;
-        font-weight: 600 !important;
-        font-size: 16px !important;
-        transition: all 0.2s ease !important;
-        border: none !important;
-        margin-top: 5px !important;
-        
-    }
-
-    /* Send OTP button */
-    div.stForm button:first-child {
-        background-color: #2563EB !important;
-        color: white !important;
-        box-shadow: 0 4px 6px -1px rgba(37,99,235,0.2) !important;
-    }
-
-    div.stForm button:first-child:hover {
-        background-color: #1E40AF !important;
-        transform: translateY(-1px) !important;
-        box-shadow: 0 6px 8px -1px rgba(37,99,235,0.3) !important;
-    }
-
-    /* Verify button */
-    div.stForm button:last-child {
-        background-color: #10B981 !important;
-        color: white !important;
-        box-shadow: 0 4px 6px -1px rgba(16,185,129,0.2) !important;
-    }
-
-    div.stForm button:last-child:hover {
-        background-color: #059669 !important;
-        transform: translateY(-1px) !important;
-        box-shadow: 0 6px 8px -1px rgba(16,185,129,0.3) !important;
-    }
-
-    /* Message styling */
-    .stAlert {
-        border-radius: 10px !important;
-        margin-top: 20px !important;
-        margin-bottom: 20px !important;
-        padding: 12px 16px !important;
-    }
-
-    .stAlert.success {
-        background-color: #f0fdf4 !important;
-        border-color: #86efac !important;
-        color: #166534 !important;
-    }
-
-    .stAlert.error {
-        background-color: #fef2f2 !important;
-        border-color: #fecaca !important;
-        color: #991b1b !important;
-    }
-
-    .stAlert.info {
-        background-color: #eff6ff !important;
-        border-color: #bfdbfe !important;
-        color: #1e40af !important;
-    }
-
-    /* Spinner styling */
-    .stSpinner > div {
-        border-color: #2563EB !important;
-    }
-
-    .otp-section {
-        margin-top: 20px;
-        padding-top: 20px;
-        border-top: 2px dashed #e2e8f0;
-    }
-
-    div.stButton > button {
-        background-color: white !important;
-        color: #2563EB !important;
-        border: 1.5px solid #2563EB !important;
-        border-radius: 8px !important;
-        padding: 8px 20px !important;
-        font-weight: 500 !important;
-        font-size: 14px !important;
-        transition: all 0.2s ease !important;
-        width: auto !important;
-        min-width: 160px !important;
-    }
-
-    div.stButton > button:hover {
-        background-color: #2563EB !important;
-        color: white !important;
-        transform: translateY(-1px) !important;
-    }
-
-    /* Keep theme colors for other elements */
-    h1, h2, h3, h4, h5, h6 {
-        color: var(--text-color) !important;
-    }
-    
-    p {
-        color: var(--text-color) !important;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-def get_base64_image(path):
-    try:
-        with open(path, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    except FileNotFoundError:
-        return None
-
-logo_base64 = get_base64_image("logo.jpg")
-
-if logo_base64:
+if logo_url:
     st.markdown(f"""
     <div style="text-align:center; margin-bottom:25px;">
-        <img src="data:image/png;base64,{logo_base64}" 
+        <img src="{logo_url}" 
              style="width:100px; height:100px; border-radius:50%; object-fit:cover; box-shadow:0px 8px 20px rgba(0,0,0,0.1); border: 2px solid white;">
     </div>
     """, unsafe_allow_html=True)
@@ -0,0 +1,123 @@
+import os
+import time
+import threading
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import fitz  # PyMuPDF
+
+# Limits (override with environment variables)
+MAX_PDF_BYTES = int(os.getenv("PDF_MAX_BYTES", 10 * 1024 * 1024))   # 10 MB
+MAX_PDF_PAGES = int(os.getenv("PDF_MAX_PAGES", 15))                 # résumés rarely exceed a few pages
+PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", 8))    # below this a pool costs more than it saves
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", min(4, os.cpu_count() or 1)))
+PDF_EXTRACT_DEBUG = os.getenv("PDF_EXTRACT_DEBUG", "0") == "1"     # print per-page timings
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    """Process pool shared by every session, created on first large document."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, never fork the multi-threaded Streamlit server
+            _pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=mp.get_context("spawn"))
+        return _pool
+
+
+def _discard_pool(pool):
+    """Drop a broken pool so the next large document starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _extract_page_range(pdf_bytes, start, stop):
+    """Worker: open the document once and extract pages [start, stop)."""
+    results = []
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        for page_no in range(start, stop):
+            t0 = time.perf_counter()
+            page_text = doc[page_no].get_text("text") or ""
+            results.append((page_no, page_text, time.perf_counter() - t0))
+    finally:
+        doc.close()
+    return results
+
+
+def extract_pdf(pdf_bytes, max_pages=None, max_bytes=None):
+    """
+    Extract text from PDF bytes with page and size limits.
+
+    Small documents are extracted inline; documents with at least
+    PARALLEL_MIN_PAGES pages are split into contiguous page ranges and
+    extracted across a process pool. If the pool breaks (a worker was
+    killed), it is discarded and the document is extracted inline.
+
+    Returns a dict:
+        'text': extracted text (pages joined with newlines)
+        'pages': number of pages extracted
+        'total_pages': number of pages in the document
+        'truncated': True if the page limit cut the document short
+        'page_times': list of per-page extraction times in seconds
+        'elapsed': total wall time in seconds
+    Raises ValueError if the file exceeds the byte limit or is not a PDF.
+    """
+    max_pages = MAX_PDF_PAGES if max_pages is None else max_pages
+    max_bytes = MAX_PDF_BYTES if max_bytes is None else max_bytes
+
+    if len(pdf_bytes) > max_bytes:
+        raise ValueError(f"PDF is too large ({len(pdf_bytes) // 1024} KB, limit {max_bytes // 1024} KB)")
+
+    t0 = time.perf_counter()
+    try:
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    except Exception as e:
+        raise ValueError(f"Could not open PDF: {e}")
+    total_pages = doc.page_count
+    page_count = min(total_pages, max_pages)
+
+    if page_count < PARALLEL_MIN_PAGES or PDF_WORKERS < 2:
+        pages = []
+        try:
+            for page_no in range(page_count):
+                p0 = time.perf_counter()
+                pages.append((page_no, doc[page_no].get_text("text") or "", time.perf_counter() - p0))
+        finally:
+            doc.close()
+    else:
+        doc.close()
+        chunk = -(-page_count // PDF_WORKERS)  # ceil division
+        pool = _get_pool()
+        pages = []
+        try:
+            futures = [
+                pool.submit(_extract_page_range, pdf_bytes, start, min(start + chunk, page_count))
+                for start in range(0, page_count, chunk)
+            ]
+            for future in futures:
+                pages.extend(future.result())
+        except BrokenProcessPool as e:
+            print(f"PDF worker pool broke, extracting inline: {e}")
+            _discard_pool(pool)
+            pages = _extract_page_range(pdf_bytes, 0, page_count)
+
+    pages.sort(key=lambda p: p[0])
+    elapsed = time.perf_counter() - t0
+    page_times = [p[2] for p in pages]
+    if PDF_EXTRACT_DEBUG:
+        print(f"PDF extracted: {page_count}/{total_pages} pages in {elapsed * 1000:.0f} ms "
+              f"(per page ms: {', '.join(f'{t * 1000:.0f}' for t in page_times)})")
+    return {
+        'text': "\n".join(p[1] for p in pages if p[1]),
+        'pages': page_count,
+        'total_pages': total_pages,
+        'truncated': total_pages > page_count,
+        'page_times': page_times,
+        'elapsed': elapsed
+    }
@@ -0,0 +1,339 @@
+"""
+Per-rerun Firestore profiler.
+
+Every public function in database.py is wrapped (see instrument()) and the
+Firestore client's read methods are counted, so each Streamlit script run
+knows, per data-access call: wall time, documents read and round trips.
+Nested calls are attributed to the outermost database.py function.
+
+Pages call begin_run("<page>") at the top and render_panel() at the end:
+
+    FIRESTORE_PROFILE_LOG=1     print one JSON line per run (and per call
+                                slower than FIRESTORE_PROFILE_SLOW_MS)
+    ?profile=1 (query param) or FIRESTORE_PROFILE_PANEL=1
+                                show the most expensive calls of the page
+                                in the sidebar
+
+With none of these set, begin_run() starts no run, the wrappers pass
+straight through and the Firestore client classes are left unpatched.
+
+A run that ends in st.rerun() or st.stop() never reaches render_panel().
+Streamlit starts each run in a fresh thread (and so a fresh contextvars
+context), so the open run is also kept in st.session_state; the next
+begin_run() in the session logs it with "completed": false.
+
+Counters follow the run into fan_out() worker threads and async reads via
+contextvars. Profiling must never break a page, so patching errors are
+only printed.
+"""
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import uuid
+
+LOG_ENABLED = os.getenv("FIRESTORE_PROFILE_LOG", "0") == "1"
+PANEL_ENABLED = os.getenv("FIRESTORE_PROFILE_PANEL", "0") == "1"
+SLOW_CALL_MS = float(os.getenv("FIRESTORE_PROFILE_SLOW_MS", 500))
+
+_current_run = contextvars.ContextVar("firestore_profile_run", default=None)
+_current_call = contextvars.ContextVar("firestore_profile_call", default=None)
+_SESSION_KEY = "_firestore_profile_run"   # st.session_state: run not yet logged
+_patched = False
+_patch_lock = threading.Lock()
+
+
+class RunStats:
+    """Calls made during one script run of one page."""
+
+    def __init__(self, page):
+        self.run_id = uuid.uuid4().hex[:12]
+        self.page = page
+        self.started = time.perf_counter()
+        self.calls = []          # finished top-level calls
+        self.logged = False
+
+    def totals(self):
+        return {
+            'calls': len(self.calls),
+            'docs_read': sum(c['docs_read'] for c in self.calls),
+            'round_trips': sum(c['round_trips'] for c in self.calls),
+            'db_ms': round(sum(c['ms'] for c in self.calls), 1),
+            'run_ms': round((time.perf_counter() - self.started) * 1000, 1),
+        }
+
+
+class _Call:
+    def __init__(self, name):
+        self.name = name
+        self.docs_read = 0
+        self.round_trips = 0
+
+
+def _log(record):
+    if LOG_ENABLED:
+        print(json.dumps(record, default=str))
+
+
+# ===== RUN SCOPE =====
+def _profiling_requested():
+    if LOG_ENABLED:
+        return True
+    import streamlit as st
+    return _panel_requested(st)
+
+
+def _session_state():
+    """Streamlit session state, or None outside a Streamlit session (benchmarks)."""
+    try:
+        import streamlit as st
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        return st.session_state if get_script_run_ctx() is not None else None
+    except Exception:
+        return None
+
+
+def _finish(run, completed):
+    if run is None or run.logged:
+        return None
+    run.logged = True
+    totals = run.totals()
+    _log({'event': 'firestore_run', 'run_id': run.run_id, 'page': run.page, 'completed': completed, **totals})
+    return totals
+
+
+def begin_run(page, force=False):
+    """
+    Start counting for the current script run (call at the top of a page).
+    Returns None, and counts nothing, unless profiling is enabled or `force`.
+    """
+    # The previous run of this session stopped before render_panel()
+    state = _session_state()
+    if state is not None:
+        _finish(state.pop(_SESSION_KEY, None), completed=False)
+    _finish(_current_run.get(), completed=False)
+    _current_run.set(None)
+    if not (force or _profiling_requested()):
+        return None
+    _patch_firestore()
+    run = RunStats(page)
+    _current_run.set(run)
+    if state is not None:
+        state[_SESSION_KEY] = run
+    return run
+
+
+def current_run():
+    return _current_run.get()
+
+
+def end_run(completed=True):
+    """Log the run summary once and stop counting (render_panel() calls this)."""
+    run = _current_run.get()
+    if run is None:
+        return None
+    _current_run.set(None)
+    state = _session_state()
+    if state is not None:
+        state.pop(_SESSION_KEY, None)
+    return _finish(run, completed)
+
+
+# ===== COUNTING =====
+def _count(docs=0, round_trips=0):
+    call = _current_call.get()
+    if call is not None:
+        call.docs_read += docs
+        call.round_trips += round_trips
+
+
+def profiled(func, name=None):
+    """Wrap a data-access function; only the outermost call in a run is recorded."""
+    name = name or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        run = _current_run.get()
+        if run is None or run.logged or _current_call.get() is not None:
+            return func(*args, **kwargs)
+        call = _Call(name)
+        token = _current_call.set(call)
+        start = time.perf_counter()
+        error = None
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            _current_call.reset(token)
+            ms = (time.perf_counter() - start) * 1000
+            record = {'function': name, 'ms': round(ms, 2), 'docs_read': call.docs_read,
+                      'round_trips': call.round_trips, 'error': error}
+            run.calls.append(record)
+            if ms >= SLOW_CALL_MS:
+                _log({'event': 'firestore_slow_call', 'run_id': run.run_id, 'page': run.page, **record})
+
+    return wrapper
+
+
+async def profile_coroutine(name, coro):
+    """Await coro as one recorded call (used by async_db.gather for async reads)."""
+    run = _current_run.get()
+    if run is None or run.logged or _current_call.get() is not None:
+        return await coro
+    call = _Call(name)
+    token = _current_call.set(call)
+    start = time.perf_counter()
+    error = None
+    try:
+        return await coro
+    except Exception as e:
+        error = type(e).__name__
+        raise
+    finally:
+        _current_call.reset(token)
+        run.calls.append({'function': name, 'ms': round((time.perf_counter() - start) * 1000, 2),
+                          'docs_read': call.docs_read, 'round_trips': call.round_trips, 'error': error})
+
+
+def instrument(namespace, module_name):
+    """Wrap every public function defined in module_name (pass globals())."""
+    for attr, value in list(namespace.items()):
+        if attr.startswith('_') or not callable(value) or isinstance(value, type):
+            continue
+        if getattr(value, '__module__', None) == module_name and not getattr(value, '_profiled', False):
+            wrapped = profiled(value, attr)
+            wrapped._profiled = True
+            namespace[attr] = wrapped
+
+
+# ===== FIRESTORE CLIENT HOOKS =====
+def _wrap_doc_get(get):
+    @functools.wraps(get)
+    def doc_get(self, *args, **kwargs):
+        _count(docs=1, round_trips=1)  # a missing document is still billed as one read
+        return get(self, *args, **kwargs)
+    return doc_get
+
+
+def _wrap_stream(stream):
+    @functools.wraps(stream)
+    def counted_stream(self, *args, **kwargs):
+        _count(round_trips=1)
+        empty = True
+        for snapshot in stream(self, *args, **kwargs):
+            empty = False
+            _count(docs=1)
+            yield snapshot
+        if empty:
+            _count(docs=1)  # an empty query result is billed as one read
+    return counted_stream
+
+
+def _patch_firestore():
+    """Count reads on the sync and async client classes (once per process, on the first profiled run)."""
+    global _patched
+    with _patch_lock:
+        if _patched:
+            return
+        _patched = True
+        _patch_clients()
+
+
+def _patch_clients():
+    try:
+        from google.cloud.firestore_v1.client import Client
+        from google.cloud.firestore_v1.document import DocumentReference
+        from google.cloud.firestore_v1.query import Query
+
+        DocumentReference.get = _wrap_doc_get(DocumentReference.get)
+        Query.stream = _wrap_stream(Query.stream)
+        Client.get_all = _wrap_stream(Client.get_all)
+    except ImportError:
+        pass  # google-cloud-firestore not installed (DATA_BACKEND=memory)
+    except Exception as e:
+        print(f"Firestore profiler: sync client not instrumented: {e}")
+
+    import memory_firestore  # DATA_BACKEND=memory
+    memory_firestore.DocumentReference.get = _wrap_doc_get(memory_firestore.DocumentReference.get)
+    memory_firestore.BaseQuery.stream = _wrap_stream(memory_firestore.BaseQuery.stream)
+    memory_firestore.MemoryClient.get_all = _wrap_stream(memory_firestore.MemoryClient.get_all)
+
+    try:
+        from google.cloud.firestore_v1.async_client import AsyncClient
+        from google.cloud.firestore_v1.async_document import AsyncDocumentReference
+        from google.cloud.firestore_v1.async_query import AsyncQuery
+
+        def wrap_async_doc_get(get):
+            @functools.wraps(get)
+            async def doc_get(self, *args, **kwargs):
+                _count(docs=1, round_trips=1)
+                return await get(self, *args, **kwargs)
+            return doc_get
+
+        def wrap_async_stream(stream):
+            @functools.wraps(stream)
+            async def counted_stream(self, *args, **kwargs):
+                _count(round_trips=1)
+                empty = True
+                async for snapshot in stream(self, *args, **kwargs):
+                    empty = False
+                    _count(docs=1)
+                    yield snapshot
+                if empty:
+                    _count(docs=1)
+            return counted_stream
+
+        AsyncDocumentReference.get = wrap_async_doc_get(AsyncDocumentReference.get)
+        AsyncQuery.stream = wrap_async_stream(AsyncQuery.stream)
+        AsyncClient.get_all = wrap_async_stream(AsyncClient.get_all)
+    except ImportError:
+        pass  # google-cloud-firestore not installed (DATA_BACKEND=memory)
+    except Exception as e:
+        print(f"Firestore profiler: async client not instrumented: {e}")
+
+
+# ===== DEBUG PANEL =====
+def _panel_requested(st):
+    if PANEL_ENABLED:
+        return True
+    try:
+        return st.query_params.get("profile") == "1"
+    except Exception:
+        return False
+
+
+def render_panel(limit=15):
+    """Log the run and, when enabled, list this page's most expensive calls in the sidebar."""
+    import streamlit as st
+
+    run = _current_run.get()
+    totals = end_run()
+    if run is None or totals is None or not _panel_requested(st):
+        return
+    import doc_cache
+    import query_cache
+
+    with st.sidebar.expander("🔬 Firestore profile", expanded=True):
+        st.caption(f"{run.page} · run {run.run_id}")
+        st.markdown(
+            f"**{totals['calls']}** calls · **{totals['docs_read']}** docs read · "
+            f"**{totals['round_trips']}** round trips · **{totals['db_ms']}** ms in database.py "
+            f"(run {totals['run_ms']} ms)"
+        )
+        by_function = {}
+        for call in run.calls:
+            row = by_function.setdefault(call['function'], {'function': call['function'], 'calls': 0,
+                                                            'ms': 0.0, 'docs_read': 0, 'round_trips': 0})
+            row['calls'] += 1
+            row['ms'] = round(row['ms'] + call['ms'], 2)
+            row['docs_read'] += call['docs_read']
+            row['round_trips'] += call['round_trips']
+        rows = sorted(by_function.values(), key=lambda r: r['ms'], reverse=True)[:limit]
+        if rows:
+            st.dataframe(rows, hide_index=True, use_container_width=True)
+        st.caption(f"query cache: {query_cache.stats()}")
+        st.caption(f"document cache: {doc_cache.stats()}")
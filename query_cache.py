@@ -0,0 +1,112 @@
+"""
+Tag-invalidated cache for dashboard query results.
+
+Streamlit reruns the whole page on every widget interaction, so the same
+list queries (jobs, applications, conversations...) run again on each
+keystroke. Functions decorated with @cached(...) keep their result per
+argument tuple and name the tags they depend on, e.g.
+
+    @cached('jobs', 'applications:{employee_id}')
+    def search_jobs(employee_id): ...
+
+Tag templates are filled in from the call's arguments, so entries are
+scoped per user. Write functions call invalidate('applications:<id>')
+and every entry carrying that tag is dropped. A result computed while one
+of its tags was invalidated is not stored. QUERY_CACHE_TTL (seconds,
+default 120) bounds staleness for writes made by other processes;
+QUERY_CACHE_SIZE bounds the number of entries (LRU).
+"""
+import copy
+import functools
+import inspect
+import os
+import threading
+import time
+from collections import OrderedDict
+
+CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", 120))
+CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", 2000))
+
+_entries = OrderedDict()   # key -> (stored_at, tags, value)
+_tag_keys = {}             # tag -> set of keys
+_tag_versions = {}         # tag -> int, bumped on invalidation
+_generation = 0            # bumped by clear()
+_stats = {'hits': 0, 'misses': 0, 'invalidations': 0, 'evictions': 0}
+_lock = threading.Lock()
+
+
+def _drop(key):
+    entry = _entries.pop(key, None)
+    if entry:
+        for tag in entry[1]:
+            keys = _tag_keys.get(tag)
+            if keys:
+                keys.discard(key)
+                if not keys:
+                    del _tag_keys[tag]
+
+
+def cached(*tag_templates):
+    """Cache a query function's result per arguments, invalidated by the given tags."""
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            key = (func.__qualname__, tuple(arguments.items()))
+            tags = tuple(t.format(**arguments) for t in tag_templates)
+            now = time.monotonic()
+            with _lock:
+                entry = _entries.get(key)
+                if entry and now - entry[0] < CACHE_TTL:
+                    _entries.move_to_end(key)
+                    _stats['hits'] += 1
+                    return copy.deepcopy(entry[2])
+                _stats['misses'] += 1
+                versions = [_generation] + [_tag_versions.get(tag, 0) for tag in tags]
+
+            value = func(*args, **kwargs)
+
+            with _lock:
+                if versions == [_generation] + [_tag_versions.get(tag, 0) for tag in tags]:
+                    _drop(key)
+                    _entries[key] = (now, tags, value)
+                    for tag in tags:
+                        _tag_keys.setdefault(tag, set()).add(key)
+                    while len(_entries) > CACHE_SIZE:
+                        _drop(next(iter(_entries)))
+                        _stats['evictions'] += 1
+            return copy.deepcopy(value)
+
+        wrapper.uncached = func
+        return wrapper
+    return decorator
+
+
+def invalidate(*tags):
+    """Drop every cached result that depends on any of the tags."""
+    with _lock:
+        for tag in tags:
+            _tag_versions[tag] = _tag_versions.get(tag, 0) + 1
+            for key in list(_tag_keys.get(tag, ())):
+                _drop(key)
+            _stats['invalidations'] += 1
+
+
+def clear():
+    """Drop everything (admin cascades that touch many users)."""
+    global _generation
+    with _lock:
+        _generation += 1
+        _entries.clear()
+        _tag_keys.clear()
+        _stats['invalidations'] += 1
+
+
+def stats():
+    with _lock:
+        lookups = _stats['hits'] + _stats['misses']
+        return dict(_stats, size=len(_entries), hit_rate=round(_stats['hits'] / lookups, 3) if lookups else 0.0)
@@ -0,0 +1,147 @@
+"""
+Process-wide clients (Firestore, Groq, Gemini).
+
+Every client is created once per server process via st.cache_resource and
+shared by all sessions and reruns, however many modules import it. Network
+settings come from st.secrets or the environment:
+
+    FIRESTORE_GRPC_KEEPALIVE_MS     gRPC keep-alive ping interval (library default 30000)
+    FIRESTORE_GRPC_KEEPALIVE_TIMEOUT_MS
+    FIRESTORE_GRPC_MAX_MESSAGE_MB   max receive size for large query results
+    FIRESTORE_GRPC_SUBCHANNEL_POOL  "local" gives this client its own subchannel pool
+    LLM_HTTP_MAX_CONNECTIONS        pooled HTTP connections for the Groq client
+    LLM_HTTP_KEEPALIVE_SECONDS      idle time before a pooled connection is closed
+    DATA_BACKEND                    "firestore" (default) or "memory" (memory_firestore.py,
+                                    no network or credentials; MEMORY_DB_PATH loads a snapshot)
+"""
+import os
+import threading
+import streamlit as st
+
+
+def _setting(name, default=None):
+    try:
+        value = st.secrets.get(name)
+    except Exception:
+        value = None  # no secrets.toml (scripts, benchmarks)
+    return value if value is not None else os.getenv(name, default)
+
+
+# ===== FIRESTORE =====
+def data_backend():
+    return str(_setting("DATA_BACKEND", "firestore")).lower()
+
+
+def firestore_module():
+    """The module providing SERVER_TIMESTAMP, Increment, Query and transactional for the configured backend."""
+    if data_backend() == "memory":
+        import memory_firestore
+        return memory_firestore
+    from firebase_admin import firestore
+    return firestore
+
+
+def _grpc_channel_options():
+    """Channel options from settings; empty if nothing was configured."""
+    options = {}
+    keepalive = _setting("FIRESTORE_GRPC_KEEPALIVE_MS")
+    if keepalive:
+        options["grpc.keepalive_time_ms"] = int(keepalive)
+        options["grpc.keepalive_permit_without_calls"] = 1
+        options["grpc.http2.max_pings_without_data"] = 0
+    timeout = _setting("FIRESTORE_GRPC_KEEPALIVE_TIMEOUT_MS")
+    if timeout:
+        options["grpc.keepalive_timeout_ms"] = int(timeout)
+    max_mb = _setting("FIRESTORE_GRPC_MAX_MESSAGE_MB")
+    if max_mb:
+        options["grpc.max_receive_message_length"] = int(float(max_mb) * 1024 * 1024)
+    if str(_setting("FIRESTORE_GRPC_SUBCHANNEL_POOL", "")).lower() == "local":
+        options["grpc.use_local_subchannel_pool"] = 1
+    return options
+
+
+def _apply_channel_options(client, options):
+    """Give the Firestore client a gRPC channel built with our options."""
+    from google.cloud.firestore_v1.services.firestore import client as firestore_client
+    from google.cloud.firestore_v1.services.firestore.transports import grpc as firestore_grpc_transport
+
+    options = {"grpc.keepalive_time_ms": 30000, **options}  # keep the library default unless overridden
+    channel = firestore_grpc_transport.FirestoreGrpcTransport.create_channel(
+        client._target, credentials=client._credentials, options=options.items()
+    )
+    transport = firestore_grpc_transport.FirestoreGrpcTransport(host=client._target, channel=channel)
+    client._firestore_api_internal = firestore_client.FirestoreClient(
+        transport=transport, client_options=client._client_options
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_firestore():
+    """The Firestore client (or the in-memory one), initialising the Firebase app on first use."""
+    if data_backend() == "memory":
+        import memory_firestore
+        return memory_firestore.client()
+
+    import firebase_admin
+    from firebase_admin import credentials, firestore
+
+    if not firebase_admin._apps:
+        cred = credentials.Certificate(dict(st.secrets["firebase"]))
+        firebase_admin.initialize_app(cred)
+    client = firestore.client()
+
+    options = _grpc_channel_options()
+    if options and not os.getenv("FIRESTORE_EMULATOR_HOST"):
+        try:
+            _apply_channel_options(client, options)
+        except Exception as e:
+            print(f"Could not apply Firestore channel options, using defaults: {e}")
+    return client
+
+
+# ===== GROQ (OpenAI-compatible) =====
+@st.cache_resource(show_spinner=False)
+def get_groq_client():
+    """OpenAI client pointed at Groq (or GROQ_BASE_URL), with a pooled keep-alive HTTP client."""
+    from openai import DefaultHttpxClient, OpenAI
+    try:
+        import httpx
+    except ImportError:  # openai releases built on the httpx2 fork
+        import httpx2 as httpx
+
+    max_connections = int(_setting("LLM_HTTP_MAX_CONNECTIONS", 20))
+    http_client = DefaultHttpxClient(limits=httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=float(_setting("LLM_HTTP_KEEPALIVE_SECONDS", 60))
+    ))
+    return OpenAI(
+        api_key=st.secrets["GROQ_API_KEY"],
+        base_url=st.secrets.get("GROQ_BASE_URL", "https://api.groq.com/openai/v1"),
+        http_client=http_client
+    )
+
+
+# ===== GEMINI =====
+_gemini_lock = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def get_gemini_model(model_name, api_key):
+    """
+    A GenerativeModel bound to one API key. genai.configure() is global, so
+    each model is given its own client while the lock is held; later
+    configure() calls for other keys no longer affect it.
+    """
+    import google.generativeai as genai
+    from google.generativeai import client as genai_client
+
+    endpoint = st.secrets.get("GEMINI_API_ENDPOINT", "")
+    with _gemini_lock:
+        if endpoint:
+            genai.configure(api_key=api_key, transport="rest", client_options={"api_endpoint": endpoint})
+        else:
+            genai.configure(api_key=api_key)
+        model = genai.GenerativeModel(model_name)
+        model._client = genai_client.get_default_generative_client()
+    return model
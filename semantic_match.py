@@ -0,0 +1,228 @@
+import re
+import threading
+import zlib
+from collections import OrderedDict
+import numpy as np
+
+# Dimension of the hashed feature space. Vectors are stored sparse (only the
+# buckets a text touches), so this only bounds collisions; 2**14 keeps them
+# rare for résumé/job sized texts.
+VECTOR_DIM = 2 ** 14
+
+# Weight of character trigram features relative to whole-word features.
+# Trigrams let "javascript" / "java script" / "js-frameworks" overlap the way
+# the old fuzzy matching did.
+CHAR_NGRAM_WEIGHT = 0.5
+
+# Vectorized jobs/profiles kept across reruns, keyed by id and a hash of the text
+VECTOR_CACHE_SIZE = 20000
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#.]+")
+
+_vector_cache = OrderedDict()   # (id, crc32, len) -> (indices, values)
+_vector_cache_lock = threading.Lock()
+
+
+def _tokens(text):
+    """Lower-case word tokens, keeping things like c++, c#, node.js intact."""
+    if not text:
+        return []
+    return [t.strip(".") for t in _TOKEN_RE.findall(text.lower()) if t.strip(".")]
+
+
+def _bucket(feature):
+    """Stable hash of a feature into a bucket. crc32 is process-independent."""
+    return zlib.crc32(feature.encode("utf-8")) % VECTOR_DIM
+
+
+def embed_sparse(text):
+    """
+    Vectorize text with a hashing vectorizer (words, word bigrams and
+    character trigrams). Returns (indices, values): the sorted int32 buckets
+    the text touches and their float32 weights, L2-normalized.
+
+    Weights are never negative, so two texts score above zero exactly when
+    they share a feature (or a bucket).
+    """
+    tokens = _tokens(text)
+    buckets, weights = [], []
+    for i, tok in enumerate(tokens):
+        buckets.append(_bucket(f"w:{tok}"))
+        weights.append(1.0)
+        if i + 1 < len(tokens):
+            buckets.append(_bucket(f"b:{tok} {tokens[i + 1]}"))
+            weights.append(1.0)
+        padded = f" {tok} "
+        for j in range(len(padded) - 2):
+            buckets.append(_bucket(f"c:{padded[j:j + 3]}"))
+            weights.append(CHAR_NGRAM_WEIGHT)
+    if not buckets:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+    indices, inverse = np.unique(np.asarray(buckets, dtype=np.int32), return_inverse=True)
+    values = np.bincount(inverse, weights=weights).astype(np.float32)
+    values /= np.linalg.norm(values)
+    return indices, values
+
+
+def embed_text(text):
+    """Dense L2-normalized float32 vector of VECTOR_DIM (used for queries)."""
+    vec = np.zeros(VECTOR_DIM, dtype=np.float32)
+    indices, values = embed_sparse(text)
+    vec[indices] = values
+    return vec
+
+
+def cached_embed(item_id, text):
+    """
+    embed_sparse() for a job or profile, reused across reruns while its text
+    is unchanged (an edit changes the key, so nothing has to be invalidated).
+    """
+    key = (item_id, zlib.crc32(text.encode("utf-8")), len(text))
+    with _vector_cache_lock:
+        vec = _vector_cache.get(key)
+        if vec is not None:
+            _vector_cache.move_to_end(key)
+            return vec
+    vec = embed_sparse(text)
+    with _vector_cache_lock:
+        _vector_cache[key] = vec
+        while len(_vector_cache) > VECTOR_CACHE_SIZE:
+            _vector_cache.popitem(last=False)
+    return vec
+
+
+# ===== TEXT BUILDERS =====
+def job_text(job):
+    """Text used to represent a job dict (same keys as job_tuple_to_dict)."""
+    parts = [
+        job.get("title"),
+        job.get("skills_required"),
+        job.get("skills_required"),  # skills count twice, they matter most
+        job.get("category"),
+        job.get("experience_level"),
+        job.get("description"),
+        job.get("requirements"),
+    ]
+    return " ".join(p for p in parts if p)
+
+
+def profile_text(profile, resume_text=""):
+    """Text used to represent an employee profile tuple (see get_or_create_profile)."""
+    parts = [
+        profile[5],   # skills
+        profile[5],
+        profile[6],   # experience_level
+        profile[9],   # bio
+        profile[13] if len(profile) > 13 else "",  # projects (JSON string)
+        resume_text,
+    ]
+    return " ".join(str(p) for p in parts if p)
+
+
+# ===== INDEX =====
+class SemanticIndex:
+    """
+    Brute-force cosine index over sparse, L2-normalized vectors.
+
+    All items share flat (row, bucket, value) arrays, so scoring a query is
+    one gather, one multiply and one bincount over the stored features. This
+    stays in the low milliseconds for tens of thousands of items, which is
+    well beyond what a page renders. The arrays grow by doubling, so adding
+    items one at a time does not copy the whole index each time.
+    """
+
+    def __init__(self, ids=None, texts=None):
+        self.ids = []
+        self._rows = np.zeros(0, dtype=np.int32)
+        self._indices = np.zeros(0, dtype=np.int32)
+        self._values = np.zeros(0, dtype=np.float32)
+        self._nnz = 0
+        if ids:
+            self.add(ids, texts)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, ids, texts=None, vectors=None):
+        """Append items, given their texts or already embedded (indices, values) pairs."""
+        if not ids:
+            return
+        if vectors is None:
+            vectors = [embed_sparse(t) for t in texts]
+        need = self._nnz + sum(len(indices) for indices, _ in vectors)
+        if need > self._indices.shape[0]:
+            size = max(1024, need, self._indices.shape[0] * 2)
+            for name in ("_rows", "_indices", "_values"):
+                old = getattr(self, name)
+                grown = np.zeros(size, dtype=old.dtype)
+                grown[:self._nnz] = old[:self._nnz]
+                setattr(self, name, grown)
+        for row, (indices, values) in enumerate(vectors, start=len(self.ids)):
+            end = self._nnz + len(indices)
+            self._rows[self._nnz:end] = row
+            self._indices[self._nnz:end] = indices
+            self._values[self._nnz:end] = values
+            self._nnz = end
+        self.ids.extend(ids)
+
+    def similarities(self, query_text):
+        """Cosine similarity of the query to every indexed item (same order as ids)."""
+        if not self.ids:
+            return np.zeros(0, dtype=np.float32)
+        query = embed_text(query_text)
+        n = self._nnz
+        products = query[self._indices[:n]] * self._values[:n]
+        return np.bincount(self._rows[:n], weights=products, minlength=len(self.ids)).astype(np.float32)
+
+    def search(self, query_text, k=10, min_score=0.0):
+        """Return the top-k (id, score) pairs, best first (k=None for all)."""
+        scores = self.similarities(query_text)
+        if scores.size == 0:
+            return []
+        k = scores.size if k is None else min(k, scores.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.ids[i], float(scores[i])) for i in top if scores[i] > min_score]
+
+
+# ===== HELPERS USED BY THE DASHBOARDS =====
+def rank_jobs_for_profile(jobs, profile, k=None, min_score=0.0, skills_only=False):
+    """
+    Rank job dicts by semantic similarity to a profile.
+    Returns a list of (job, score) for the top-k jobs (all when k is None)
+    scoring above `min_score`, best first. With skills_only, only the job's
+    skills_required and the profile's skills are compared.
+    """
+    if not jobs:
+        return []
+    if skills_only:
+        texts = [j.get("skills_required") or "" for j in jobs]
+        query = profile[5] or ""
+    else:
+        texts = [job_text(j) for j in jobs]
+        query = profile_text(profile)
+    index = SemanticIndex()
+    index.add([j["id"] for j in jobs], vectors=[cached_embed(("job", j["id"]), t) for j, t in zip(jobs, texts)])
+    by_id = {j["id"]: j for j in jobs}
+    return [(by_id[job_id], score) for job_id, score in index.search(query, k=k, min_score=min_score)]
+
+
+def rank_profiles_for_job(job, profiles, min_score=0.0, skills_only=False):
+    """
+    Score profiles against a job in one pass.
+    `profiles` is a dict {user_id: profile_tuple}; returns [(user_id, score)] best first,
+    keeping only scores above `min_score`. With skills_only, only the profile's
+    skills and the job's skills_required are compared.
+    """
+    if not profiles:
+        return []
+    ids = list(profiles.keys())
+    if skills_only:
+        texts = [profiles[i][5] or "" for i in ids]
+        query = job.get("skills_required") or ""
+    else:
+        texts = [profile_text(profiles[i]) for i in ids]
+        query = job_text(job)
+    index = SemanticIndex()
+    index.add(ids, vectors=[cached_embed(("profile", i), t) for i, t in zip(ids, texts)])
+    return index.search(query, k=None, min_score=min_score)
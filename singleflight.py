@@ -0,0 +1,60 @@
+import hashlib
+import json
+import re
+import threading
+from concurrent.futures import Future
+
+
+def prompt_key(*parts, **params):
+    """
+    Hash a prompt (and any model/parameters) into a stable key.
+    Whitespace is collapsed so re-indented but otherwise identical prompts match.
+    """
+    normalized = [re.sub(r"\s+", " ", str(p)).strip() for p in parts]
+    payload = json.dumps([normalized, params], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls.
+
+    The first caller for a key runs the function; callers arriving while it is
+    still running wait on the same Future and receive the same result (or the
+    same exception). Nothing is kept once the call finishes, so this is not a
+    cache: a later call with the same key runs again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """Run fn() once per in-flight key. Returns (result, shared)."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+        return future.result(), False
+
+    def in_flight(self):
+        """Number of calls currently running."""
+        with self._lock:
+            return len(self._calls)
+
+
+# Process-wide group shared by all Streamlit sessions
+llm_calls = SingleFlight()
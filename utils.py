@@ -1,13 +1,33 @@
-from openai import OpenAI
 import os
 import json
 import streamlit as st
-import fitz  
-
-client = OpenAI(
-    api_key=st.secrets["GROQ_API_KEY"],
-    base_url="https://api.groq.com/openai/v1"
-)
+from pdf_extract import extract_pdf
+from singleflight import llm_calls, prompt_key
+from llm_metrics import track_llm_call
+from resources import get_groq_client
+
+GROQ_MODEL = "llama-3.1-8b-instant"
+
+def chat_completion(name, messages, **params):
+    """
+    Run a Groq chat completion and return the message text.
+    Identical requests already in flight (e.g. repeated autofill clicks) share one call.
+    Latency, token usage and client retries are recorded under `name` (see llm_metrics).
+    """
+    key = prompt_key(*(m["role"] + ":" + m["content"] for m in messages), model=GROQ_MODEL, **params)
+
+    with track_llm_call(name, GROQ_MODEL) as metrics:
+        def call():
+            raw = get_groq_client().chat.completions.with_raw_response.create(model=GROQ_MODEL, messages=messages, **params)
+            response = raw.parse()
+            metrics.retries = getattr(raw, "retries_taken", 0)
+            if response.usage:
+                metrics.add_usage(response.usage.prompt_tokens, response.usage.completion_tokens)
+            return response.choices[0].message.content.strip()
+
+        content, shared = llm_calls.do(key, call)
+        metrics.cache_hit = shared
+    return content
 
 def sanitize_text(text):
     """Clean text and replace common problematic symbols."""
@@ -28,17 +48,15 @@ def sanitize_text(text):
     return clean_text
 
 def extract_text_from_pdf(pdf_bytes):
-    """Extract text from uploaded PDF file bytes using PyMuPDF."""
+    """Extract text from uploaded PDF file bytes (page and size limited, see pdf_extract)."""
     try:
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        doc.close()
+        result = extract_pdf(pdf_bytes)
     except Exception as e:
         st.error(f"Failed to extract PDF text: {e}")
         return ""
-    return sanitize_text(text)
+    if result['truncated']:
+        st.warning(f"Only the first {result['pages']} of {result['total_pages']} pages were read.")
+    return sanitize_text(result['text'])
 
 def parse_resume_with_groq(resume_text):
     """Call Groq API to extract structured fields from resume text, including projects."""
@@ -85,15 +103,14 @@ Resume Text:
 \"\"\"
 """
     try:
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
+        content = chat_completion(
+            "parse_resume_with_groq",
+            [
                 {"role": "system", "content": "You extract structured data from resumes."},
                 {"role": "user", "content": prompt}
             ],
             temperature=0
         )
-        content = response.choices[0].message.content.strip()
 
         # Clean markdown formatting if present
         if content.startswith("```json"):
@@ -145,16 +162,15 @@ Resume:
 \"\"\"
 """
     try:
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
+        return chat_completion(
+            "get_resume_goodness_score",
+            [
                 {"role": "system", "content": "You give brief, helpful resume feedback."},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3,
             max_tokens=100
         )
-        return response.choices[0].message.content.strip()
     except Exception as e:
         return "Could not generate score at this time."
     
@@ -188,15 +204,14 @@ Resume excerpt: {resume_text[:2000] if resume_text else "Not provided"}
 Suggestions:
 """
     try:
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",
-            messages=[
+        return chat_completion(
+            "get_ai_career_suggestions",
+            [
                 {"role": "system", "content": "You provide concise career suggestions."},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3,
             max_tokens=200
         )
-        return response.choices[0].message.content.strip()
     except Exception as e:
         return f"Could not generate suggestions: {e}"